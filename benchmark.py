@@ -0,0 +1,100 @@
+"""Copyright 2024 - 2025 The excelize Authors. All rights reserved. Use of this
+source code is governed by a BSD-style license that can be found in the LICENSE
+file.
+
+Package excelize-py is a Python port of Go Excelize library, providing a set of
+functions that allow you to write and read from XLAM / XLSM / XLSX / XLTM / XLTX
+files. Supports reading and writing spreadsheet documents generated by Microsoft
+Excel™ 2007 and later. Supports complex components by high compatibility, and
+provided streaming API for generating or reading data from a worksheet with huge
+amounts of data. This library needs Python version 3.9 or later.
+
+Microbenchmark of the per-call overhead of the library functions, build the
+library in the current directory and run:
+
+    python benchmark.py [number]
+
+The calls are measured with the prototypes declared once at import, and with
+the functions called as before the prototypes were declared: without the
+argument types, and with the result type assigned on each call.
+
+Benchmark of the stream writing of a frame of float64 columns, row by row with
+the 'set_row' function and by columns with the 'write_columns' function, run:
+
+    python benchmark.py stream [rows] [columns]
+"""
+
+import sys
+import time
+import timeit
+from array import array
+from ctypes import CDLL
+import excelize
+
+
+class PerCallPrototypes:
+    """
+    PerCallPrototypes wraps a second instance of the library, of which the
+    functions have no argument types declared, and assigns the result type of
+    the function on each call, as the functions did before the prototypes were
+    declared once at import.
+    """
+
+    def __init__(self, lib: CDLL):
+        self.lib = CDLL(lib._name)
+
+    def __getattr__(self, name: str):
+        func = getattr(self.lib, name)
+        func.restype = excelize.prototypes[name][0]
+        return func
+
+
+def bench(number: int) -> None:
+    f = excelize.new_file()
+    cases = {
+        "set_cell_value": lambda: f.set_cell_value("Sheet1", "A1", 100),
+        "get_cell_value": lambda: f.get_cell_value("Sheet1", "A1"),
+    }
+    lib = excelize.lib
+    for name, fn in cases.items():
+        results = []
+        for mode in (PerCallPrototypes(lib), lib):
+            excelize.lib = mode
+            seconds = min(timeit.repeat(fn, number=number, repeat=5))
+            results.append(seconds / number * 1e6)
+        excelize.lib = lib
+        print(
+            f"{name}: {results[0]:.2f} us/call before, {results[1]:.2f} us/call after"
+        )
+    f.close()
+
+
+def bench_stream(rows: int, cols: int) -> None:
+    columns = [array("d", range(c, c + rows)) for c in range(cols)]
+
+    def row_loop(sw: excelize.StreamWriter) -> None:
+        for r, row in enumerate(zip(*columns), 1):
+            sw.set_row(f"A{r}", list(row))
+
+    def write_columns(sw: excelize.StreamWriter) -> None:
+        sw.write_columns("A1", columns)
+
+    for name, fn in (("set_row loop", row_loop), ("write_columns", write_columns)):
+        f = excelize.new_file()
+        sw = f.new_stream_writer("Sheet1")
+        start = time.perf_counter()
+        fn(sw)
+        sw.flush()
+        seconds = time.perf_counter() - start
+        f.close()
+        print(f"{name}: {seconds:.2f} s for {rows} rows x {cols} columns")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "stream":
+        bench_stream(
+            int(sys.argv[2]) if len(sys.argv) > 2 else 1000000,
+            int(sys.argv[3]) if len(sys.argv) > 3 else 20,
+        )
+    else:
+        bench(int(sys.argv[1]) if len(sys.argv) > 1 else 100000)
@@ -10,25 +10,56 @@ provided streaming API for generating or reading data from a worksheet with huge
 amounts of data. This library needs Python version 3.9 or later.
 """
 
+from array import array
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import fields
-from datetime import datetime, date, time
+from datetime import datetime, date, timedelta
+from decimal import Decimal
 from enum import Enum
-from typing import Tuple, get_args, get_origin, List, Optional, Union
+from functools import partial
+from io import BytesIO
+from itertools import islice
+from mmap import mmap
+from multiprocessing import get_context
+from weakref import finalize
+from typing import (
+    AsyncIterator,
+    BinaryIO,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Tuple,
+    get_args,
+    get_origin,
+    List,
+    Optional,
+    Union,
+)
 from ctypes import (
+    addressof,
     byref,
     c_bool,
     c_char_p,
     c_char,
     c_double,
     c_int,
+    c_int64,
+    c_longlong,
     c_ubyte,
+    c_ssize_t,
+    c_void_p,
     cast,
     CDLL,
     create_string_buffer,
+    memmove,
     POINTER,
     pointer,
+    sizeof,
     string_at,
 )
+import asyncio
 import os
 import platform
 import sys
@@ -88,8 +119,340 @@ def load_lib() -> Optional[str]:
 
 lib = CDLL(os.path.join(os.path.dirname(__file__), load_lib()))
 ENCODE = "utf-8"
+# EXCEL_EPOCH is the day 0 of the Excel serial numbers in the 1900 date system.
+EXCEL_EPOCH = datetime(1899, 12, 30)
 __version__ = "0.0.3"
 uppercase_words = ["id", "rgb", "sq", "xml"]
+# async_executor is the shared thread pool of the AsyncFile objects.
+async_executor: Optional[ThreadPoolExecutor] = None
+c_to_py_converters, py_to_c_converters = {}, {}
+# The result and argument types of the functions exported by the library,
+# declared once when the module is imported, so calls skip the per-call
+# restype assignment and ctypes converts the arguments without guessing.
+prototypes = {
+    "AddChart": (
+        c_void_p,
+        [c_ssize_t, c_char_p, c_char_p, POINTER(types_go._Chart), c_ssize_t],
+    ),
+    "AddChartSheet": (
+        c_void_p,
+        [c_ssize_t, c_char_p, POINTER(types_go._Chart), c_ssize_t],
+    ),
+    "AddComment": (c_void_p, [c_ssize_t, c_char_p, POINTER(types_go._Comment)]),
+    "AddFormControl": (c_void_p, [c_ssize_t, c_char_p, POINTER(types_go._FormControl)]),
+    "AddPicture": (
+        c_void_p,
+        [c_ssize_t, c_char_p, c_char_p, c_char_p, POINTER(types_go._GraphicOptions)],
+    ),
+    "AddPictureFromBytes": (
+        c_void_p,
+        [c_ssize_t, c_char_p, c_char_p, POINTER(types_go._Picture)],
+    ),
+    "AddPivotTable": (c_void_p, [c_ssize_t, POINTER(types_go._PivotTableOptions)]),
+    "AddShape": (c_void_p, [c_ssize_t, c_char_p, POINTER(types_go._Shape)]),
+    "AddSlicer": (c_void_p, [c_ssize_t, c_char_p, POINTER(types_go._SlicerOptions)]),
+    "AddSparkline": (
+        c_void_p,
+        [c_ssize_t, c_char_p, POINTER(types_go._SparklineOptions)],
+    ),
+    "AddTable": (c_void_p, [c_ssize_t, c_char_p, POINTER(types_go._Table)]),
+    "AddVBAProject": (c_void_p, [c_ssize_t, POINTER(c_ubyte), c_int]),
+    "AutoFilter": (
+        c_void_p,
+        [
+            c_ssize_t,
+            c_char_p,
+            c_char_p,
+            POINTER(types_go._AutoFilterOptions),
+            c_ssize_t,
+        ],
+    ),
+    "CalcCellValue": (
+        types_go._StringErrorResult,
+        [c_ssize_t, c_char_p, c_char_p, POINTER(types_go._Options)],
+    ),
+    "CalcCellValues": (
+        types_go._CalcCellValuesResult,
+        [
+            c_ssize_t,
+            c_char_p,
+            c_char_p,
+            POINTER(c_char_p),
+            c_ssize_t,
+            c_ssize_t,
+            POINTER(types_go._Options),
+        ],
+    ),
+    "CellNameToCoordinates": (types_go._CellNameToCoordinatesResult, [c_char_p]),
+    "Close": (c_void_p, [c_ssize_t]),
+    "Cols": (
+        types_go._IntErrorResult,
+        [c_ssize_t, c_char_p, c_char_p, POINTER(types_go._Options)],
+    ),
+    "ColsClose": (c_void_p, [c_ssize_t]),
+    "ColsNext": (types_go._GetRowsResult, [c_ssize_t, c_ssize_t]),
+    "ColumnNameToNumber": (types_go._IntErrorResult, [c_char_p]),
+    "ColumnNumberToName": (types_go._StringErrorResult, [c_ssize_t]),
+    "CoordinatesToCellName": (
+        types_go._StringErrorResult,
+        [c_ssize_t, c_ssize_t, c_bool],
+    ),
+    "CopySheet": (c_void_p, [c_ssize_t, c_ssize_t, c_ssize_t]),
+    "DeleteChart": (c_void_p, [c_ssize_t, c_char_p, c_char_p]),
+    "DeleteComment": (c_void_p, [c_ssize_t, c_char_p, c_char_p]),
+    "DeleteDefinedName": (c_void_p, [c_ssize_t, POINTER(types_go._DefinedName)]),
+    "DeletePicture": (c_void_p, [c_ssize_t, c_char_p, c_char_p]),
+    "DeleteSheet": (c_void_p, [c_ssize_t, c_char_p]),
+    "DeleteSlicer": (c_void_p, [c_ssize_t, c_char_p]),
+    "DuplicateRow": (c_void_p, [c_ssize_t, c_char_p, c_ssize_t]),
+    "DuplicateRowTo": (c_void_p, [c_ssize_t, c_char_p, c_ssize_t, c_ssize_t]),
+    "FreeCString": (None, [c_void_p]),
+    "FreeCValue": (None, [c_char_p, c_void_p]),
+    "GetActiveSheetIndex": (c_ssize_t, [c_ssize_t]),
+    "GetAllRows": (
+        types_go._GetAllRowsResult,
+        [
+            c_ssize_t,
+            POINTER(c_char_p),
+            c_ssize_t,
+            c_ssize_t,
+            POINTER(types_go._Options),
+        ],
+    ),
+    "GetAppProps": (types_go._GetAppPropsResult, [c_ssize_t]),
+    "GetCellFormula": (types_go._StringErrorResult, [c_ssize_t, c_char_p, c_char_p]),
+    "GetCellHyperLink": (
+        types_go._GetCellHyperLinkResult,
+        [c_ssize_t, c_char_p, c_char_p],
+    ),
+    "GetCellRichText": (
+        types_go._GetCellRichTextResult,
+        [c_ssize_t, c_char_p, c_char_p],
+    ),
+    "GetCellStyle": (types_go._IntErrorResult, [c_ssize_t, c_char_p, c_char_p]),
+    "GetCellValue": (
+        types_go._StringErrorResult,
+        [c_ssize_t, c_char_p, c_char_p, POINTER(types_go._Options)],
+    ),
+    "GetCellValues": (
+        types_go._GetCellValuesResult,
+        [
+            c_ssize_t,
+            c_char_p,
+            c_char_p,
+            POINTER(c_char_p),
+            c_ssize_t,
+            c_bool,
+            POINTER(types_go._Options),
+        ],
+    ),
+    "GetColumnBuffers": (
+        types_go._GetColumnBuffersResult,
+        [
+            c_ssize_t,
+            c_char_p,
+            c_char_p,
+            c_bool,
+            POINTER(types_go._Options),
+            POINTER(types_go._ColumnBuffer),
+            c_ssize_t,
+        ],
+    ),
+    "GetColOutlineLevel": (types_go._IntErrorResult, [c_ssize_t, c_char_p, c_char_p]),
+    "GetColStyle": (types_go._IntErrorResult, [c_ssize_t, c_char_p, c_char_p]),
+    "GetColVisible": (types_go._BoolErrorResult, [c_ssize_t, c_char_p, c_char_p]),
+    "GetColWidth": (types_go._Float64ErrorResult, [c_ssize_t, c_char_p, c_char_p]),
+    "GetCols": (
+        types_go._GetRowsResult,
+        [c_ssize_t, c_char_p, POINTER(types_go._Options)],
+    ),
+    "GetDefaultFont": (types_go._StringErrorResult, [c_ssize_t]),
+    "GetDictRows": (
+        types_go._GetDictRowsResult,
+        [c_ssize_t, c_char_p, POINTER(types_go._Options)],
+    ),
+    "GetHandleCounts": (types_go._HandleCounts, []),
+    "GetRowVisible": (types_go._BoolErrorResult, [c_ssize_t, c_char_p, c_ssize_t]),
+    "GetRows": (
+        types_go._GetRowsResult,
+        [c_ssize_t, c_char_p, POINTER(types_go._Options)],
+    ),
+    "GetSheetDimension": (types_go._StringErrorResult, [c_ssize_t, c_char_p]),
+    "GetSheetIndex": (types_go._IntErrorResult, [c_ssize_t, c_char_p]),
+    "GetSheetName": (types_go._StringErrorResult, [c_ssize_t, c_ssize_t]),
+    "GetStyle": (types_go._GetStyleResult, [c_ssize_t, c_ssize_t]),
+    "GetTables": (types_go._GetTablesResult, [c_ssize_t, c_char_p]),
+    "GetTypedRows": (
+        types_go._GetTypedRowsResult,
+        [c_ssize_t, c_char_p, POINTER(types_go._Options), c_bool],
+    ),
+    "GetWorkbookProps": (types_go._GetWorkbookPropsResult, [c_ssize_t]),
+    "GroupSheets": (c_void_p, [c_ssize_t, POINTER(c_char_p), c_ssize_t]),
+    "InsertCols": (c_void_p, [c_ssize_t, c_char_p, c_char_p, c_ssize_t]),
+    "InsertPageBreak": (c_void_p, [c_ssize_t, c_char_p, c_char_p]),
+    "InsertRows": (c_void_p, [c_ssize_t, c_char_p, c_ssize_t, c_ssize_t]),
+    "MergeCell": (c_void_p, [c_ssize_t, c_char_p, c_char_p, c_char_p]),
+    "MoveSheet": (c_void_p, [c_ssize_t, c_char_p, c_char_p]),
+    "NewConditionalStyle": (
+        types_go._IntErrorResult,
+        [c_ssize_t, POINTER(types_go._Style)],
+    ),
+    "NewFile": (c_ssize_t, []),
+    "NewSheet": (types_go._IntErrorResult, [c_ssize_t, c_char_p]),
+    "NewStreamWriter": (types_go._IntErrorResult, [c_ssize_t, c_char_p]),
+    "NewStyle": (types_go._IntErrorResult, [c_ssize_t, POINTER(types_go._Style)]),
+    "OpenFile": (types_go._IntErrorResult, [c_char_p, POINTER(types_go._Options)]),
+    "OpenReader": (
+        types_go._IntErrorResult,
+        [POINTER(c_ubyte), c_longlong, POINTER(types_go._Options)],
+    ),
+    "OpenStream": (
+        types_go._IntErrorResult,
+        [types_go._Reader, POINTER(types_go._Options)],
+    ),
+    "ProtectSheet": (
+        c_void_p,
+        [c_ssize_t, c_char_p, POINTER(types_go._SheetProtectionOptions)],
+    ),
+    "ProtectWorkbook": (
+        c_void_p,
+        [c_ssize_t, POINTER(types_go._WorkbookProtectionOptions)],
+    ),
+    "RemoveCol": (c_void_p, [c_ssize_t, c_char_p, c_char_p]),
+    "RemovePageBreak": (c_void_p, [c_ssize_t, c_char_p, c_char_p]),
+    "RemoveRow": (c_void_p, [c_ssize_t, c_char_p, c_ssize_t]),
+    "Rows": (
+        types_go._IntErrorResult,
+        [c_ssize_t, c_char_p, POINTER(types_go._Options)],
+    ),
+    "RowsClose": (c_void_p, [c_ssize_t]),
+    "RowsNext": (types_go._GetRowsResult, [c_ssize_t, c_ssize_t]),
+    "Save": (c_void_p, [c_ssize_t, POINTER(types_go._Options)]),
+    "SaveAs": (c_void_p, [c_ssize_t, c_char_p, POINTER(types_go._Options)]),
+    "SearchSheet": (
+        types_go._GetRowsResult,
+        [c_ssize_t, c_char_p, c_char_p, c_bool],
+    ),
+    "SetActiveSheet": (c_void_p, [c_ssize_t, c_ssize_t]),
+    "SetCellBool": (c_void_p, [c_ssize_t, c_char_p, c_char_p, c_bool]),
+    "SetCellFormula": (
+        c_void_p,
+        [c_ssize_t, c_char_p, c_char_p, c_char_p, POINTER(types_go._FormulaOpts)],
+    ),
+    "SetCellHyperLink": (
+        c_void_p,
+        [
+            c_ssize_t,
+            c_char_p,
+            c_char_p,
+            c_char_p,
+            c_char_p,
+            POINTER(types_go._HyperlinkOpts),
+        ],
+    ),
+    "SetCellInt": (c_void_p, [c_ssize_t, c_char_p, c_char_p, c_int64]),
+    "SetCellRichText": (
+        c_void_p,
+        [c_ssize_t, c_char_p, c_char_p, POINTER(types_go._RichTextRun), c_ssize_t],
+    ),
+    "SetCellStr": (c_void_p, [c_ssize_t, c_char_p, c_char_p, c_char_p]),
+    "SetCellStyle": (c_void_p, [c_ssize_t, c_char_p, c_char_p, c_char_p, c_ssize_t]),
+    "SetCellValue": (
+        c_void_p,
+        [c_ssize_t, c_char_p, c_char_p, POINTER(types_go._Interface)],
+    ),
+    "SetCells": (
+        c_void_p,
+        [c_ssize_t, c_char_p, POINTER(types_go._CellValue), c_ssize_t],
+    ),
+    "SetColOutlineLevel": (c_void_p, [c_ssize_t, c_char_p, c_char_p, c_ssize_t]),
+    "SetColStyle": (c_void_p, [c_ssize_t, c_char_p, c_char_p, c_ssize_t]),
+    "SetColVisible": (c_void_p, [c_ssize_t, c_char_p, c_char_p, c_bool]),
+    "SetColWidth": (c_void_p, [c_ssize_t, c_char_p, c_char_p, c_char_p, c_double]),
+    "SetConditionalFormat": (
+        c_void_p,
+        [
+            c_ssize_t,
+            c_char_p,
+            c_char_p,
+            POINTER(types_go._ConditionalFormatOptions),
+            c_ssize_t,
+        ],
+    ),
+    "SetDefaultFont": (c_void_p, [c_ssize_t, c_char_p]),
+    "SetDefinedName": (c_void_p, [c_ssize_t, POINTER(types_go._DefinedName)]),
+    "SetDocProps": (c_void_p, [c_ssize_t, POINTER(types_go._DocProperties)]),
+    "SetHeaderFooter": (
+        c_void_p,
+        [c_ssize_t, c_char_p, POINTER(types_go._HeaderFooterOptions)],
+    ),
+    "SetPageLayout": (
+        c_void_p,
+        [c_ssize_t, c_char_p, POINTER(types_go._PageLayoutOptions)],
+    ),
+    "SetPageMargins": (
+        c_void_p,
+        [c_ssize_t, c_char_p, POINTER(types_go._PageLayoutMarginsOptions)],
+    ),
+    "SetPanes": (c_void_p, [c_ssize_t, c_char_p, POINTER(types_go._Panes)]),
+    "SetRowHeight": (c_void_p, [c_ssize_t, c_char_p, c_ssize_t, c_double]),
+    "SetRowOutlineLevel": (c_void_p, [c_ssize_t, c_char_p, c_ssize_t, c_ssize_t]),
+    "SetRowStyle": (c_void_p, [c_ssize_t, c_char_p, c_ssize_t, c_ssize_t, c_ssize_t]),
+    "SetRowVisible": (c_void_p, [c_ssize_t, c_char_p, c_ssize_t, c_bool]),
+    "SetSheetBackground": (c_void_p, [c_ssize_t, c_char_p, c_char_p]),
+    "SetSheetBackgroundFromBytes": (
+        c_void_p,
+        [c_ssize_t, c_char_p, c_char_p, POINTER(c_ubyte), c_int],
+    ),
+    "SetSheetCol": (
+        c_void_p,
+        [c_ssize_t, c_char_p, c_char_p, POINTER(types_go._Interface), c_ssize_t],
+    ),
+    "SetSheetDimension": (c_void_p, [c_ssize_t, c_char_p, c_char_p]),
+    "SetSheetName": (c_void_p, [c_ssize_t, c_char_p, c_char_p]),
+    "SetSheetProps": (
+        c_void_p,
+        [c_ssize_t, c_char_p, POINTER(types_go._SheetPropsOptions)],
+    ),
+    "SetSheetRow": (
+        c_void_p,
+        [c_ssize_t, c_char_p, c_char_p, POINTER(types_go._Interface), c_ssize_t],
+    ),
+    "SetSheetView": (
+        c_void_p,
+        [c_ssize_t, c_char_p, c_ssize_t, POINTER(types_go._ViewOptions)],
+    ),
+    "SetSheetVisible": (c_void_p, [c_ssize_t, c_char_p, c_bool, c_bool]),
+    "SetWorkbookProps": (
+        c_void_p,
+        [c_ssize_t, POINTER(types_go._WorkbookPropsOptions)],
+    ),
+    "StreamAddTable": (c_void_p, [c_ssize_t, POINTER(types_go._Table)]),
+    "StreamFlush": (c_void_p, [c_ssize_t]),
+    "StreamInsertPageBreak": (c_void_p, [c_ssize_t, c_char_p]),
+    "StreamMergeCell": (c_void_p, [c_ssize_t, c_char_p, c_char_p]),
+    "StreamSetColWidth": (c_void_p, [c_ssize_t, c_ssize_t, c_ssize_t, c_double]),
+    "StreamSetColumns": (
+        c_void_p,
+        [c_ssize_t, c_char_p, POINTER(types_go._Column), c_ssize_t, c_ssize_t],
+    ),
+    "StreamSetPanes": (c_void_p, [c_ssize_t, POINTER(types_go._Panes)]),
+    "StreamSetRow": (
+        c_void_p,
+        [c_ssize_t, c_char_p, POINTER(types_go._Interface), c_ssize_t],
+    ),
+    "StreamSetRows": (
+        c_void_p,
+        [c_ssize_t, c_char_p, POINTER(types_go._Interface), POINTER(c_int), c_ssize_t],
+    ),
+    "UngroupSheets": (c_void_p, [c_ssize_t]),
+    "UnmergeCell": (c_void_p, [c_ssize_t, c_char_p, c_char_p, c_char_p]),
+    "UpdateLinkedValue": (c_void_p, [c_ssize_t]),
+    "WriteTo": (c_void_p, [c_ssize_t, types_go._Writer, POINTER(types_go._Options)]),
+}
+for name, (restype, argtypes) in prototypes.items():
+    func = getattr(lib, name)
+    func.restype, func.argtypes = restype, argtypes
 
 
 def py_to_base_ctype(py_value, c_type):
@@ -137,21 +500,22 @@ def snake_to_pascal(snake_str: str) -> str:
     )
 
 
-def c_value_to_py(ctypes_instance, py_instance):
+def compile_c_value_to_py(c_type, py_type) -> Callable:
     """
-    Convert a ctypes instance to a Python instance by mapping fields from the
-    to the corresponding fields in the Python instance.
+    Compile the converter function for converting the given ctypes structure
+    to the given Python dataclass. The fields of both types are inspected only
+    once, and the returned function only performs the conversion.
 
     Args:
-        ctypes_instance: The ctypes instance representing the Go data structure.
-        py_instance: The Python instance to populate with data from the ctypes instance.
+        c_type: The ctypes structure type representing the Go data structure.
+        py_type: The Python dataclass type.
 
     Returns:
-        The populated Python instance, or None if the ctypes instance is None.
+        Callable: The converter function accepts the ctypes instance and the
+        Python instance, and returns the populated Python instance.
     """
-    if ctypes_instance is None:
-        return None
-    for py_field in fields(py_instance):
+    setters = []
+    for py_field in fields(py_type):
         py_field_name = py_field.name
         c_field_name = snake_to_pascal(py_field.name)
         # The Go base type
@@ -159,104 +523,107 @@ def c_value_to_py(ctypes_instance, py_instance):
 
         if type(None) not in py_field_args:
             if is_py_primitive_type(py_field.type):
-                c_val = getattr(ctypes_instance, c_field_name)
-                if c_val:
-                    setattr(
-                        py_instance,
-                        py_field_name,
-                        (c_val.decode(ENCODE) if str is py_field.type else c_val),
-                    )
-                    continue
+
+                def setter(ct, py, n=py_field_name, c=c_field_name, s=py_field.type):
+                    c_val = getattr(ct, c)
+                    if c_val:
+                        setattr(py, n, c_val.decode(ENCODE) if str is s else c_val)
+
             else:
                 # The Go struct, for example: excelize.Options, convert sub fields recursively
-                setattr(
-                    py_instance,
-                    py_field_name,
-                    c_value_to_py(
-                        getattr(ctypes_instance, c_field_name), py_field.type()
-                    ),
-                )
+                def setter(ct, py, n=py_field_name, c=c_field_name, t=py_field.type):
+                    setattr(py, n, c_value_to_py(getattr(ct, c), t()))
+
+        elif get_origin(py_field_args[0]) is not list:
+            # Pointer of the Go data type, for example: *excelize.Options or *string
+            if any(is_py_primitive_type(arg) for arg in py_field_args):
+                # Pointer of the Go basic data type, for example: *string
+                def setter(ct, py, n=py_field_name, c=c_field_name, s=py_field_args):
+                    value = getattr(ct, c)
+                    if value:
+                        value = value.contents.value
+                        setattr(py, n, value.decode(ENCODE) if str in s else value)
+
+            else:
+                # Pointer of the Go struct, for example: *excelize.Options
+                def setter(ct, py, n=py_field_name, c=c_field_name, t=py_field_args[0]):
+                    value = getattr(ct, c)
+                    if value:
+                        setattr(py, n, c_value_to_py(value.contents, t()))
+
         else:
-            if get_origin(py_field_args[0]) is not list:
-                # Pointer of the Go data type, for example: *excelize.Options or *string
-                value = getattr(ctypes_instance, c_field_name)
-                if value:
-                    if any(is_py_primitive_type(arg) for arg in py_field_args):
-                        # Pointer of the Go basic data type, for example: *string
-                        setattr(
-                            py_instance,
-                            py_field_name,
-                            (
-                                value.contents.value.decode(ENCODE)
-                                if str in py_field_args
-                                else value.contents.value
-                            ),
+            # The Go data type array, for example:
+            # []*excelize.Options, []excelize.Options, []string, []*string
+            ele_type = get_args(py_field_args[0])[0]
+            if type(None) not in get_args(ele_type):
+                # The Go data type array, for example: []excelize.Options or []string
+                if is_py_primitive_type(ele_type):
+                    # The Go basic data type array, for example: []string
+                    if str is ele_type:
+                        get_ele = lambda c_array, i: string_at(c_array[i]).decode(
+                            ENCODE
                         )
                     else:
-                        # Pointer of the Go struct, for example: *excelize.Options
-                        setattr(
-                            py_instance,
-                            py_field_name,
-                            c_value_to_py(
-                                value.contents,
-                                py_field_args[0](),
-                            ),
-                        )
+                        get_ele = lambda c_array, i: c_array[i]
+                else:
+                    # The Go struct array, for example: []excelize.Options
+                    get_ele = lambda c_array, i, t=ele_type: c_value_to_py(
+                        c_array[i], t()
+                    )
             else:
-                # The Go data type array, for example:
-                # []*excelize.Options, []excelize.Options, []string, []*string
-                if type(None) not in get_args(get_args(py_field_args[0])[0]):
-                    # The Go data type array, for example: []excelize.Options or []string
-                    py_list = []
-                    l = getattr(ctypes_instance, c_field_name + "Len")
-                    c_array = getattr(ctypes_instance, c_field_name)
-                    if c_array:
-                        if is_py_primitive_type(get_args(py_field_args[0])[0]):
-                            # The Go basic data type array, for example: []string
-                            for i in range(l):
-                                py_list.append(
-                                    string_at(c_array[i]).decode(ENCODE)
-                                    if str is get_args(py_field_args[0])[0]
-                                    else c_array[i]
-                                )
-                        else:
-                            # The Go struct array, for example: []excelize.Options
-                            for i in range(l):
-                                py_list.append(
-                                    c_value_to_py(
-                                        c_array[i],
-                                        get_args(py_field_args[0])[0](),
-                                    ),
-                                )
-                        setattr(py_instance, py_field_name, py_list)
+                # Pointer array of the Go data type, for example:
+                # []*excelize.Options or []*string
+                ele_type = get_args(ele_type)[0]
+                if is_py_primitive_type(ele_type):
+                    # Pointer array of the Go basic data type, for example: []*string
+                    if str is ele_type:
+                        get_ele = lambda c_array, i: string_at(c_array[i]).decode(
+                            ENCODE
+                        )
+                    else:
+                        get_ele = lambda c_array, i: c_array[i].contents.value
                 else:
-                    # Pointer array of the Go data type, for example:
-                    # []*excelize.Options or []*string
-                    py_list = []
-                    l = getattr(ctypes_instance, c_field_name + "Len")
-                    c_array = getattr(ctypes_instance, c_field_name)
-                    if c_array:
-                        if is_py_primitive_type(
-                            get_args(get_args(py_field_args[0])[0])[0]
-                        ):
-                            # Pointer array of the Go basic data type, for example: []*string
-                            for i in range(l):
-                                py_list.append(
-                                    string_at(c_array[i]).decode(ENCODE)
-                                    if str is get_args(get_args(py_field_args[0])[0])[0]
-                                    else c_array[i].contents.value
-                                )
-                        else:
-                            #  Pointer array of the Go struct, for example: []*excelize.Options
-                            for i in range(l):
-                                py_list.append(
-                                    c_value_to_py(
-                                        c_array[i].contents,
-                                        get_args(get_args(py_field_args[0])[0])[0](),
-                                    ),
-                                )
-                        setattr(py_instance, py_field_name, py_list)
-    return py_instance
+                    #  Pointer array of the Go struct, for example: []*excelize.Options
+                    get_ele = lambda c_array, i, t=ele_type: c_value_to_py(
+                        c_array[i].contents, t()
+                    )
+
+            def setter(ct, py, n=py_field_name, c=c_field_name, get_ele=get_ele):
+                c_array = getattr(ct, c)
+                if c_array:
+                    l = getattr(ct, c + "Len")
+                    setattr(py, n, [get_ele(c_array, i) for i in range(l)])
+
+        setters.append(setter)
+
+    def converter(ctypes_instance, py_instance):
+        for setter in setters:
+            setter(ctypes_instance, py_instance)
+        return py_instance
+
+    return converter
+
+
+def c_value_to_py(ctypes_instance, py_instance):
+    """
+    Convert a ctypes instance to a Python instance by mapping fields from the
+    to the corresponding fields in the Python instance. The converter function
+    for each pair of the types is compiled once and cached.
+
+    Args:
+        ctypes_instance: The ctypes instance representing the Go data structure.
+        py_instance: The Python instance to populate with data from the ctypes instance.
+
+    Returns:
+        The populated Python instance, or None if the ctypes instance is None.
+    """
+    if ctypes_instance is None:
+        return None
+    key = (type(ctypes_instance), type(py_instance))
+    converter = c_to_py_converters.get(key)
+    if converter is None:
+        converter = c_to_py_converters[key] = compile_c_value_to_py(*key)
+    return converter(ctypes_instance, py_instance)
 
 
 def get_c_field_type(struct, field_name):
@@ -275,189 +642,566 @@ def get_c_field_type(struct, field_name):
             return field[1]
 
 
-def py_value_to_c(py_instance, ctypes_instance):
+def compile_py_value_to_c(py_type, c_type) -> Callable:
     """
-    Converts a Python instance to a corresponding C instance using ctypes.
-
-    This function recursively converts fields of a Python instance to their
-    corresponding C types and assigns them to the provided ctypes instance.
-    It handles primitive types, structs, pointers, and arrays.
+    Compile the converter function for converting the given Python dataclass
+    to the given ctypes structure. The fields of both types are inspected only
+    once, and the returned function only performs the conversion.
 
     Args:
-        py_instance (object): The Python instance to be converted.
-        ctypes_instance (ctypes.Structure): The ctypes instance to which the
-            converted values will be assigned.
+        py_type: The Python dataclass type.
+        c_type: The ctypes structure type representing the Go data structure.
 
     Returns:
-        ctypes.Structure: The ctypes instance with the converted values from
-            the Python instance.
+        Callable: The converter function accepts the Python instance and the
+        ctypes instance, and returns the ctypes instance with the converted
+        values.
     """
-    if py_instance is None:
-        return None
-    for py_field in fields(py_instance):
+    setters = []
+    for py_field in fields(py_type):
         py_field_name = py_field.name
         c_field_name = snake_to_pascal(py_field.name)
+        c_field_type = get_c_field_type(c_type, c_field_name)
         # The Go base type
         py_field_args = get_args(py_field.type)
 
         if type(None) not in py_field_args:
             if is_py_primitive_type(py_field.type):
-                if hasattr(py_instance, py_field_name):
-                    c_type = get_c_field_type(ctypes_instance, c_field_name)
-                    setattr(
-                        ctypes_instance,
-                        c_field_name,
-                        py_to_base_ctype(getattr(py_instance, py_field_name), c_type),
-                    )
-                    continue
+
+                def setter(py, ct, n=py_field_name, c=c_field_name, t=c_field_type):
+                    setattr(ct, c, py_to_base_ctype(getattr(py, n), t))
+
             else:
                 # The Go struct, for example: excelize.Options, convert sub fields recursively
-                c_type = get_c_field_type(ctypes_instance, c_field_name)
-                if hasattr(py_instance, py_field_name):
-                    setattr(
-                        ctypes_instance,
-                        c_field_name,
-                        py_value_to_c(getattr(py_instance, py_field_name), c_type()),
-                    )
-        else:
-            arg_type = py_field_args[0]
-            if get_origin(arg_type) is not list and arg_type is not bytes:
-                # Pointer of the Go data type, for example: *excelize.Options or *string
-                value = getattr(py_instance, py_field_name)
-                c_type = getattr(
-                    get_c_field_type(ctypes_instance, c_field_name), "_type_", None
-                )
-                if value is not None:
-                    if any(is_py_primitive_type(arg) for arg in py_field_args):
-                        # Pointer of the Go basic data type, for example: *string
-                        setattr(
-                            ctypes_instance,
-                            c_field_name,
-                            pointer(py_to_base_ctype(value, c_type)),
-                        )
-                    else:
-                        # Pointer of the Go struct, for example: *excelize.Options
-                        setattr(
-                            ctypes_instance,
-                            c_field_name,
-                            pointer(py_value_to_c(value, c_type())),
-                        )
+                def setter(py, ct, n=py_field_name, c=c_field_name, t=c_field_type):
+                    setattr(ct, c, py_value_to_c(getattr(py, n), t()))
+
+            setters.append(setter)
+            continue
+        arg_type = py_field_args[0]
+        if get_origin(arg_type) is not list and arg_type is not bytes:
+            # Pointer of the Go data type, for example: *excelize.Options or *string
+            c_ptr_type = getattr(c_field_type, "_type_", None)
+            if any(is_py_primitive_type(arg) for arg in py_field_args):
+                # Pointer of the Go basic data type, for example: *string
+                def setter(py, ct, n=py_field_name, c=c_field_name, t=c_ptr_type):
+                    value = getattr(py, n)
+                    if value is not None:
+                        setattr(ct, c, pointer(py_to_base_ctype(value, t)))
+
             else:
-                # The Go data type array, for example:
-                # []*excelize.Options, []excelize.Options, []string, []*string
-                if arg_type is bytes:  # []byte
-                    c_type = getattr(
-                        get_c_field_type(ctypes_instance, c_field_name), "_type_", None
-                    )
-                    value = getattr(py_instance, py_field_name)
+                # Pointer of the Go struct, for example: *excelize.Options
+                def setter(py, ct, n=py_field_name, c=c_field_name, t=c_ptr_type):
+                    value = getattr(py, n)
                     if value is not None:
-                        setattr(
-                            ctypes_instance, c_field_name, cast(value, POINTER(c_ubyte))
-                        )
-                        setattr(
-                            ctypes_instance, c_field_name + "Len", c_int(len(value))
-                        )
-                    continue
-                py_field_type = get_args(arg_type)[0]
-                if type(None) not in get_args(py_field_type):
-                    # The Go data type array, for example: []excelize.Options or []string
-                    c_type = getattr(
-                        get_c_field_type(ctypes_instance, c_field_name), "_type_", None
-                    )
-                    py_list = getattr(py_instance, py_field_name)
-                    if py_list:
-                        l = len(py_list)
-                        c_array = (c_type * l)()
-                        if is_py_primitive_type(py_field_type):
-                            # The Go basic data type array, for example: []string
-                            if str is py_field_type:
-                                c_array_type = POINTER(c_char) * l
-                                setattr(
-                                    ctypes_instance,
-                                    c_field_name,
-                                    c_array_type(
-                                        *[
-                                            create_string_buffer(c.encode(ENCODE))
-                                            for c in py_list
-                                        ]
-                                    ),
-                                )
-                            else:
-                                for i in range(l):
-                                    c_array[i] = py_to_base_ctype(py_list[i], c_type)
-                                setattr(ctypes_instance, c_field_name, c_array)
-                        else:
-                            # The Go struct array, for example: []excelize.Options
-                            for i in range(l):
-                                c_array[i] = py_value_to_c(py_list[i], c_type())
-                            setattr(ctypes_instance, c_field_name, c_array)
-                        setattr(ctypes_instance, c_field_name + "Len", c_int(l))
+                        setattr(ct, c, pointer(py_value_to_c(value, t())))
+
+        elif arg_type is bytes:
+            # The Go data type array []byte
+            def setter(py, ct, n=py_field_name, c=c_field_name):
+                value = getattr(py, n)
+                if value is not None:
+                    setattr(ct, c, cast(value, POINTER(c_ubyte)))
+                    setattr(ct, c + "Len", c_int(len(value)))
 
+        else:
+            # The Go data type array, for example:
+            # []*excelize.Options, []excelize.Options, []string, []*string
+            py_field_type = get_args(arg_type)[0]
+            if type(None) not in get_args(py_field_type):
+                # The Go data type array, for example: []excelize.Options or []string
+                c_ele_type = getattr(c_field_type, "_type_", None)
+                if str is py_field_type:
+                    # The Go string array, for example: []string
+                    to_c_array = lambda py_list, t=c_ele_type: (
+                        POINTER(c_char) * len(py_list)
+                    )(*[create_string_buffer(c.encode(ENCODE)) for c in py_list])
+                elif is_py_primitive_type(py_field_type):
+                    # The Go basic data type array, for example: []int
+                    to_c_array = lambda py_list, t=c_ele_type: (t * len(py_list))(
+                        *[py_to_base_ctype(v, t) for v in py_list]
+                    )
                 else:
-                    # Pointer array of the Go data type, for example:
-                    # []*excelize.Options or []*string
-                    c_type = getattr(
-                        getattr(
-                            get_c_field_type(ctypes_instance, c_field_name),
-                            "_type_",
-                            None,
-                        ),
-                        "_type_",
-                        None,
+                    # The Go struct array, for example: []excelize.Options
+                    to_c_array = lambda py_list, t=c_ele_type: (t * len(py_list))(
+                        *[py_value_to_c(v, t()) for v in py_list]
                     )
-                    py_list = getattr(py_instance, py_field_name)
-                    if py_list:
-                        l = len(py_list)
-                        c_array = (POINTER(c_type) * l)()
-                        if is_py_primitive_type(get_args(py_field_type)[0]):
-                            # Pointer array of the Go basic data type, for example: []*string
-                            for i in range(l):
-                                c_array[i] = pointer(
-                                    py_to_base_ctype(py_list[i], c_type)
-                                )
-                        else:
-                            #  Pointer array of the Go struct, for example: []*excelize.Options
-                            for i in range(l):
-                                c_array[i] = pointer(
-                                    py_value_to_c(py_list[i], c_type())
-                                )
-                        setattr(ctypes_instance, c_field_name + "Len", c_int(l))
-                        setattr(ctypes_instance, c_field_name, c_array)
-    return ctypes_instance
+            else:
+                # Pointer array of the Go data type, for example:
+                # []*excelize.Options or []*string
+                c_ele_type = getattr(
+                    getattr(c_field_type, "_type_", None), "_type_", None
+                )
+                if is_py_primitive_type(get_args(py_field_type)[0]):
+                    # Pointer array of the Go basic data type, for example: []*string
+                    to_c_array = lambda py_list, t=c_ele_type: (
+                        POINTER(t) * len(py_list)
+                    )(*[pointer(py_to_base_ctype(v, t)) for v in py_list])
+                else:
+                    #  Pointer array of the Go struct, for example: []*excelize.Options
+                    to_c_array = lambda py_list, t=c_ele_type: (
+                        POINTER(t) * len(py_list)
+                    )(*[pointer(py_value_to_c(v, t())) for v in py_list])
+
+            def setter(py, ct, n=py_field_name, c=c_field_name, to_c_array=to_c_array):
+                py_list = getattr(py, n)
+                if py_list:
+                    setattr(ct, c, to_c_array(py_list))
+                    setattr(ct, c + "Len", c_int(len(py_list)))
+
+        setters.append(setter)
+
+    def converter(py_instance, ctypes_instance):
+        for setter in setters:
+            setter(py_instance, ctypes_instance)
+        return ctypes_instance
+
+    return converter
+
+
+def py_value_to_c(py_instance, ctypes_instance):
+    """
+    Converts a Python instance to a corresponding C instance using ctypes.
+
+    This function recursively converts fields of a Python instance to their
+    corresponding C types and assigns them to the provided ctypes instance.
+    It handles primitive types, structs, pointers, and arrays. The converter
+    function for each pair of the types is compiled once and cached.
+
+    Args:
+        py_instance (object): The Python instance to be converted.
+        ctypes_instance (ctypes.Structure): The ctypes instance to which the
+            converted values will be assigned.
+
+    Returns:
+        ctypes.Structure: The ctypes instance with the converted values from
+            the Python instance.
+    """
+    if py_instance is None:
+        return None
+    # The dataclass type itself may be used as the default value of the field
+    py_type = py_instance if isinstance(py_instance, type) else type(py_instance)
+    key = (py_type, type(ctypes_instance))
+    converter = py_to_c_converters.get(key)
+    if converter is None:
+        converter = py_to_c_converters[key] = compile_py_value_to_c(*key)
+    return converter(py_instance, ctypes_instance)
+
+
+def datetime_to_excel_serial(value: Union[datetime, date], date1904=False) -> float:
+    """
+    Converts a datetime or date to the Excel serial number of the wall clock
+    time, the time zone of the datetime is ignored.
+
+    Args:
+        value (Union[datetime, date]): The datetime or date
+        date1904 (bool): Use the 1904 date system instead of the 1900 one
+
+    Returns:
+        float: The Excel serial number
+    """
+    if type(value) is date:
+        delta = value - EXCEL_EPOCH.date()
+    else:
+        delta = value.replace(tzinfo=None) - EXCEL_EPOCH
+    serial = delta.days + (delta.seconds + delta.microseconds / 1e6) / 86400
+    if date1904:
+        return serial - 1462
+    return serial - 1 if delta.days < 61 else serial
+
+
+def excel_serial_to_datetime(serial: float) -> datetime:
+    """
+    Converts the Excel serial number in the 1900 date system to the datetime,
+    rounded to microseconds.
+
+    Args:
+        serial (float): The Excel serial number
+
+    Returns:
+        datetime: The datetime of the wall clock time
+    """
+    return EXCEL_EPOCH + timedelta(days=serial + 1 if serial < 61 else serial)
 
 
 def py_value_to_c_interface(py_value):
     """
-    Converts a Python value to a C interface representation.
+    Converts a Python value to a C interface representation. The integers are
+    passed as 64-bit integers, the integers out of the range and the Decimal
+    values are passed as floats, so they are stored as numbers.
 
     Args:
         py_value: The Python value to be converted.
 
     Returns:
         An Interface object representing the Python value in a C-compatible format.
+    """
+    typ = type(py_value)
+    if typ is float:
+        return types_go._Interface(Type=3, Float64=py_value)
+    if typ is int:
+        if -(2**63) <= py_value < 2**63:
+            return types_go._Interface(Type=1, Integer=py_value)
+        return types_go._Interface(Type=3, Float64=py_value)
+    if typ is str:
+        return types_go._Interface(Type=2, String=py_value.encode(ENCODE))
+    if typ is bool:
+        return types_go._Interface(Type=4, Boolean=py_value)
+    if typ is Decimal:
+        return types_go._Interface(Type=3, Float64=float(py_value))
+    if typ is datetime or typ is date:
+        return types_go._Interface(Type=5, Float64=datetime_to_excel_serial(py_value))
+    return types_go._Interface()
+
+
+def c_interface_to_py(c_interface):
+    """
+    Converts a C interface value returned by the library to a Python value.
 
-    Raises:
-        TypeError: If the type of py_value is not supported.
-    """
-    type_mappings = {
-        int: lambda: Interface(type=1, integer=py_value),
-        str: lambda: Interface(type=2, string=py_value),
-        float: lambda: Interface(type=3, float64=py_value),
-        bool: lambda: Interface(type=4, boolean=py_value),
-        datetime: lambda: Interface(type=5, integer=int(py_value.timestamp())),
-        date: lambda: Interface(
-            type=5,
-            integer=int(datetime.combine(py_value, time.min).timestamp()),
-        ),
-    }
-    interface = type_mappings.get(type(py_value), lambda: Interface())()
-    return py_value_to_c(interface, types_go._Interface())
+    Args:
+        c_interface: The ctypes instance of the Interface structure.
+
+    Returns:
+        The Python value of the interface, None for the Nil type.
+    """
+    typ = c_interface.Type
+    if typ == 1:
+        return c_interface.Integer
+    if typ == 2:
+        return c_interface.String.decode(ENCODE)
+    if typ == 3:
+        return c_interface.Float64
+    if typ == 4:
+        return c_interface.Boolean
+    if typ == 5:
+        return excel_serial_to_datetime(c_interface.Float64)
+    return None
+
+
+def py_column_to_c(values, nulls=None) -> Tuple[int, object, object]:
+    """
+    Converts a column of Python values to the C arrays for writing data by
+    columns. A typed contiguous buffer, such as an array.array or a NumPy
+    array of float64, int64 or bool, is passed in place without an extra copy
+    if it's writable. The datetimes and dates, and the NumPy datetime64 arrays,
+    are converted to the Excel serial numbers in bulk.
+
+    Args:
+        values: The list of values or the typed buffer of the column.
+        nulls: The optional mask, a truthy element marks the cell as empty.
+
+    Returns:
+        Tuple[int, object, object]: The value type, the array of the values and
+        the array of the null mask, the value type is 0 if the type of values
+        is not supported.
+    """
+
+    def from_buffer(view: memoryview, c_type):
+        if not view.c_contiguous:
+            view = memoryview(view.tobytes())
+        array_type = c_type * (view.nbytes // sizeof(c_type))
+        if view.readonly:
+            return array_type.from_buffer_copy(view)
+        return array_type.from_buffer(view)
+
+    null, dates = None, getattr(getattr(values, "dtype", None), "kind", "") == "M"
+    if dates:
+        import numpy
+
+        values = numpy.asarray(values)
+        if numpy.isnat(values).any():
+            null = from_buffer(memoryview(numpy.isnat(values).view("u1")), c_ubyte)
+        values = dates_to_excel_serials(values)
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if view is not None:
+        fmt = view.format.lstrip("@=")
+        if view.ndim != 1:
+            return 0, None, None
+        if fmt == "d":
+            typ, arr = 3, from_buffer(view, c_double)
+        elif fmt == "?":
+            typ, arr = 4, from_buffer(view, c_bool)
+        elif fmt in ("q", "l", "n") and view.itemsize == sizeof(c_longlong):
+            typ, arr = 1, from_buffer(view, c_longlong)
+        elif fmt == "f":
+            typ, arr = 3, (c_double * len(view))(*view)
+        elif fmt in ("b", "B", "h", "H", "i", "I", "l", "L", "q", "Q", "n", "N"):
+            typ, arr = 1, (c_longlong * len(view))(*view)
+        else:
+            return 0, None, None
+    else:
+        values = list(values)
+        present = [value for value in values if value is not None]
+        if len(present) != len(values):
+            null = (c_ubyte * len(values))(*[value is None for value in values])
+        if all(isinstance(value, str) for value in present):
+            typ, arr = 2, (c_char_p * len(values))(
+                *[None if value is None else value.encode(ENCODE) for value in values]
+            )
+        elif all(isinstance(value, bool) for value in present):
+            typ, arr = 4, (c_bool * len(values))(*[bool(v) for v in values])
+        elif all(
+            isinstance(v, int) and not isinstance(v, bool) and -(2**63) <= v < 2**63
+            for v in present
+        ):
+            typ, arr = 1, (c_longlong * len(values))(*[v or 0 for v in values])
+        elif all(isinstance(value, (int, float, Decimal)) for value in present):
+            typ, arr = 3, (c_double * len(values))(*[v or 0 for v in values])
+        elif all(isinstance(value, (datetime, date)) for value in present):
+            typ, arr = 5, (c_double * len(values))(
+                *[0 if v is None else datetime_to_excel_serial(v) for v in values]
+            )
+        else:
+            return 0, None, None
+    if dates:
+        typ = 5
+    if nulls is not None:
+        try:
+            view = memoryview(nulls)
+        except TypeError:
+            view = None
+        if view is not None and view.ndim == 1 and view.itemsize == 1:
+            mask = from_buffer(view.cast("B"), c_ubyte)
+        else:
+            mask = (c_ubyte * len(nulls))(*[bool(v) for v in nulls])
+        if null is not None:
+            for i in range(min(len(null), len(mask))):
+                mask[i] = mask[i] or null[i]
+        null = mask
+    return typ, arr, null
+
+
+def column_to_c(values, nulls, c_col) -> Tuple[int, object]:
+    """
+    Points the C Column structure to the values of a column for writing data
+    by columns. A pyarrow Array or ChunkedArray of numbers, booleans or strings
+    is passed in the Arrow columnar format, and the buffers of the numbers and
+    strings are passed in place, the null mask is ignored for it. Other values
+    are converted by the py_column_to_c function.
+
+    Args:
+        values: The values of the column.
+        nulls: The optional null mask of the column.
+        c_col (types_go._Column): The C Column structure to be set.
+
+    Returns:
+        Tuple[int, object]: The number of values and the objects which hold the
+        buffers of the values, which must be kept alive until the values are
+        written.
+    """
+    if hasattr(values, "combine_chunks"):
+        values = values.combine_chunks()
+    if hasattr(values, "buffers") and hasattr(values, "type"):
+        import pyarrow
+
+        if values.offset:
+            values = pyarrow.concat_arrays([values])
+        typ, refs = values.type, [values]
+        if pyarrow.types.is_integer(typ):
+            values = values.cast(pyarrow.int64())
+            c_col.Type, c_col.Int64 = 1, cast(
+                values.buffers()[1].address, POINTER(c_longlong)
+            )
+        elif pyarrow.types.is_floating(typ) or pyarrow.types.is_decimal(typ):
+            values = values.cast(pyarrow.float64())
+            c_col.Type, c_col.Float64 = 3, cast(
+                values.buffers()[1].address, POINTER(c_double)
+            )
+        elif pyarrow.types.is_boolean(typ):
+            _, arr, _ = py_column_to_c(
+                values.fill_null(False).to_numpy(zero_copy_only=False)
+            )
+            c_col.Type, c_col.Boolean = 4, cast(arr, POINTER(c_bool))
+            refs.append(arr)
+        elif pyarrow.types.is_timestamp(typ) or pyarrow.types.is_date(typ):
+            if pyarrow.types.is_timestamp(typ) and typ.tz:
+                values = pyarrow.compute.local_timestamp(values)
+            arr = dates_to_excel_serials(values.to_numpy(zero_copy_only=False))
+            c_col.Type, c_col.Float64 = 5, cast(arr.ctypes.data, POINTER(c_double))
+            refs.append(arr)
+        elif pyarrow.types.is_string(typ) or pyarrow.types.is_large_string(typ):
+            values = values.cast(pyarrow.string())
+            offsets, data = values.buffers()[1:3]
+            c_col.Type, c_col.Offsets = 2, cast(offsets.address, POINTER(c_int))
+            if data is not None:
+                c_col.Data = cast(data.address, POINTER(c_char))
+        else:
+            values = values.to_pylist()
+        if c_col.Type:
+            if values.null_count:
+                c_col.Validity = cast(values.buffers()[0].address, POINTER(c_ubyte))
+            return len(values), refs + [values]
+    typ, arr, null = py_column_to_c(values, nulls)
+    if typ == 0:
+        raise RuntimeError("invalid argument data type")
+    if null is not None and len(null) != len(arr):
+        raise RuntimeError("the number of values of each column must be same")
+    c_col.Type = typ
+    field = {1: "Int64", 2: "String", 3: "Float64", 4: "Boolean", 5: "Float64"}[typ]
+    setattr(c_col, field, cast(arr, POINTER(arr._type_)))
+    if null is not None:
+        c_col.Null = cast(null, POINTER(c_ubyte))
+    return len(arr), (arr, null)
+
+
+class ColumnBuffers:
+    """
+    ColumnBuffers holds the buffers of the columns in the GetColumnBuffersResult
+    ctypes instance, which keep the layout of the Arrow columnar format. The
+    buffers are used in place without copying, each of them keeps the
+    ColumnBuffers referenced, and the memory of them is released by the
+    library once the ColumnBuffers and all the buffers are garbage collected.
+
+    Attributes:
+        columns (List[Tuple]): The name, type, length, null count, validity
+        bitmap and values of each column, and the 64-bit offsets for the
+        string column. The values of the float column are None if they were
+        written to the buffer provided by the caller.
+    """
+
+    def __init__(self, res):
+        finalize(self, free_c_value, res)
+        self.columns = []
+        for col in res.Columns[: res.ColumnsLen]:
+            validity = self.buffer(col.Validity, c_ubyte, col.Length // 8 + 1)
+            if col.Type == 3:
+                values, offsets = None, None
+                if col.Float64:
+                    values = self.buffer(col.Float64, c_double, col.Length)
+            else:
+                values = self.buffer(col.Data, c_ubyte, col.DataSize)
+                offsets = self.buffer(col.Offsets, c_longlong, col.Length + 1)
+            self.columns.append(
+                (
+                    col.Name.decode(ENCODE),
+                    col.Type,
+                    col.Length,
+                    col.NullCount,
+                    validity,
+                    values,
+                    offsets,
+                )
+            )
+
+    def buffer(self, address: int, c_type, length: int):
+        """
+        Get the buffer of the given type and length at the address as a ctypes
+        array, which supports the buffer protocol.
+
+        Args:
+            address (int): The address of the buffer
+            c_type: The ctypes type of the elements
+            length (int): The number of the elements
+
+        Returns:
+            The ctypes array keeps the ColumnBuffers referenced.
+        """
+        buf = (c_type * length).from_address(address)
+        buf.owner = self
+        return buf
+
+
+def c_rows_to_py(res) -> List[List[str]]:
+    """
+    Convert the two-dimensional array of the cell values in the GetRowsResult
+    ctypes instance to Python lists, the blank rows will be kept as empty
+    lists.
+
+    Args:
+        res (types_go._GetRowsResult): The ctypes instance of the result
+
+    Returns:
+        List[List[str]]: The cell values of each row
+    """
+    return c_string_matrix_to_py(res.Rows)
+
+
+def c_string_matrix_to_py(matrix) -> List[List[str]]:
+    """
+    Convert the two-dimensional array of the strings in the StringMatrix
+    ctypes instance to Python lists. The values of all cells are copied from
+    the library in a single buffer and sliced by the offsets of the cells.
+
+    Args:
+        matrix (types_go._StringMatrix): The ctypes instance of the matrix
+
+    Returns:
+        List[List[str]]: The strings of each row
+    """
+    if not matrix.RowsLen:
+        return []
+    n = matrix.CellsLen
+    data = string_at(matrix.Data, matrix.DataSize)
+    offsets = array("q", string_at(matrix.Offsets, (n + 1) * sizeof(c_longlong)))
+    text = data.decode(ENCODE)
+    if len(text) == len(data):
+        # The byte offsets are the character offsets of the ASCII text
+        cells = [text[offsets[i] : offsets[i + 1]] for i in range(n)]
+    else:
+        cells = [data[offsets[i] : offsets[i + 1]].decode(ENCODE) for i in range(n)]
+    rows, start = [], 0
+    for row_len in matrix.RowLens[: matrix.RowsLen]:
+        rows.append(cells[start : start + row_len])
+        start += row_len
+    return rows
+
+
+def c_string_to_py(value: Optional[bytes]) -> str:
+    """
+    Decode the C string in the result returned by the library, the NULL
+    pointer will be converted to an empty string.
+
+    Args:
+        value (Optional[bytes]): The value of the C string field
+
+    Returns:
+        str: The decoded string
+    """
+    return value.decode(ENCODE) if value else ""
+
+
+def c_error_to_py(err: Optional[int]) -> str:
+    """
+    Convert the error message returned by the library to a Python string and
+    release the memory of it. The library returns NULL if no error occurred.
+
+    Args:
+        err (Optional[int]): The address of the error message
+
+    Returns:
+        str: The error message, or an empty string if no error occurred
+    """
+    if not err:
+        return ""
+    msg = string_at(err).decode(ENCODE)
+    lib.FreeCString(err)
+    return msg
+
+
+def free_c_value(ctypes_instance) -> None:
+    """
+    Release the memory allocated by the library for the strings and arrays in
+    the result structure, the fields of the structure must not be accessed
+    after that.
+
+    Args:
+        ctypes_instance: The ctypes instance of the result structure
+    """
+    lib.FreeCValue(
+        type(ctypes_instance).__name__.lstrip("_").encode(ENCODE),
+        byref(ctypes_instance),
+    )
 
 
 class StreamWriter:
     """
     StreamWriter is a streaming writer for writing large amounts of data to a
-    worksheet.
+    worksheet. The calls on the stream writer are serialized with the other
+    calls on the workbook, and the stream writer is released when the workbook
+    closed.
     """
 
     sw_index: int
@@ -492,9 +1236,8 @@ class StreamWriter:
                 print(err)
             ```
         """
-        lib.StreamAddTable.restype = c_char_p
         options = py_value_to_c(table, types_go._Table())
-        err = lib.StreamAddTable(self.sw_index, byref(options)).decode(ENCODE)
+        err = c_error_to_py(lib.StreamAddTable(self.sw_index, byref(options)))
         if err != "":
             raise RuntimeError(err)
 
@@ -512,9 +1255,8 @@ class StreamWriter:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.StreamInsertPageBreak.restype = c_char_p
-        err = lib.StreamInsertPageBreak(self.sw_index, cell.encode(ENCODE)).decode(
-            ENCODE
+        err = c_error_to_py(
+            lib.StreamInsertPageBreak(self.sw_index, cell.encode(ENCODE))
         )
         if err != "":
             raise RuntimeError(err)
@@ -532,12 +1274,13 @@ class StreamWriter:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.StreamMergeCell.restype = c_char_p
-        err = lib.StreamMergeCell(
-            self.sw_index,
-            top_left_cell.encode(ENCODE),
-            bottom_right_cell.encode(ENCODE),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.StreamMergeCell(
+                self.sw_index,
+                top_left_cell.encode(ENCODE),
+                bottom_right_cell.encode(ENCODE),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -566,10 +1309,9 @@ class StreamWriter:
                 print(err)
             ```
         """
-        lib.StreamSetColWidth.restype = c_char_p
-        err = lib.StreamSetColWidth(
-            self.sw_index, c_int(start_col), c_int(end_col), c_double(width)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.StreamSetColWidth(self.sw_index, start_col, end_col, c_double(width))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -586,9 +1328,8 @@ class StreamWriter:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.StreamSetPanes.restype = c_char_p
         options = py_value_to_c(opts, types_go._Panes())
-        err = lib.StreamSetPanes(self.sw_index, byref(options)).decode(ENCODE)
+        err = c_error_to_py(lib.StreamSetPanes(self.sw_index, byref(options)))
         if err != "":
             raise RuntimeError(err)
 
@@ -611,85 +1352,307 @@ class StreamWriter:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.StreamSetRow.restype = c_char_p
         vals = (types_go._Interface * len(values))()
         for i, value in enumerate(values):
             vals[i] = py_value_to_c_interface(value)
-        err = lib.StreamSetRow(
-            self.sw_index,
-            cell.encode(ENCODE),
-            byref(vals),
-            len(vals),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.StreamSetRow(
+                self.sw_index,
+                cell.encode(ENCODE),
+                vals,
+                len(vals),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
-    def flush(self) -> None:
+    def set_rows(
+        self,
+        cell: str,
+        rows: Iterable[List[Union[None, int, str, bool, datetime, date]]],
+        chunk_size: int = 10000,
+    ) -> None:
         """
-        Ending the streaming writing process.
+        Writes multiple rows to stream rows by giving starting cell reference
+        and an iterable of rows, the cell reference of each row is computed by
+        the library. The rows are passed in chunks of the given number of rows
+        in each call instead of one call per row. Note that you must call the
+        'flush' function to end the streaming writing process.
+
+        Args:
+            cell (str): The cell reference of the first row
+            rows (Iterable[List[Union[None, int, str, bool, datetime, date]]]):
+                The cell values of each row
+            chunk_size (int): The number of rows passed in each call, defaults
+                to 10000
 
         Returns:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
-        """
-        lib.StreamFlush.restype = c_char_p
-        err = lib.StreamFlush(self.sw_index).decode(ENCODE)
-        if err != "":
-            raise RuntimeError(err)
-
 
-class File:
-    """
-    File is a representation of an workbook.
-    """
-
-    file_index: int
-
-    def __init__(self, file_index: int):
-        self.file_index = file_index
+        Example:
+            For example, write 100 thousand rows start at the cell A1 in the
+            stream writer:
 
-    def save(self, *opts: Options) -> None:
+            ```python
+            try:
+                sw.set_rows("A1", ([r, "Text", r * 0.5] for r in range(100000)))
+            except RuntimeError as err:
+                print(err)
+            ```
         """
-        Override the spreadsheet with origin path.
+        col, row = cell_name_to_coordinates(cell)
+        chunk_size, chunk = max(chunk_size, 1), []
+
+        def set_chunk(offset: int) -> None:
+            vals = (types_go._Interface * sum(len(r) for r in chunk))()
+            row_lens = (c_int * len(chunk))(*[len(r) for r in chunk])
+            i = 0
+            for r in chunk:
+                for value in r:
+                    vals[i] = py_value_to_c_interface(value)
+                    i += 1
+            err = c_error_to_py(
+                lib.StreamSetRows(
+                    self.sw_index,
+                    coordinates_to_cell_name(col, row + offset).encode(ENCODE),
+                    vals,
+                    row_lens,
+                    len(chunk),
+                )
+            )
+            if err != "":
+                raise RuntimeError(err)
+
+        offset = 0
+        for r in rows:
+            chunk.append(r)
+            if len(chunk) == chunk_size:
+                set_chunk(offset)
+                offset, chunk = offset + len(chunk), []
+        if chunk:
+            set_chunk(offset)
+
+    def write_columns(
+        self,
+        cell: str,
+        columns: List[object],
+        nulls: Optional[List[object]] = None,
+        block_size: int = 10000,
+        styles: Optional[List[int]] = None,
+    ) -> None:
+        """
+        Writes the values by columns to stream rows by giving starting cell
+        reference. Each column is a typed contiguous buffer, such as an
+        array.array or a NumPy array of float64, int64 or bool, a pyarrow
+        array of numbers, booleans or strings, or a list of numbers, booleans
+        or strings, and None in a list means an empty cell. The values are
+        passed in one call per block of rows instead of one call per row. Note
+        that you must call the 'flush' function to end the streaming writing
+        process.
 
         Args:
-            *opts (Options): Optional parameters for saving the file.
+            cell (str): The cell reference
+            columns (List[object]): The values of each column
+            nulls (Optional[List[object]]): The optional null mask of each
+                column, a truthy element marks the cell as empty
+            block_size (int): The number of rows passed in each call, defaults
+                to 10000
+            styles (Optional[List[int]]): The optional style ID of the cells of
+                each column, 0 means no style
 
         Returns:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
-        """
-        err, lib.Save.restype = None, c_char_p
-        options = POINTER(types_go._Options)()
-        options = (
-            byref(py_value_to_c(opts[0], types_go._Options()))
-            if opts
-            else POINTER(types_go._Options)()
-        )
-        err = lib.Save(self.file_index, options).decode(ENCODE)
-        if err != "":
-            raise RuntimeError(err)
 
-    def save_as(self, filename: str, *opts: Options) -> None:
-        """
-        Create or update to a spreadsheet at the provided path.
+        Example:
+            For example, write three columns of 100 thousand rows start at the
+            cell A1 in the stream writer:
 
-        Args:
-            filename (str): The name of the file to save.
-            *opts (Options): Optional parameters for saving the file.
+            ```python
+            from array import array
+
+            try:
+                sw = f.new_stream_writer("Sheet1")
+                sw.write_columns(
+                    "A1",
+                    [
+                        array("d", range(100000)),
+                        array("q", range(100000)),
+                        ["Text"] * 100000,
+                    ],
+                )
+                sw.flush()
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        c_cols, refs, rows = (types_go._Column * len(columns))(), [], None
+        for i, values in enumerate(columns):
+            length, ref = column_to_c(values, nulls[i] if nulls else None, c_cols[i])
+            if rows is None:
+                rows = length
+            if length != rows:
+                raise RuntimeError("the number of values of each column must be same")
+            if styles and styles[i]:
+                c_cols[i].StyleID = styles[i]
+            refs.append(ref)
+        if not columns or not rows:
+            return
+        col, row = cell_name_to_coordinates(cell)
+        block_size = max(block_size, 1)
+        for start in range(0, rows, block_size):
+            for c_col in c_cols:
+                c_col.Offset = start
+            err = c_error_to_py(
+                lib.StreamSetColumns(
+                    self.sw_index,
+                    coordinates_to_cell_name(col, row + start).encode(ENCODE),
+                    c_cols,
+                    len(c_cols),
+                    min(block_size, rows - start),
+                )
+            )
+            if err != "":
+                raise RuntimeError(err)
+
+    def write_table(
+        self,
+        cell: str,
+        table: object,
+        header: bool = True,
+        styles: Optional[Dict[Union[str, int], int]] = None,
+        block_size: int = 10000,
+    ) -> None:
+        """
+        Writes a table by columns to stream rows by giving starting cell
+        reference. The table can be a pyarrow Table or RecordBatch, a pandas
+        DataFrame, or a dictionary that maps the column names to the values of
+        the columns, which are accepted by the 'write_columns' function. The
+        buffers of the numbers and strings in the pyarrow columns are passed in
+        place, without creating Python objects for the cells. Note that you must
+        call the 'flush' function to end the streaming writing process.
+
+        Args:
+            cell (str): The cell reference
+            table (object): The table to be written
+            header (bool): Write the names of the columns as the first row,
+                defaults to True
+            styles (Optional[Dict[Union[str, int], int]]): The optional style
+                ID of the cells of the columns by the column names or the
+                indexes of the columns
+            block_size (int): The number of rows passed in each call, defaults
+                to 10000
+
+        Returns:
+            None: Return None if no error occurred, otherwise raise a
+            RuntimeError with the message.
+
+        Example:
+            For example, write a pyarrow table start at the cell A1 in the
+            stream writer, and apply a style to the column named 'Price':
+
+            ```python
+            try:
+                sw.write_table("A1", table, styles={"Price": style_id})
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        nulls = None
+        if isinstance(table, dict):
+            names, columns = list(table), list(table.values())
+        elif hasattr(table, "column_names"):
+            names, columns = list(table.column_names), list(table.columns)
+        else:
+            names, columns, nulls = [], [], []
+            for name in table.columns:
+                mask, values = table[name].isna().to_numpy(), table[name].to_numpy()
+                if values.dtype.kind == "O":
+                    values = [None if n else v for v, n in zip(values.tolist(), mask)]
+                names.append(name)
+                columns.append(values)
+                nulls.append(mask)
+        styles = styles or {}
+        col, row = cell_name_to_coordinates(cell)
+        if header:
+            self.set_row(cell, [str(name) for name in names])
+            cell = coordinates_to_cell_name(col, row + 1)
+        self.write_columns(
+            cell,
+            columns,
+            nulls,
+            block_size,
+            [styles.get(name, styles.get(i, 0)) for i, name in enumerate(names)],
+        )
+
+    def flush(self) -> None:
+        """
+        Ending the streaming writing process. The stream writer can't be used
+        after it has been flushed.
+
+        Returns:
+            None: Return None if no error occurred, otherwise raise a
+            RuntimeError with the message.
+        """
+        err = c_error_to_py(lib.StreamFlush(self.sw_index))
+        if err != "":
+            raise RuntimeError(err)
+
+
+class File:
+    """
+    File is a representation of an workbook. A workbook can be shared by
+    multiple threads: the functions for reading the workbook, such as
+    'get_cell_value', 'get_rows' and 'calc_cell_value', run in parallel on it,
+    and the functions for changing the workbook run exclusively.
+    """
+
+    file_index: int
+
+    def __init__(self, file_index: int):
+        self.file_index = file_index
+
+    def save(self, *opts: Options) -> None:
+        """
+        Override the spreadsheet with origin path.
+
+        Args:
+            *opts (Options): Optional parameters for saving the file.
+
+        Returns:
+            None: Return None if no error occurred, otherwise raise a
+            RuntimeError with the message.
+        """
+        options = POINTER(types_go._Options)()
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        err = c_error_to_py(lib.Save(self.file_index, options))
+        if err != "":
+            raise RuntimeError(err)
+
+    def save_as(self, filename: str, *opts: Options) -> None:
+        """
+        Create or update to a spreadsheet at the provided path.
+
+        Args:
+            filename (str): The name of the file to save.
+            *opts (Options): Optional parameters for saving the file.
 
         Returns:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SaveAs.restype = c_char_p
         options = (
             byref(py_value_to_c(opts[0], types_go._Options()))
             if opts
             else POINTER(types_go._Options)()
         )
-        err = lib.SaveAs(self.file_index, filename.encode(ENCODE), options).decode(
-            ENCODE
+        err = c_error_to_py(
+            lib.SaveAs(self.file_index, filename.encode(ENCODE), options)
         )
         if err != "":
             raise RuntimeError(err)
@@ -709,18 +1672,19 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.AddChart.restype = c_char_p
         opts = [chart] + list(combo.values())
         charts = (types_go._Chart * len(opts))()
         for i, opt in enumerate(opts):
             charts[i] = py_value_to_c(opt, types_go._Chart())
-        err = lib.AddChart(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-            byref(charts),
-            len(charts),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddChart(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+                charts,
+                len(charts),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -739,17 +1703,18 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.AddChartSheet.restype = c_char_p
         opts = [chart] + list(combo.values())
         charts = (types_go._Chart * len(opts))()
         for i, opt in enumerate(opts):
             charts[i] = py_value_to_c(opt, types_go._Chart())
-        err = lib.AddChartSheet(
-            self.file_index,
-            sheet.encode(ENCODE),
-            byref(charts),
-            len(charts),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddChartSheet(
+                self.file_index,
+                sheet.encode(ENCODE),
+                charts,
+                len(charts),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -767,11 +1732,10 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.AddComment.restype = c_char_p
         options = py_value_to_c(opts, types_go._Comment())
-        err = lib.AddComment(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddComment(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -791,11 +1755,10 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.AddFormControl.restype = c_char_p
         options = py_value_to_c(opts, types_go._FormControl())
-        err = lib.AddFormControl(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddFormControl(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -818,19 +1781,20 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.AddPicture.restype = c_char_p
         options = (
             byref(py_value_to_c(opts, types_go._GraphicOptions()))
             if opts
             else POINTER(types_go._GraphicOptions)()
         )
-        err = lib.AddPicture(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-            name.encode(ENCODE),
-            options,
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddPicture(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+                name.encode(ENCODE),
+                options,
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -853,13 +1817,14 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.AddPictureFromBytes.restype = c_char_p
-        err = lib.AddPictureFromBytes(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-            byref(py_value_to_c(picture, types_go._Picture())),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddPictureFromBytes(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+                byref(py_value_to_c(picture, types_go._Picture())),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -933,11 +1898,12 @@ class File:
                     print(err)
             ```
         """
-        lib.AddPivotTable.restype = c_char_p
-        err = lib.AddPivotTable(
-            self.file_index,
-            byref(py_value_to_c(opts, types_go._PivotTableOptions())),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddPivotTable(
+                self.file_index,
+                byref(py_value_to_c(opts, types_go._PivotTableOptions())),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -1001,11 +1967,10 @@ class File:
                     print(err)
             ```
         """
-        lib.AddShape.restype = c_char_p
         options = py_value_to_c(opts, types_go._Shape())
-        err = lib.AddShape(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddShape(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -1043,11 +2008,10 @@ class File:
                 print(err)
             ```
         """
-        lib.AddSlicer.restype = c_char_p
         options = py_value_to_c(opts, types_go._SlicerOptions())
-        err = lib.AddSlicer(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddSlicer(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -1085,11 +2049,10 @@ class File:
                 print(err)
             ```
         """
-        lib.AddSparkline.restype = c_char_p
         options = py_value_to_c(opts, types_go._SparklineOptions())
-        err = lib.AddSparkline(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddSparkline(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -1121,11 +2084,10 @@ class File:
                 print(err)
             ```
         """
-        lib.AddTable.restype = c_char_p
         options = py_value_to_c(table, types_go._Table())
-        err = lib.AddTable(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddTable(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -1141,12 +2103,13 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.AddVBAProject.restype = c_char_p
-        err = lib.AddVBAProject(
-            self.file_index,
-            cast(file, POINTER(c_ubyte)),
-            len(file),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AddVBAProject(
+                self.file_index,
+                cast(file, POINTER(c_ubyte)),
+                len(file),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -1178,17 +2141,18 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.AutoFilter.restype = c_char_p
         options = (types_go._AutoFilterOptions * len(opts))()
         for i, opt in enumerate(opts):
             options[i] = py_value_to_c(opt, types_go._AutoFilterOptions())
-        err = lib.AutoFilter(
-            self.file_index,
-            sheet.encode(ENCODE),
-            range_ref.encode(ENCODE),
-            byref(options),
-            len(options),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.AutoFilter(
+                self.file_index,
+                sheet.encode(ENCODE),
+                range_ref.encode(ENCODE),
+                options,
+                len(options),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -1208,7 +2172,6 @@ class File:
             str: Return the calculation result as a string if no
             error occurred, otherwise raise a RuntimeError with the message.
         """
-        lib.CalcCellValue.restype = types_go._StringErrorResult
         options = (
             byref(py_value_to_c(opts[0], types_go._Options()))
             if opts
@@ -1217,11 +2180,93 @@ class File:
         res = lib.CalcCellValue(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE), options
         )
-        err = res.err.decode(ENCODE)
+        err, val = c_string_to_py(res.err), c_string_to_py(res.val)
+        free_c_value(res)
         if not err:
-            return res.val.decode(ENCODE)
+            return val
         raise RuntimeError(err)
 
+    def calc_cell_values(
+        self,
+        sheet: str,
+        cells: Union[str, List[str]],
+        *opts: Options,
+        workers: int = 1,
+    ) -> Tuple[
+        Union[List[str], List[List[str]]],
+        Union[List[Optional[str]], List[List[Optional[str]]]],
+    ]:
+        """
+        Get the calculated values of cells in bulk by given worksheet name and
+        a range reference or a list of cell references, with a single call to
+        the library. The values of a range are returned as a list of rows. The
+        intermediate results are kept in the calculation cache of the workbook,
+        so the formulas referenced by many cells are calculated once. The
+        cells are calculated one by one by default, or concurrently by up to
+        the given number of workers. Note that the concurrent workers share the
+        calculation cache of the workbook, and the calculation engine of the
+        library doesn't guarantee that concurrent calculation on a workbook is
+        safe, so use more than one worker only for the formulas known to work
+        in parallel.
+
+        Args:
+            sheet (str): The worksheet name
+            cells (Union[str, List[str]]): The range reference, such as A1:C3,
+            or the list of cell references
+            *opts (Options): Optional parameters for get cell value
+            workers (int): The maximum number of cells calculated at once,
+            default is 1
+
+        Returns:
+            Tuple[Union[List[str], List[List[str]]], Union[List[Optional[str]],
+            List[List[Optional[str]]]]]: Return the calculated values of cells
+            and the error messages in the same layout, the error message is
+            None if the cell was calculated without error. Raise a RuntimeError
+            with the message if the cells can't be calculated at all.
+
+        Example:
+            For example, calculate the cells in the range D2:D50001 on Sheet1
+            with 8 workers:
+
+            ```python
+            try:
+                rows, errors = f.calc_cell_values("Sheet1", "D2:D50001", workers=8)
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        if isinstance(cells, str):
+            range_ref, refs = cells.encode(ENCODE), None
+        else:
+            range_ref = None
+            refs = (c_char_p * len(cells))(*[cell.encode(ENCODE) for cell in cells])
+        res = lib.CalcCellValues(
+            self.file_index,
+            sheet.encode(ENCODE),
+            range_ref,
+            refs,
+            len(refs) if refs else 0,
+            workers,
+            options,
+        )
+        err, cols = c_string_to_py(res.Err), res.Cols
+        vals = [c_string_to_py(v) for v in res.Values[: res.ValuesLen]]
+        errs = [v and v.decode(ENCODE) for v in res.Errors[: res.ErrorsLen]]
+        free_c_value(res)
+        if err:
+            raise RuntimeError(err)
+        if range_ref is None:
+            return vals, errs
+        return (
+            [vals[i : i + cols] for i in range(0, len(vals), cols)],
+            [errs[i : i + cols] for i in range(0, len(errs), cols)],
+        )
+
     def close(self) -> Optional[Exception]:
         """
         Closes and cleanup the open temporary file for the spreadsheet.
@@ -1230,10 +2275,72 @@ class File:
             Optional[Exception]: Returns None if no error occurred,
             otherwise returns an Exception with the message.
         """
-        err, lib.Close.restype = None, c_char_p
-        err = lib.Close(self.file_index).decode(ENCODE)
+        err = c_error_to_py(lib.Close(self.file_index))
         return None if err == "" else Exception(err)
 
+    def cols(
+        self, sheet: str, *opts: Options, columns: str = "", batch_size: int = 100
+    ) -> Iterator[List[str]]:
+        """
+        Return a generator over the columns in a sheet by given worksheet name,
+        used for streaming reading data for a worksheet with a large data. Only
+        the columns in the given range are read and transferred, in batches of
+        the given size. The value of the cell is converted to the string type
+        in the same way as 'get_cols'.
+
+        Args:
+            sheet (str): The worksheet name
+            *opts (Options): Optional parameters for get cell values
+            columns (str): The range of columns to be read, for example "B:D"
+            or "C", read all columns by default
+            batch_size (int): The number of columns read in each batch, default
+            is 100
+
+        Returns:
+            Iterator[List[str]]: Return a generator over the columns of the
+            worksheet, raise a RuntimeError with the message when an error
+            occurred during iteration.
+
+        Example:
+            For example, get and traverse the value of the cells in the columns
+            B to D on a worksheet named 'Sheet1':
+
+            ```python
+            try:
+                for col in f.cols("Sheet1", columns="B:D"):
+                    for cell in col:
+                        print(f"{cell}\t", end="")
+                    print()
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        res = lib.Cols(
+            self.file_index, sheet.encode(ENCODE), columns.encode(ENCODE), options
+        )
+        err = c_string_to_py(res.err)
+        free_c_value(res)
+        if err:
+            raise RuntimeError(err)
+        cols_index = res.val
+        try:
+            while True:
+                res = lib.ColsNext(cols_index, batch_size)
+                err, rows = c_string_to_py(res.err), c_rows_to_py(res)
+                free_c_value(res)
+                if err:
+                    raise RuntimeError(err)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            c_error_to_py(lib.ColsClose(cols_index))
+
     def copy_sheet(self, src: int, to: int) -> None:
         """
         Duplicate a worksheet by gave source and target worksheet index. Note
@@ -1248,8 +2355,7 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        err, lib.CopySheet.restype = None, c_char_p
-        err = lib.CopySheet(self.file_index, src, to).decode(ENCODE)
+        err = c_error_to_py(lib.CopySheet(self.file_index, src, to))
         if err != "":
             raise RuntimeError(err)
 
@@ -1265,10 +2371,9 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        err, lib.DeleteChart.restype = None, c_char_p
-        err = lib.DeleteChart(
-            self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.DeleteChart(self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -1284,10 +2389,11 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        err, lib.DeleteComment.restype = None, c_char_p
-        err = lib.DeleteComment(
-            self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.DeleteComment(
+                self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -1316,9 +2422,8 @@ class File:
                 print(err)
             ```
         """
-        lib.DeleteDefinedName.restype = c_char_p
         options = py_value_to_c(defined_name, types_go._DefinedName())
-        err = lib.DeleteDefinedName(self.file_index, byref(options)).decode(ENCODE)
+        err = c_error_to_py(lib.DeleteDefinedName(self.file_index, byref(options)))
         if err != "":
             raise RuntimeError(err)
 
@@ -1334,10 +2439,11 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        err, lib.DeletePicture.restype = None, c_char_p
-        err = lib.DeletePicture(
-            self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.DeletePicture(
+                self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -1356,8 +2462,7 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        err, lib.DeleteSheet.restype = None, c_char_p
-        err = lib.DeleteSheet(self.file_index, sheet.encode(ENCODE)).decode(ENCODE)
+        err = c_error_to_py(lib.DeleteSheet(self.file_index, sheet.encode(ENCODE)))
         if err != "":
             raise RuntimeError(err)
 
@@ -1372,8 +2477,7 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        err, lib.DeleteSlicer.restype = None, c_char_p
-        err = lib.DeleteSlicer(self.file_index, name.encode(ENCODE)).decode(ENCODE)
+        err = c_error_to_py(lib.DeleteSlicer(self.file_index, name.encode(ENCODE)))
         if err != "":
             raise RuntimeError(err)
 
@@ -1393,9 +2497,8 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        err, lib.DuplicateRow.restype = None, c_char_p
-        err = lib.DuplicateRow(self.file_index, sheet.encode(ENCODE), row).decode(
-            ENCODE
+        err = c_error_to_py(
+            lib.DuplicateRow(self.file_index, sheet.encode(ENCODE), row)
         )
         if err != "":
             raise RuntimeError(err)
@@ -1418,13 +2521,56 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        err, lib.DuplicateRowTo.restype = None, c_char_p
-        err = lib.DuplicateRowTo(
-            self.file_index, sheet.encode(ENCODE), row, row2
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.DuplicateRowTo(self.file_index, sheet.encode(ENCODE), row, row2)
+        )
         if err != "":
             raise RuntimeError(err)
 
+    def from_arrow(
+        self,
+        sheet: str,
+        table: object,
+        cell: str = "A1",
+        header: bool = True,
+        styles: Optional[Dict[Union[str, int], int]] = None,
+    ) -> None:
+        """
+        Import a table to the worksheet by given worksheet name and starting
+        cell reference with the stream writer. The table can be a pyarrow Table
+        or RecordBatch, a pandas DataFrame, or a dictionary that maps the column
+        names to the values of the columns, see the 'write_table' function of
+        the stream writer for details. Note that the existing data of the
+        worksheet will be replaced.
+
+        Args:
+            sheet (str): The worksheet name
+            table (object): The table to be imported
+            cell (str): The starting cell reference, defaults to A1
+            header (bool): Write the names of the columns as the first row,
+                defaults to True
+            styles (Optional[Dict[Union[str, int], int]]): The optional style
+                ID of the cells of the columns by the column names or the
+                indexes of the columns
+
+        Returns:
+            None: Return None if no error occurred, otherwise raise a
+            RuntimeError with the message.
+
+        Example:
+            For example, import a pandas DataFrame to Sheet1:
+
+            ```python
+            try:
+                f.from_arrow("Sheet1", df)
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        sw = self.new_stream_writer(sheet)
+        sw.write_table(cell, table, header, styles)
+        sw.flush()
+
     def get_active_sheet_index(self) -> int:
         """
         Get active sheet index of the spreadsheet. If not found the active sheet
@@ -1433,10 +2579,65 @@ class File:
         Returns:
             int: The active sheet index
         """
-        lib.GetActiveSheetIndex.restype = c_int
         res = lib.GetActiveSheetIndex(self.file_index)
         return res
 
+    def get_all_rows(
+        self, sheets: Optional[List[str]] = None, *opts: Options, workers: int = 1
+    ) -> Dict[str, List[List[str]]]:
+        """
+        Return all the rows in the worksheets by given worksheet names, or in
+        all the worksheets of the workbook if the names are not given. The
+        worksheets are read one by one by default, or concurrently by up to the
+        given number of workers, and the rows of each worksheet are returned in
+        the same way as 'get_rows'.
+
+        Args:
+            sheets (Optional[List[str]]): The worksheet names
+            *opts (Options): Optional parameters for get cell values
+            workers (int): The maximum number of worksheets read at once,
+            default is 1
+
+        Returns:
+            Dict[str, List[List[str]]]: Return the rows of each worksheet by the
+            worksheet names if no error occurred, otherwise raise a
+            RuntimeError with the messages of all failed worksheets, one
+            worksheet per line.
+
+        Example:
+            For example, get the rows of all worksheets with 8 workers:
+
+            ```python
+            try:
+                for sheet, rows in f.get_all_rows(workers=8).items():
+                    print(sheet, len(rows))
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        names = POINTER(c_char_p)()
+        if sheets is not None:
+            names = (c_char_p * len(sheets))(*(s.encode(ENCODE) for s in sheets))
+        res = lib.GetAllRows(
+            self.file_index, names, len(sheets or []), workers, options
+        )
+        err, rows, errors = c_string_to_py(res.Err), {}, []
+        for sheet_rows in res.Sheets[: res.SheetsLen]:
+            if sheet_rows.Err:
+                errors.append(sheet_rows.Err.decode(ENCODE))
+                continue
+            sheet = sheet_rows.Sheet.decode(ENCODE)
+            rows[sheet] = [row for row in c_rows_to_py(sheet_rows) if row]
+        free_c_value(res)
+        if err or errors:
+            raise RuntimeError(err or "\n".join(errors))
+        return rows
+
     def get_app_props(self) -> Optional[AppProperties]:
         """
         Get document application properties.
@@ -1445,11 +2646,11 @@ class File:
             Optional[AppProperties]: Return the the app properties if no
             error occurred, otherwise raise a RuntimeError with the message.
         """
-        lib.GetAppProps.restype = types_go._GetAppPropsResult
         res = lib.GetAppProps(self.file_index)
-        err = res.err.decode(ENCODE)
+        err, opts = c_string_to_py(res.err), c_value_to_py(res.opts, AppProperties())
+        free_c_value(res)
         if not err:
-            return c_value_to_py(res.opts, AppProperties())
+            return opts
         raise RuntimeError(err)
 
     def get_cell_formula(self, sheet: str, cell: str) -> str:
@@ -1465,13 +2666,13 @@ class File:
             str: Return the cell formula string and an exception if no
             error occurred, otherwise raise a RuntimeError with the message.
         """
-        lib.GetCellFormula.restype = types_go._StringErrorResult
         res = lib.GetCellFormula(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         )
-        err = res.err.decode(ENCODE)
+        err, val = c_string_to_py(res.err), c_string_to_py(res.val)
+        free_c_value(res)
         if not err:
-            return res.val.decode(ENCODE)
+            return val
         raise RuntimeError(err)
 
     def get_cell_hyperlink(self, sheet: str, cell: str) -> Tuple[bool, str]:
@@ -1500,15 +2701,15 @@ class File:
                 print(err)
             ```
         """
-        lib.GetCellHyperLink.restype = types_go._GetCellHyperLinkResult
         res = lib.GetCellHyperLink(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         )
-        err = res.err.decode(ENCODE)
+        err, target = c_string_to_py(res.err), c_string_to_py(res.target)
+        free_c_value(res)
         if not err:
             return (
                 res.link,
-                res.target.decode(ENCODE),
+                target,
             )
         raise RuntimeError(err)
 
@@ -1524,11 +2725,11 @@ class File:
             int:  Return the cell style ID if no error occurred, otherwise raise
             a RuntimeError with the message.
         """
-        lib.GetCellStyle.restype = types_go._IntErrorResult
         res = lib.GetCellStyle(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         )
-        err = res.err.decode(ENCODE)
+        err = c_string_to_py(res.err)
+        free_c_value(res)
         if not err:
             return res.val
         raise RuntimeError(err)
@@ -1545,35 +2746,42 @@ class File:
             List[RichTextRun]: Return rich text runs if no error occurred,
             otherwise raise a RuntimeError with the message.
         """
-        lib.GetCellRichText.restype = types_go._GetCellRichTextResult
         res = lib.GetCellRichText(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
         )
         runs = c_value_to_py(res, GetCellRichTextResult()).runs
-        err = res.Err.decode(ENCODE)
+        err = c_string_to_py(res.Err)
+        free_c_value(res)
         if not err:
             return runs if runs else []
         raise RuntimeError(err)
 
-    def get_cell_value(self, sheet: str, cell: str, *opts: Options) -> str:
+    def get_cell_value(
+        self, sheet: str, cell: str, *opts: Options, typed: bool = False
+    ) -> Union[None, int, str, bool, float, datetime]:
         """
         Get formatted value from cell by given worksheet name and cell reference
         in spreadsheet. The return value is converted to the 'string' data type.
         This function is concurrency safe. If the cell format can be applied to
         the value of a cell, the applied value will be returned, otherwise the
         original value will be returned. All cells' values will be the same in a
-        merged range.
+        merged range. If typed is True, the raw value of the cell is returned in
+        the native Python data type by the cell type, the same as the
+        get_cell_values function.
 
         Args:
             sheet (str): The worksheet name
             cell (str): The cell reference
             *opts (Options): Optional parameters for get cell value
+            typed (bool): Return the value in the native Python data type
 
         Returns:
-            str: Return the cell value as a string if no error occurred,
-            otherwise raise a RuntimeError with the message.
+            Union[None, int, str, bool, float, datetime]: Return the cell value
+            as a string, or in the native data type if typed is True, if no
+            error occurred, otherwise raise a RuntimeError with the message.
         """
-        lib.GetCellValue.restype = types_go._StringErrorResult
+        if typed:
+            return self.get_cell_values(sheet, [cell], *opts, typed=True)[0]
         options = (
             byref(py_value_to_c(opts[0], types_go._Options()))
             if opts
@@ -1582,44 +2790,122 @@ class File:
         res = lib.GetCellValue(
             self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE), options
         )
-        err = res.err.decode(ENCODE)
+        err, val = c_string_to_py(res.err), c_string_to_py(res.val)
+        free_c_value(res)
         if not err:
-            return res.val.decode(ENCODE)
+            return val
         raise RuntimeError(err)
 
-    def get_col_outline_level(self, sheet: str, col: str) -> int:
-        """
-        Get outline level of a single column by given worksheet name and column
-        name.
+    def get_cell_values(
+        self,
+        sheet: str,
+        cells: Union[str, List[str]],
+        *opts: Options,
+        typed: bool = False,
+    ) -> Union[
+        List[Union[None, int, str, bool, float, datetime]],
+        List[List[Union[None, int, str, bool, float, datetime]]],
+    ]:
+        """
+        Get the values of cells in bulk by given worksheet name and a range
+        reference or a list of cell references, with a single call to the
+        library. The values of a range are returned as a list of rows. By
+        default, the formatted values are returned as strings, the same as the
+        get_cell_value function. If typed is True, the raw values are returned
+        by the cell types instead: integers and floats for numbers, booleans,
+        datetimes for date cells and the numbers with a date or time number
+        format, strings for text, formula and error cells, and None for the
+        empty cells. The rows of a range are read once, the list of cell
+        references is read cell by cell.
 
         Args:
             sheet (str): The worksheet name
-            col (str): The column name
+            cells (Union[str, List[str]]): The range reference, such as A1:C3,
+            or the list of cell references
+            *opts (Options): Optional parameters for get cell value
+            typed (bool): Return the values in the native Python data types
 
         Returns:
-            int: Return the column outline level if no error occurred, otherwise
-            raise a RuntimeError with the message.
+            Union[List[Union[None, int, str, bool, float, datetime]],
+            List[List[Union[None, int, str, bool, float, datetime]]]]: Return
+            the values of cells if no error occurred, otherwise raise a
+            RuntimeError with the message.
 
         Example:
-            For example, get outline level of column D in Sheet1:
+            For example, get the values of the cells in the range A1:C3 and the
+            typed values of the cells A1 and D5 on Sheet1:
 
             ```python
             try:
-                level = f.get_col_outline_level("Sheet1", "D")
+                rows = f.get_cell_values("Sheet1", "A1:C3")
+                values = f.get_cell_values("Sheet1", ["A1", "D5"], typed=True)
             except RuntimeError as err:
                 print(err)
             ```
         """
-        lib.GetColOutlineLevel.restype = types_go._IntErrorResult
-        res = lib.GetColOutlineLevel(
-            self.file_index, sheet.encode(ENCODE), col.encode(ENCODE)
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
         )
-        err = res.err.decode(ENCODE)
-        if not err:
-            return res.val
-        raise RuntimeError(err)
+        if isinstance(cells, str):
+            range_ref, refs = cells.encode(ENCODE), None
+        else:
+            range_ref = None
+            refs = (c_char_p * len(cells))(*[cell.encode(ENCODE) for cell in cells])
+        res = lib.GetCellValues(
+            self.file_index,
+            sheet.encode(ENCODE),
+            range_ref,
+            refs,
+            len(refs) if refs else 0,
+            typed,
+            options,
+        )
+        err, cols = c_string_to_py(res.Err), res.Cols
+        vals = (
+            [] if err else [c_interface_to_py(v) for v in res.Values[: res.ValuesLen]]
+        )
+        free_c_value(res)
+        if err:
+            raise RuntimeError(err)
+        if range_ref is None:
+            return vals
+        return [vals[i : i + cols] for i in range(0, len(vals), cols)]
 
-    def get_col_style(self, sheet: str, col: str) -> int:
+    def get_col_outline_level(self, sheet: str, col: str) -> int:
+        """
+        Get outline level of a single column by given worksheet name and column
+        name.
+
+        Args:
+            sheet (str): The worksheet name
+            col (str): The column name
+
+        Returns:
+            int: Return the column outline level if no error occurred, otherwise
+            raise a RuntimeError with the message.
+
+        Example:
+            For example, get outline level of column D in Sheet1:
+
+            ```python
+            try:
+                level = f.get_col_outline_level("Sheet1", "D")
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        res = lib.GetColOutlineLevel(
+            self.file_index, sheet.encode(ENCODE), col.encode(ENCODE)
+        )
+        err = c_string_to_py(res.err)
+        free_c_value(res)
+        if not err:
+            return res.val
+        raise RuntimeError(err)
+
+    def get_col_style(self, sheet: str, col: str) -> int:
         """
         Get column style ID by given worksheet name and column name.
 
@@ -1631,9 +2917,9 @@ class File:
             int: Return the column style ID if no error occurred, otherwise
             raise a RuntimeError with the message.
         """
-        lib.GetColStyle.restype = types_go._IntErrorResult
         res = lib.GetColStyle(self.file_index, sheet.encode(ENCODE), col.encode(ENCODE))
-        err = res.err.decode(ENCODE)
+        err = c_string_to_py(res.err)
+        free_c_value(res)
         if not err:
             return res.val
         raise RuntimeError(err)
@@ -1660,11 +2946,11 @@ class File:
                 print(err)
             ```
         """
-        lib.GetColVisible.restype = types_go._BoolErrorResult
         res = lib.GetColVisible(
             self.file_index, sheet.encode(ENCODE), col.encode(ENCODE)
         )
-        err = res.err.decode(ENCODE)
+        err = c_string_to_py(res.err)
+        free_c_value(res)
         if not err:
             return res.val
         raise RuntimeError(err)
@@ -1691,15 +2977,44 @@ class File:
                 print(err)
             ```
         """
-        lib.GetColWidth.restype = types_go._Float64ErrorResult
         res = lib.GetColWidth(
             self.file_index, sheet.encode(ENCODE), col.encode(ENCODE)
         )
-        err = res.err.decode(ENCODE)
+        err = c_string_to_py(res.err)
+        free_c_value(res)
         if not err:
             return res.val
         raise RuntimeError(err)
 
+    def get_cols(self, sheet: str, *opts: Options) -> List[List[str]]:
+        """
+        Return all the columns in a sheet by given worksheet name, returned as
+        a two-dimensional array, where the value of the cell is converted to
+        the string type. If the cell format can be applied to the value of the
+        cell, the applied value will be used, otherwise the original value will
+        be used.
+
+        Args:
+            sheet (str): The worksheet name
+            *opts (Options): Optional parameters for get columns
+
+        Returns:
+            List[List[str]]: Return all the columns in a sheet by given
+            worksheet name, returned as a two-dimensional array if no error
+            occurred, otherwise raise a RuntimeError with the message.
+        """
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        res = lib.GetCols(self.file_index, sheet.encode(ENCODE), options)
+        err, cols = c_string_to_py(res.err), c_rows_to_py(res)
+        free_c_value(res)
+        if not err:
+            return cols
+        raise RuntimeError(err)
+
     def get_default_font(self) -> str:
         """
         Get the default font name currently set in the workbook. The spreadsheet
@@ -1709,11 +3024,67 @@ class File:
             str: Return the font name if no error occurred, otherwise raise
             a RuntimeError with the message.
         """
-        lib.GetDefaultFont.restype = types_go._StringErrorResult
         res = lib.GetDefaultFont(self.file_index)
-        err = res.err.decode(ENCODE)
+        err, val = c_string_to_py(res.err), c_string_to_py(res.val)
+        free_c_value(res)
+        if not err:
+            return val
+        raise RuntimeError(err)
+
+    def get_dict_rows(
+        self, sheet: str, *opts: Options
+    ) -> Tuple[List[str], List[List[int]]]:
+        """
+        Return all the rows in a sheet by given worksheet name in dictionary
+        encoding, which is useful for the worksheets with a small vocabulary
+        repeated in many cells. Each distinct cell value is returned once in
+        the dictionary, and each row is returned as the indexes of the values
+        of its cells in the dictionary. The cell values are the same as the
+        get_rows function returns, and the blank rows are skipped as well.
+
+        Args:
+            sheet (str): The worksheet name
+            *opts (Options): Optional parameters for get rows
+
+        Returns:
+            Tuple[List[str], List[List[int]]]: Return the dictionary and the
+            indexes of the cell values of each row if no error occurred,
+            otherwise raise a RuntimeError with the message.
+
+        Example:
+            For example, get the rows of Sheet1 with the same string object for
+            the cells with the same value, and build a pandas categorical of
+            the first column:
+
+            ```python
+            try:
+                values, indexes = f.get_dict_rows("Sheet1")
+                rows = [[values[i] for i in row] for row in indexes]
+                col = pd.Categorical.from_codes(
+                    [row[0] for row in indexes], categories=values
+                )
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        res = lib.GetDictRows(self.file_index, sheet.encode(ENCODE), options)
+        err, values, rows = c_string_to_py(res.Err), [], []
         if not err:
-            return res.val.decode(ENCODE)
+            values = (c_string_matrix_to_py(res.Dict) or [[]])[0]
+            indexes = array("i", string_at(res.Indices, res.CellsLen * sizeof(c_int)))
+            start = 0
+            for row_len in res.RowLens[: res.RowsLen]:
+                if row_len:
+                    rows.append(indexes[start : start + row_len].tolist())
+                start += row_len
+        free_c_value(res)
+        if not err:
+            return values, rows
         raise RuntimeError(err)
 
     def get_row_visible(self, sheet: str, row: int) -> bool:
@@ -1738,14 +3109,24 @@ class File:
                 print(err)
             ```
         """
-        lib.GetRowVisible.restype = types_go._BoolErrorResult
-        res = lib.GetRowVisible(self.file_index, sheet.encode(ENCODE), c_int(row))
-        err = res.err.decode(ENCODE)
+        res = lib.GetRowVisible(self.file_index, sheet.encode(ENCODE), row)
+        err = c_string_to_py(res.err)
+        free_c_value(res)
         if not err:
             return res.val
         raise RuntimeError(err)
 
-    def get_rows(self, sheet: str, *opts: Options) -> List[List[str]]:
+    def get_rows(
+        self,
+        sheet: str,
+        *opts: Options,
+        typed: bool = False,
+        cell_types: bool = False,
+    ) -> Union[
+        List[List[str]],
+        List[List[Union[None, int, str, bool, float, datetime]]],
+        List[List[CellType]],
+    ]:
         """
         Return all the rows in a sheet by given worksheet name, returned as a
         two-dimensional array, where the value of the cell is converted to the
@@ -1755,36 +3136,76 @@ class File:
         continually blank cells in the tail of each row will be skipped, so the
         length of each row may be inconsistent.
 
+        If typed is True, the raw values of the cells are returned in the
+        native Python data types by the cell types instead: integers and floats
+        for numbers, booleans, datetimes for date cells and the numbers with a
+        date or time number format, strings for text, formula and error cells,
+        and None for the blank cells. If cell_types is True, only the types of
+        the cells are returned, the cells without type but with value are
+        numbers, which is useful to infer the schema of a worksheet.
+
         Args:
             sheet (str): The worksheet name
             *opts (Options): Optional parameters for get rows
+            typed (bool): Return the values in the native Python data types
+            cell_types (bool): Return the types of the cells only
 
         Returns:
-            List[List[str]]: Return all the rows in a sheet by given worksheet
-            name, returned as a two-dimensional array if no error occurred,
-            otherwise raise a RuntimeError with the message. Where the value of
-            the cell is converted to the string type. If the cell format can be
-            applied to the value of the cell, the applied value will be used,
-            otherwise the original value will be used. GetRows fetched the rows
-            with value or formula cells, the continually blank cells in the tail
-            of each row will be skipped, so the length of each row may be
-            inconsistent.
+            Union[List[List[str]],
+            List[List[Union[None, int, str, bool, float, datetime]]],
+            List[List[CellType]]]: Return all the rows in a sheet by given
+            worksheet name, returned as a two-dimensional array if no error
+            occurred, otherwise raise a RuntimeError with the message. Where the
+            value of the cell is converted to the string type. If the cell
+            format can be applied to the value of the cell, the applied value
+            will be used, otherwise the original value will be used. GetRows
+            fetched the rows with value or formula cells, the continually blank
+            cells in the tail of each row will be skipped, so the length of each
+            row may be inconsistent.
+
+        Example:
+            For example, get the typed values and the types of the cells on
+            Sheet1:
+
+            ```python
+            try:
+                rows = f.get_rows("Sheet1", typed=True)
+                types = f.get_rows("Sheet1", cell_types=True)
+            except RuntimeError as err:
+                print(err)
+            ```
         """
-        lib.GetRows.restype = types_go._GetRowsResult
         rows = []
         options = (
             byref(py_value_to_c(opts[0], types_go._Options()))
             if opts
             else POINTER(types_go._Options)()
         )
+        if typed or cell_types:
+            res = lib.GetTypedRows(
+                self.file_index, sheet.encode(ENCODE), options, cell_types
+            )
+            err = c_string_to_py(res.Err)
+            if not err:
+                values = res.Values[: res.ValuesLen]
+                values = (
+                    [CellType(value.Integer) for value in values]
+                    if cell_types
+                    else [c_interface_to_py(value) for value in values]
+                )
+                start = 0
+                for row_len in res.RowLens[: res.RowsLen]:
+                    if row_len:
+                        rows.append(values[start : start + row_len])
+                    start += row_len
+            free_c_value(res)
+            if not err:
+                return rows
+            raise RuntimeError(err)
         res = lib.GetRows(self.file_index, sheet.encode(ENCODE), options)
-        err = res.err.decode(ENCODE)
-        result = c_value_to_py(res, GetRowsResult()).row
-
-        if result:
-            for row in result:
-                if row.cell:
-                    rows.append([cell for cell in row.cell])
+        err = c_string_to_py(res.err)
+        rows = [row for row in c_rows_to_py(res) if row]
+        free_c_value(res)
         if not err:
             return rows
         raise RuntimeError(err)
@@ -1800,11 +3221,11 @@ class File:
             str: Return the sheet dimension if no error occurred, otherwise
             raise a RuntimeError with the message.
         """
-        lib.GetSheetDimension.restype = types_go._StringErrorResult
         res = lib.GetSheetDimension(self.file_index, sheet.encode(ENCODE))
-        err = res.err.decode(ENCODE)
+        err, val = c_string_to_py(res.err), c_string_to_py(res.val)
+        free_c_value(res)
         if not err:
-            return res.val.decode(ENCODE)
+            return val
         raise RuntimeError(err)
 
     def get_sheet_index(self, sheet: str) -> int:
@@ -1820,9 +3241,9 @@ class File:
             int: Return the sheet index if no error occurred, otherwise raise
             a RuntimeError with the message.
         """
-        lib.GetSheetIndex.restype = types_go._IntErrorResult
         res = lib.GetSheetIndex(self.file_index, sheet.encode(ENCODE))
-        err = res.err.decode(ENCODE)
+        err = c_string_to_py(res.err)
+        free_c_value(res)
         if not err:
             return res.val
         raise RuntimeError(err)
@@ -1840,11 +3261,11 @@ class File:
             str: Return the sheet name if the index is valid and if no
             error occurred, otherwise raise a RuntimeError with the message.
         """
-        lib.GetSheetName.restype = types_go._StringErrorResult
-        res = lib.GetSheetName(self.file_index, c_int(sheet))
-        err = res.err.decode(ENCODE)
+        res = lib.GetSheetName(self.file_index, sheet)
+        err, val = c_string_to_py(res.err), c_string_to_py(res.val)
+        free_c_value(res)
         if not err:
-            return res.val.decode(ENCODE)
+            return val
         raise RuntimeError(err)
 
     def get_style(self, style_id: int) -> Optional[Style]:
@@ -1858,11 +3279,11 @@ class File:
             Optional[Style]: Return the style object if no error occurred,
             otherwise raise a RuntimeError with the message.
         """
-        lib.GetStyle.restype = types_go._GetStyleResult
-        res = lib.GetStyle(self.file_index, c_int(style_id))
-        err = res.err.decode(ENCODE)
+        res = lib.GetStyle(self.file_index, style_id)
+        err, style = c_string_to_py(res.err), c_value_to_py(res.style, Style())
+        free_c_value(res)
         if not err:
-            return c_value_to_py(res.style, Style())
+            return style
         raise RuntimeError(err)
 
     def get_tables(self, sheet: str) -> List[Table]:
@@ -1876,10 +3297,10 @@ class File:
             List[Table]: Return the table list if no error occurred, otherwise
             raise a RuntimeError with the message.
         """
-        lib.GetTables.restype = types_go._GetTablesResult
         res = lib.GetTables(self.file_index, sheet.encode(ENCODE))
         tables = c_value_to_py(res, GetTablesResult()).tables
-        err = res.Err.decode(ENCODE)
+        err = c_string_to_py(res.Err)
+        free_c_value(res)
         if not err:
             return tables if tables else []
         raise RuntimeError(err)
@@ -1892,11 +3313,12 @@ class File:
             WorkbookPropsOptions: Return the workbook property options if no
             error occurred, otherwise raise a RuntimeError with the message.
         """
-        lib.GetWorkbookProps.restype = types_go._GetWorkbookPropsResult
         res = lib.GetWorkbookProps(self.file_index)
-        err = res.err.decode(ENCODE)
+        err = c_string_to_py(res.err)
+        opts = c_value_to_py(res.opts, WorkbookPropsOptions())
+        free_c_value(res)
         if not err:
-            return c_value_to_py(res.opts, WorkbookPropsOptions())
+            return opts
         raise RuntimeError(err)
 
     def group_sheets(self, sheets: List[str]) -> None:
@@ -1911,11 +3333,10 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.GroupSheets.restype = c_char_p
         array = (c_char_p * len(sheets))()
         for i, value in enumerate(sheets):
             array[i] = value.encode(ENCODE)
-        err = lib.GroupSheets(self.file_index, array, c_int(len(sheets))).decode(ENCODE)
+        err = c_error_to_py(lib.GroupSheets(self.file_index, array, len(sheets)))
         if err != "":
             raise RuntimeError(err)
 
@@ -1946,13 +3367,14 @@ class File:
                 print(err)
             ```
         """
-        lib.InsertCols.restype = c_char_p
-        err = lib.InsertCols(
-            self.file_index,
-            sheet.encode(ENCODE),
-            col.encode(ENCODE),
-            c_int(n),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.InsertCols(
+                self.file_index,
+                sheet.encode(ENCODE),
+                col.encode(ENCODE),
+                n,
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -1971,12 +3393,13 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.InsertPageBreak.restype = c_char_p
-        err = lib.InsertPageBreak(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.InsertPageBreak(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2007,13 +3430,14 @@ class File:
                 print(err)
             ```
         """
-        lib.InsertRows.restype = c_char_p
-        err = lib.InsertRows(
-            self.file_index,
-            sheet.encode(ENCODE),
-            c_int(row),
-            c_int(n),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.InsertRows(
+                self.file_index,
+                sheet.encode(ENCODE),
+                row,
+                n,
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2033,13 +3457,14 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.MergeCell.restype = c_char_p
-        err = lib.MergeCell(
-            self.file_index,
-            sheet.encode(ENCODE),
-            top_left_cell.encode(ENCODE),
-            bottom_right_cell.encode(ENCODE),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.MergeCell(
+                self.file_index,
+                sheet.encode(ENCODE),
+                top_left_cell.encode(ENCODE),
+                bottom_right_cell.encode(ENCODE),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2069,12 +3494,13 @@ class File:
                 print(err)
             ```
         """
-        lib.MoveSheet.restype = c_char_p
-        err = lib.MoveSheet(
-            self.file_index,
-            source.encode(ENCODE),
-            target.encode(ENCODE),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.MoveSheet(
+                self.file_index,
+                source.encode(ENCODE),
+                target.encode(ENCODE),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2090,10 +3516,10 @@ class File:
             int: Return the style index if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.NewConditionalStyle.restype = types_go._IntErrorResult
         options = py_value_to_c(style, types_go._Style())
         res = lib.NewConditionalStyle(self.file_index, byref(options))
-        err = res.err.decode(ENCODE)
+        err = c_string_to_py(res.err)
+        free_c_value(res)
         if not err:
             return res.val
         raise RuntimeError(err)
@@ -2111,9 +3537,9 @@ class File:
             int: Return the index of the new sheet if no error occurred,
             otherwise raise a RuntimeError with the message.
         """
-        lib.NewSheet.restype = types_go._IntErrorResult
         res = lib.NewSheet(self.file_index, sheet.encode(ENCODE))
-        err = res.err.decode(ENCODE)
+        err = c_string_to_py(res.err)
+        free_c_value(res)
         if not err:
             return res.val
         raise RuntimeError(err)
@@ -2161,9 +3587,9 @@ class File:
                     print(err)
             ```
         """
-        lib.NewStreamWriter.restype = types_go._IntErrorResult
         res = lib.NewStreamWriter(self.file_index, sheet.encode(ENCODE))
-        err = res.err.decode(ENCODE)
+        err = c_string_to_py(res.err)
+        free_c_value(res)
         if not err:
             return StreamWriter(res.val)
         raise RuntimeError(err)
@@ -2182,10 +3608,10 @@ class File:
             int: Return the style index if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.NewStyle.restype = types_go._IntErrorResult
         options = py_value_to_c(style, types_go._Style())
         res = lib.NewStyle(self.file_index, byref(options))
-        err = res.err.decode(ENCODE)
+        err = c_string_to_py(res.err)
+        free_c_value(res)
         if not err:
             return res.val
         raise RuntimeError(err)
@@ -2222,11 +3648,10 @@ class File:
                 print(err)
             ```
         """
-        lib.ProtectSheet.restype = c_char_p
         options = py_value_to_c(opts, types_go._SheetProtectionOptions())
-        err = lib.ProtectSheet(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.ProtectSheet(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2259,9 +3684,8 @@ class File:
                 print(err)
             ```
         """
-        lib.ProtectWorkbook.restype = c_char_p
         options = py_value_to_c(opts, types_go._WorkbookProtectionOptions())
-        err = lib.ProtectWorkbook(self.file_index, byref(options)).decode(ENCODE)
+        err = c_error_to_py(lib.ProtectWorkbook(self.file_index, byref(options)))
         if err != "":
             raise RuntimeError(err)
 
@@ -2291,10 +3715,9 @@ class File:
                 print(err)
             ```
         """
-        lib.RemoveCol.restype = c_char_p
-        err = lib.RemoveCol(
-            self.file_index, sheet.encode(ENCODE), col.encode(ENCODE)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.RemoveCol(self.file_index, sheet.encode(ENCODE), col.encode(ENCODE))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2310,10 +3733,11 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.RemovePageBreak.restype = c_char_p
-        err = lib.RemovePageBreak(
-            self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.RemovePageBreak(
+                self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE)
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2343,13 +3767,71 @@ class File:
                 print(err)
             ```
         """
-        lib.RemoveRow.restype = c_char_p
-        err = lib.RemoveRow(self.file_index, sheet.encode(ENCODE), c_int(row)).decode(
-            ENCODE
-        )
+        err = c_error_to_py(lib.RemoveRow(self.file_index, sheet.encode(ENCODE), row))
         if err != "":
             raise RuntimeError(err)
 
+    def rows(
+        self, sheet: str, *opts: Options, batch_size: int = 1000
+    ) -> Iterator[List[str]]:
+        """
+        Return a generator over the rows in a sheet by given worksheet name,
+        used for streaming reading data for a worksheet with a large data. The
+        rows are transferred from the worksheet in batches of the given size, so
+        the memory usage is bounded no matter how many rows the worksheet has.
+        The value of the cell is converted to the string type in the same way
+        as 'get_rows', the continually blank cells in the tail of each row will
+        be skipped, and the blank rows will be returned as empty lists.
+
+        Args:
+            sheet (str): The worksheet name
+            *opts (Options): Optional parameters for get cell values
+            batch_size (int): The number of rows read in each batch, default is
+            1000
+
+        Returns:
+            Iterator[List[str]]: Return a generator over the rows of the
+            worksheet, raise a RuntimeError with the message when an error
+            occurred during iteration.
+
+        Example:
+            For example, get and traverse the value of all cells by rows on a
+            worksheet named 'Sheet1':
+
+            ```python
+            try:
+                for row in f.rows("Sheet1", batch_size=5000):
+                    for cell in row:
+                        print(f"{cell}\t", end="")
+                    print()
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        res = lib.Rows(self.file_index, sheet.encode(ENCODE), options)
+        err = c_string_to_py(res.err)
+        free_c_value(res)
+        if err:
+            raise RuntimeError(err)
+        rows_index = res.val
+        try:
+            while True:
+                res = lib.RowsNext(rows_index, batch_size)
+                err, rows = c_string_to_py(res.err), c_rows_to_py(res)
+                free_c_value(res)
+                if err:
+                    raise RuntimeError(err)
+                if not rows:
+                    break
+                yield from rows
+        finally:
+            c_error_to_py(lib.RowsClose(rows_index))
+
     def search_sheet(self, sheet: str, value: str, *reg: bool) -> List[str]:
         """
         Get cell reference by given worksheet name, cell value, and regular
@@ -2388,17 +3870,16 @@ class File:
                 print(err)
             ```
         """
-        lib.SearchSheet.restype = types_go._StringArrayErrorResult
         res = lib.SearchSheet(
             self.file_index,
             sheet.encode(ENCODE),
             value.encode(ENCODE),
             reg[0] if reg else False,
         )
-        arr = c_value_to_py(res, StringArrayErrorResult()).arr
-        err = res.Err.decode(ENCODE)
+        err, rows = c_string_to_py(res.err), c_rows_to_py(res)
+        free_c_value(res)
         if not err:
-            return arr if arr else []
+            return rows[0] if rows else []
         raise RuntimeError(err)
 
     def set_active_sheet(self, index: int) -> None:
@@ -2415,8 +3896,7 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        err, lib.SetActiveSheet.restype = None, c_char_p
-        err = lib.SetActiveSheet(self.file_index, index).decode(ENCODE)
+        err = c_error_to_py(lib.SetActiveSheet(self.file_index, index))
         if err != "":
             raise RuntimeError(err)
 
@@ -2434,10 +3914,11 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        err, lib.SetCellBool.restype = None, c_char_p
-        err = lib.SetCellBool(
-            self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE), value
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetCellBool(
+                self.file_index, sheet.encode(ENCODE), cell.encode(ENCODE), value
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2463,19 +3944,20 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        err, lib.SetCellFormula.restype = None, c_char_p
         options = (
             byref(py_value_to_c(opts[0], types_go._FormulaOpts()))
             if opts
             else POINTER(types_go._FormulaOpts)()
         )
-        err = lib.SetCellFormula(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-            formula.encode(ENCODE),
-            options,
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetCellFormula(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+                formula.encode(ENCODE),
+                options,
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2532,20 +4014,21 @@ class File:
                 print(err)
             ```
         """
-        err, lib.SetCellHyperLink.restype = None, c_char_p
         options = (
             byref(py_value_to_c(opts[0], types_go._HyperlinkOpts()))
             if opts
             else POINTER(types_go._HyperlinkOpts)()
         )
-        err = lib.SetCellHyperLink(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-            link.encode(ENCODE),
-            link_type.encode(ENCODE),
-            options,
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetCellHyperLink(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+                link.encode(ENCODE),
+                link_type.encode(ENCODE),
+                options,
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2563,13 +4046,14 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetCellInt.restype = c_char_p
-        err = lib.SetCellInt(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-            value,
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetCellInt(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+                value,
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2696,17 +4180,18 @@ class File:
                     print(err)
             ```
         """
-        lib.SetCellRichText.restype = c_char_p
         vals = (types_go._RichTextRun * len(runs))()
         for i, value in enumerate(runs):
             vals[i] = py_value_to_c(value, types_go._RichTextRun())
-        err = lib.SetCellRichText(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-            byref(vals),
-            len(vals),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetCellRichText(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+                vals,
+                len(vals),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2724,13 +4209,14 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetCellStr.restype = c_char_p
-        err = lib.SetCellStr(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-            value.encode(ENCODE),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetCellStr(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+                value.encode(ENCODE),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2758,14 +4244,15 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetCellStyle.restype = c_char_p
-        err = lib.SetCellStyle(
-            self.file_index,
-            sheet.encode(ENCODE),
-            top_left_cell.encode(ENCODE),
-            bottom_right_cell.encode(ENCODE),
-            style_id,
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetCellStyle(
+                self.file_index,
+                sheet.encode(ENCODE),
+                top_left_cell.encode(ENCODE),
+                bottom_right_cell.encode(ENCODE),
+                style_id,
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2796,13 +4283,63 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetCellValue.restype = c_char_p
-        err = lib.SetCellValue(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-            byref(py_value_to_c_interface(value)),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetCellValue(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+                byref(py_value_to_c_interface(value)),
+            )
+        )
+        if err != "":
+            raise RuntimeError(err)
+
+    def set_cells(
+        self,
+        sheet: str,
+        cells: Union[
+            Dict[str, Union[None, int, str, bool, datetime, date]],
+            Iterable[Tuple],
+        ],
+    ) -> None:
+        """
+        Set the values of cells in bulk by given worksheet name and the values
+        of the cells, with a single call to the library. The cells can be a
+        dictionary that maps the cell reference to the cell value, or an
+        iterable of (cell, value) or (cell, value, style_id) tuples, a style ID
+        of 0 keeps the style of the cell. All cells are set even if some of
+        them failed, and the errors of the failed cells are reported together.
+
+        Args:
+            sheet (str): The worksheet name
+            cells (Union[Dict[str, Union[None, int, str, bool, datetime, date]],
+            Iterable[Tuple]]): The cell values
+
+        Returns:
+            None: Return None if no error occurred, otherwise raise a
+            RuntimeError with the message of each failed cell in a line.
+
+        Example:
+            For example, set the values of the cells A1, B1 and C1, and apply a
+            style to the cell C1 on Sheet1:
+
+            ```python
+            try:
+                f.set_cells("Sheet1", {"A1": "Name", "B1": 100})
+                f.set_cells("Sheet1", [("C1", 3.5, style_id)])
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        items = list(cells.items()) if isinstance(cells, dict) else list(cells)
+        vals = (types_go._CellValue * len(items))()
+        for i, (cell, value, *style_id) in enumerate(items):
+            vals[i].Cell = cell.encode(ENCODE)
+            vals[i].Value = py_value_to_c_interface(value)
+            vals[i].StyleID = style_id[0] if style_id else 0
+        err = c_error_to_py(
+            lib.SetCells(self.file_index, sheet.encode(ENCODE), vals, len(vals))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2830,10 +4367,11 @@ class File:
                 print(err)
             ```
         """
-        lib.SetColOutlineLevel.restype = c_char_p
-        err = lib.SetColOutlineLevel(
-            self.file_index, sheet.encode(ENCODE), col.encode(ENCODE), level
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetColOutlineLevel(
+                self.file_index, sheet.encode(ENCODE), col.encode(ENCODE), level
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2863,10 +4401,11 @@ class File:
                 print(err)
             ```
         """
-        lib.SetColStyle.restype = c_char_p
-        err = lib.SetColStyle(
-            self.file_index, sheet.encode(ENCODE), columns.encode(ENCODE), style_id
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetColStyle(
+                self.file_index, sheet.encode(ENCODE), columns.encode(ENCODE), style_id
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2894,10 +4433,11 @@ class File:
                 print(err)
             ```
         """
-        lib.SetColVisible.restype = c_char_p
-        err = lib.SetColVisible(
-            self.file_index, sheet.encode(ENCODE), columns.encode(ENCODE), visible
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetColVisible(
+                self.file_index, sheet.encode(ENCODE), columns.encode(ENCODE), visible
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2927,14 +4467,15 @@ class File:
                 print(err)
             ```
         """
-        lib.SetColWidth.restype = c_char_p
-        err = lib.SetColWidth(
-            self.file_index,
-            sheet.encode(ENCODE),
-            start_col.encode(ENCODE),
-            end_col.encode(ENCODE),
-            c_double(width),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetColWidth(
+                self.file_index,
+                sheet.encode(ENCODE),
+                start_col.encode(ENCODE),
+                end_col.encode(ENCODE),
+                c_double(width),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2958,17 +4499,18 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetConditionalFormat.restype = c_char_p
         vals = (types_go._ConditionalFormatOptions * len(opts))()
         for i, value in enumerate(opts):
             vals[i] = py_value_to_c(value, types_go._ConditionalFormatOptions())
-        err = lib.SetConditionalFormat(
-            self.file_index,
-            sheet.encode(ENCODE),
-            range_ref.encode(ENCODE),
-            byref(vals),
-            len(vals),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetConditionalFormat(
+                self.file_index,
+                sheet.encode(ENCODE),
+                range_ref.encode(ENCODE),
+                vals,
+                len(vals),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -2984,9 +4526,8 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetDefaultFont.restype = c_char_p
-        err = lib.SetDefaultFont(self.file_index, font_name.encode(ENCODE)).decode(
-            ENCODE
+        err = c_error_to_py(
+            lib.SetDefaultFont(self.file_index, font_name.encode(ENCODE))
         )
         if err != "":
             raise RuntimeError(err)
@@ -3018,9 +4559,8 @@ class File:
                 print(err)
             ```
         """
-        lib.SetDefinedName.restype = c_char_p
         options = py_value_to_c(defined_name, types_go._DefinedName())
-        err = lib.SetDefinedName(self.file_index, byref(options)).decode(ENCODE)
+        err = c_error_to_py(lib.SetDefinedName(self.file_index, byref(options)))
         if err != "":
             raise RuntimeError(err)
 
@@ -3062,9 +4602,8 @@ class File:
                 print(err)
             ```
         """
-        lib.SetDocProps.restype = c_char_p
         options = py_value_to_c(doc_properties, types_go._DocProperties())
-        err = lib.SetDocProps(self.file_index, byref(options)).decode(ENCODE)
+        err = c_error_to_py(lib.SetDocProps(self.file_index, byref(options)))
         if err != "":
             raise RuntimeError(err)
 
@@ -3102,11 +4641,10 @@ class File:
                 print(err)
             ```
         """
-        lib.SetHeaderFooter.restype = c_char_p
         options = py_value_to_c(opts, types_go._HeaderFooterOptions())
-        err = lib.SetHeaderFooter(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetHeaderFooter(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3122,11 +4660,10 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetPageLayout.restype = c_char_p
         options = py_value_to_c(opts, types_go._PageLayoutOptions())
-        err = lib.SetPageLayout(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetPageLayout(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3142,11 +4679,10 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetPageMargins.restype = c_char_p
         options = py_value_to_c(opts, types_go._PageLayoutMarginsOptions())
-        err = lib.SetPageMargins(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetPageMargins(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3163,11 +4699,10 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetPanes.restype = c_char_p
         options = py_value_to_c(opts, types_go._Panes())
-        err = lib.SetPanes(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetPanes(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3196,10 +4731,11 @@ class File:
                 print(err)
             ```
         """
-        lib.SetRowHeight.restype = c_char_p
-        err = lib.SetRowHeight(
-            self.file_index, sheet.encode(ENCODE), c_int(row), c_double(height)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetRowHeight(
+                self.file_index, sheet.encode(ENCODE), row, c_double(height)
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3227,10 +4763,9 @@ class File:
                 print(err)
             ```
         """
-        lib.SetRowOutlineLevel.restype = c_char_p
-        err = lib.SetRowOutlineLevel(
-            self.file_index, sheet.encode(ENCODE), c_int(row), c_int(level)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetRowOutlineLevel(self.file_index, sheet.encode(ENCODE), row, level)
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3260,14 +4795,15 @@ class File:
                 print(err)
             ```
         """
-        lib.SetRowStyle.restype = c_char_p
-        err = lib.SetRowStyle(
-            self.file_index,
-            sheet.encode(ENCODE),
-            c_int(start),
-            c_int(end),
-            c_int(style_id),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetRowStyle(
+                self.file_index,
+                sheet.encode(ENCODE),
+                start,
+                end,
+                style_id,
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3295,13 +4831,14 @@ class File:
                 print(err)
             ```
         """
-        lib.SetRowVisible.restype = c_char_p
-        err = lib.SetRowVisible(
-            self.file_index,
-            sheet.encode(ENCODE),
-            c_int(row),
-            c_bool(visible),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetRowVisible(
+                self.file_index,
+                sheet.encode(ENCODE),
+                row,
+                c_bool(visible),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3319,12 +4856,13 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetSheetBackground.restype = c_char_p
-        err = lib.SetSheetBackground(
-            self.file_index,
-            sheet.encode(ENCODE),
-            picture.encode(ENCODE),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetSheetBackground(
+                self.file_index,
+                sheet.encode(ENCODE),
+                picture.encode(ENCODE),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3345,14 +4883,15 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetSheetBackgroundFromBytes.restype = c_char_p
-        err = lib.SetSheetBackgroundFromBytes(
-            self.file_index,
-            sheet.encode(ENCODE),
-            extension.encode(ENCODE),
-            cast(picture, POINTER(c_ubyte)),
-            len(picture),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetSheetBackgroundFromBytes(
+                self.file_index,
+                sheet.encode(ENCODE),
+                extension.encode(ENCODE),
+                cast(picture, POINTER(c_ubyte)),
+                len(picture),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3376,17 +4915,18 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetSheetCol.restype = c_char_p
         vals = (types_go._Interface * len(values))()
         for i, value in enumerate(values):
             vals[i] = py_value_to_c_interface(value)
-        err = lib.SetSheetCol(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-            byref(vals),
-            len(vals),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetSheetCol(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+                vals,
+                len(vals),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3406,12 +4946,13 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetSheetDimension.restype = c_char_p
-        err = lib.SetSheetDimension(
-            self.file_index,
-            sheet.encode(ENCODE),
-            range_ref.encode(ENCODE),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetSheetDimension(
+                self.file_index,
+                sheet.encode(ENCODE),
+                range_ref.encode(ENCODE),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3431,12 +4972,13 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetSheetName.restype = c_char_p
-        err = lib.SetSheetName(
-            self.file_index,
-            source.encode(ENCODE),
-            target.encode(ENCODE),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetSheetName(
+                self.file_index,
+                source.encode(ENCODE),
+                target.encode(ENCODE),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3452,11 +4994,10 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetSheetProps.restype = c_char_p
         options = py_value_to_c(opts, types_go._SheetPropsOptions())
-        err = lib.SetSheetProps(
-            self.file_index, sheet.encode(ENCODE), byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetSheetProps(self.file_index, sheet.encode(ENCODE), byref(options))
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3480,17 +5021,18 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetSheetRow.restype = c_char_p
         vals = (types_go._Interface * len(values))()
         for i, value in enumerate(values):
             vals[i] = py_value_to_c_interface(value)
-        err = lib.SetSheetRow(
-            self.file_index,
-            sheet.encode(ENCODE),
-            cell.encode(ENCODE),
-            byref(vals),
-            len(vals),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetSheetRow(
+                self.file_index,
+                sheet.encode(ENCODE),
+                cell.encode(ENCODE),
+                vals,
+                len(vals),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3508,11 +5050,12 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetSheetView.restype = c_char_p
         options = py_value_to_c(opts, types_go._ViewOptions())
-        err = lib.SetSheetView(
-            self.file_index, sheet.encode(ENCODE), view_index, byref(options)
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetSheetView(
+                self.file_index, sheet.encode(ENCODE), view_index, byref(options)
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3532,13 +5075,12 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetSheetVisible.restype = c_char_p
         vh = False
         if len(very_hidden) > 0:
             vh = very_hidden[0]
-        err = lib.SetSheetVisible(
-            self.file_index, sheet.encode(ENCODE), visible, vh
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.SetSheetVisible(self.file_index, sheet.encode(ENCODE), visible, vh)
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3553,22 +5095,195 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.SetWorkbookProps.restype = c_char_p
         options = py_value_to_c(opts, types_go._WorkbookPropsOptions())
-        err = lib.SetWorkbookProps(self.file_index, byref(options)).decode(ENCODE)
+        err = c_error_to_py(lib.SetWorkbookProps(self.file_index, byref(options)))
         if err != "":
             raise RuntimeError(err)
 
-    def ungroup_sheets(self) -> None:
+    def to_arrow(
+        self, sheet: str, range_ref: str = "", *opts: Options, header: bool = False
+    ) -> "pyarrow.Table":
         """
-        Ungroup worksheets.
+        Export the cells in the range of the worksheet to a pyarrow Table by
+        given worksheet name and range reference, the used range of the
+        worksheet will be exported if the range reference is empty. The values
+        are read column by column into buffers in the Arrow columnar format by
+        the library, without creating Python objects for the cells, and the
+        arrays of the table use the buffers in place without copying. A column
+        of numbers is a float64 column, other columns are large_string columns
+        with 64-bit offsets, and the blank cells are nulls. This function
+        requires the pyarrow package.
+
+        Args:
+            sheet (str): The worksheet name
+            range_ref (str): The range reference, such as A1:C10
+            *opts (Options): Optional parameters for get rows
+            header (bool): Use the first row of the range as the names of the
+            columns, otherwise the columns are named by the column names
+
+        Returns:
+            pyarrow.Table: Return the table if no error occurred, otherwise
+            raise a RuntimeError with the message.
+
+        Example:
+            For example, export the cells in the range A1:D100 on Sheet1 with
+            the header row:
+
+            ```python
+            try:
+                table = f.to_arrow("Sheet1", "A1:D100", header=True)
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        import pyarrow
+
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        res = lib.GetColumnBuffers(
+            self.file_index,
+            sheet.encode(ENCODE),
+            range_ref.encode(ENCODE) if range_ref else None,
+            header,
+            options,
+            None,
+            0,
+        )
+        err = c_string_to_py(res.Err)
+        if err:
+            free_c_value(res)
+            raise RuntimeError(err)
+        columns = ColumnBuffers(res).columns
+        return pyarrow.Table.from_arrays(
+            [
+                pyarrow.Array.from_buffers(
+                    pyarrow.float64() if typ == 3 else pyarrow.large_string(),
+                    length,
+                    [pyarrow.py_buffer(validity)]
+                    + ([pyarrow.py_buffer(offsets)] if offsets else [])
+                    + [pyarrow.py_buffer(values)],
+                    null_count,
+                )
+                for _, typ, length, null_count, validity, values, offsets in columns
+            ],
+            names=[col[0] for col in columns],
+        )
+
+    def to_numpy(
+        self,
+        sheet: str,
+        range_ref: str = "",
+        *opts: Options,
+        header: bool = False,
+        out: Optional[Dict[str, "numpy.ndarray"]] = None,
+    ) -> Dict[str, "numpy.ndarray"]:
+        """
+        Export the cells in the range of the worksheet to NumPy arrays by given
+        worksheet name and range reference, the used range of the worksheet
+        will be exported if the range reference is empty. The values are read
+        column by column into buffers by the library. A column of numbers is a
+        float64 array, in which the blank cells are NaN, other columns are
+        object arrays of strings, in which the blank cells are None. The float64
+        arrays use the buffers of the library in place without copying, or the
+        library writes the values of the columns directly into the arrays given
+        by the out argument. This function requires the numpy package.
+
+        Args:
+            sheet (str): The worksheet name
+            range_ref (str): The range reference, such as A1:C10
+            *opts (Options): Optional parameters for get rows
+            header (bool): Use the first row of the range as the names of the
+            columns, otherwise the columns are named by the column names
+            out (Optional[Dict[str, numpy.ndarray]]): The optional contiguous
+            and writable float64 arrays for the values of the number columns
+            by the names of the columns, each of them must be large enough for
+            the column. The returned array of the column is the leading part of
+            the given array.
+
+        Returns:
+            Dict[str, numpy.ndarray]: Return the arrays of the columns by the
+            names of the columns if no error occurred, otherwise raise a
+            RuntimeError with the message.
+
+        Example:
+            For example, export the used range on Sheet1 with the header row:
+
+            ```python
+            try:
+                arrays = f.to_numpy("Sheet1", header=True)
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        import numpy
+
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        out = out or {}
+        bufs = (types_go._ColumnBuffer * len(out))()
+        for buf, (name, arr) in zip(bufs, out.items()):
+            if (
+                not isinstance(arr, numpy.ndarray)
+                or arr.dtype != numpy.float64
+                or not arr.flags.c_contiguous
+                or not arr.flags.writeable
+            ):
+                raise RuntimeError("invalid argument data type")
+            buf.Name, buf.Length = name.encode(ENCODE), arr.size
+            buf.Type, buf.Float64 = 3, arr.ctypes.data
+        res = lib.GetColumnBuffers(
+            self.file_index,
+            sheet.encode(ENCODE),
+            range_ref.encode(ENCODE) if range_ref else None,
+            header,
+            options,
+            bufs,
+            len(bufs),
+        )
+        err = c_string_to_py(res.Err)
+        if err:
+            free_c_value(res)
+            raise RuntimeError(err)
+        arrays = {}
+        for name, typ, length, _, validity, values, offsets in ColumnBuffers(
+            res
+        ).columns:
+            if typ == 3:
+                arrays[name] = (
+                    numpy.frombuffer(values, dtype=numpy.float64)
+                    if values is not None
+                    else out[name].reshape(-1)[:length]
+                )
+                continue
+            offsets, data = numpy.frombuffer(offsets, dtype=numpy.int64), bytes(values)
+            arrays[name] = numpy.array(
+                [
+                    (
+                        data[offsets[i] : offsets[i + 1]].decode(ENCODE)
+                        if validity[i // 8] >> (i % 8) & 1
+                        else None
+                    )
+                    for i in range(length)
+                ],
+                dtype=object,
+            )
+        return arrays
+
+    def ungroup_sheets(self) -> None:
+        """
+        Ungroup worksheets.
 
         Returns:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.UngroupSheets.restype = c_char_p
-        err = lib.UngroupSheets(self.file_index).decode(ENCODE)
+        err = c_error_to_py(lib.UngroupSheets(self.file_index))
         if err != "":
             raise RuntimeError(err)
 
@@ -3597,13 +5312,14 @@ class File:
                 print(err)
             ```
         """
-        lib.UnmergeCell.restype = c_char_p
-        err = lib.UnmergeCell(
-            self.file_index,
-            sheet.encode(ENCODE),
-            top_left_cell.encode(ENCODE),
-            bottom_right_cell.encode(ENCODE),
-        ).decode(ENCODE)
+        err = c_error_to_py(
+            lib.UnmergeCell(
+                self.file_index,
+                sheet.encode(ENCODE),
+                top_left_cell.encode(ENCODE),
+                bottom_right_cell.encode(ENCODE),
+            )
+        )
         if err != "":
             raise RuntimeError(err)
 
@@ -3621,10 +5337,216 @@ class File:
             None: Return None if no error occurred, otherwise raise a
             RuntimeError with the message.
         """
-        lib.UpdateLinkedValue.restype = c_char_p
-        err = lib.UpdateLinkedValue(self.file_index).decode(ENCODE)
+        err = c_error_to_py(lib.UpdateLinkedValue(self.file_index))
+        if err != "":
+            raise RuntimeError(err)
+
+    def write_to(self, writer: BinaryIO, *opts: Options) -> int:
+        """
+        Write the spreadsheet to the given writable object, such as a file
+        opened in binary mode, a socket stream or a web response. The workbook
+        is packed and passed to the 'write' method of the object in chunks, so
+        it never has to be held in memory as a whole.
+
+        Args:
+            writer (BinaryIO): The writable object
+            *opts (Options): Optional parameters for writing the file
+
+        Returns:
+            int: Return the number of bytes written if no error occurred,
+            otherwise raise a RuntimeError with the message. The exception
+            raised by the 'write' method of the writer will be re-raised.
+
+        Example:
+            For example, write the spreadsheet to a file:
+
+            ```python
+            try:
+                with open("Book1.xlsx", "wb") as file:
+                    f.write_to(file)
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        written, errors = 0, []
+
+        def write(p: int, n: int) -> int:
+            nonlocal written
+            try:
+                writer.write(string_at(p, n))
+            except Exception as err:
+                errors.append(err)
+                return -1
+            written += n
+            return n
+
+        options = (
+            byref(py_value_to_c(opts[0], types_go._Options()))
+            if opts
+            else POINTER(types_go._Options)()
+        )
+        err = c_error_to_py(
+            lib.WriteTo(self.file_index, types_go._Writer(write), options)
+        )
+        if errors:
+            raise errors[0]
         if err != "":
             raise RuntimeError(err)
+        return written
+
+    def write_to_buffer(self, *opts: Options) -> bytes:
+        """
+        Get the contents of the spreadsheet as bytes, without saving it to a
+        file on disk.
+
+        Args:
+            *opts (Options): Optional parameters for writing the file
+
+        Returns:
+            bytes: Return the contents of the spreadsheet if no error occurred,
+            otherwise raise a RuntimeError with the message.
+
+        Example:
+            For example, get the contents of the spreadsheet as the body of a
+            HTTP response:
+
+            ```python
+            try:
+                body = f.write_to_buffer()
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        buf = BytesIO()
+        self.write_to(buf, *opts)
+        return buf.getvalue()
+
+
+class AsyncFile:
+    """
+    AsyncFile is an asyncio facade of a workbook, for using the workbook in an
+    event loop without blocking it. Any function of the File object can be
+    awaited on the AsyncFile object by the same name and arguments, for
+    example 'await af.save_as("Book1.xlsx")', the call runs on a bounded thread
+    pool since the library releases the GIL, and the calls on the same
+    workbook run in the order they were made. A cancelled call still runs to
+    the end in the thread pool before the next call on the workbook starts.
+    """
+
+    file: File
+    executor: Executor
+
+    def __init__(self, file: File, executor: Optional[Executor] = None):
+        """
+        Create an asyncio facade of the workbook.
+
+        Args:
+            file (File): The workbook
+            executor (Optional[Executor]): The executor to run the calls on,
+                defaults to a shared thread pool with a thread per processor
+        """
+        self.file, self.executor = file, executor or default_async_executor()
+        self.queue: Optional[asyncio.Lock] = None
+        self.closing: Optional[asyncio.Task] = None
+
+    def __getattr__(self, name: str) -> Callable:
+        func = getattr(self.file, name)
+
+        async def call(*args, **kwargs):
+            return await self.run(partial(func, *args, **kwargs))
+
+        return call
+
+    async def __aenter__(self) -> "AsyncFile":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def run(self, func: Callable) -> object:
+        """
+        Run the function on the executor after the earlier calls on the
+        workbook have been done.
+
+        Args:
+            func (Callable): The function to be called without arguments
+
+        Returns:
+            object: Return the result of the function, or raise the exception
+            raised by it.
+        """
+        if self.queue is None:
+            self.queue = asyncio.Lock()
+        await self.queue.acquire()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(self.executor, func)
+        except BaseException:
+            self.queue.release()
+            raise
+
+        def done(future):
+            self.queue.release()
+            if not future.cancelled():
+                future.exception()
+
+        future.add_done_callback(done)
+        return await asyncio.shield(future)
+
+    async def close(self) -> None:
+        """
+        Close the workbook after the earlier calls on it have been done. The
+        workbook will be closed even if the close is cancelled, and closing the
+        workbook again waits for the first close.
+
+        Returns:
+            None: Return None if no error occurred, otherwise raise a
+            RuntimeError with the message.
+        """
+        if self.closing is None:
+            self.closing = asyncio.ensure_future(self.run(self.file.close))
+        await asyncio.shield(self.closing)
+
+    async def rows(
+        self, sheet: str, *opts: Options, batch_size: int = 1000
+    ) -> AsyncIterator[List[str]]:
+        """
+        Return an asynchronous generator over the rows in a sheet by given
+        worksheet name. The rows are read in batches of the given size on the
+        executor, see the 'rows' function of the File object for the details.
+
+        Args:
+            sheet (str): The worksheet name
+            *opts (Options): Optional parameters for get cell values
+            batch_size (int): The number of rows read in each batch, default is
+            1000
+
+        Returns:
+            AsyncIterator[List[str]]: Return an asynchronous generator over the
+            rows of the worksheet, raise a RuntimeError with the message when
+            an error occurred during iteration.
+
+        Example:
+            For example, get and traverse the value of all cells by rows on a
+            worksheet named 'Sheet1':
+
+            ```python
+            try:
+                async for row in af.rows("Sheet1"):
+                    print(row)
+            except RuntimeError as err:
+                print(err)
+            ```
+        """
+        rows = self.file.rows(sheet, *opts, batch_size=batch_size)
+        try:
+            while True:
+                batch = await self.run(partial(list, islice(rows, batch_size)))
+                for row in batch:
+                    yield row
+                if len(batch) < batch_size:
+                    break
+        finally:
+            await self.run(rows.close)
 
 
 def cell_name_to_coordinates(cell: str) -> Tuple[int, int]:
@@ -3638,9 +5560,9 @@ def cell_name_to_coordinates(cell: str) -> Tuple[int, int]:
         Tuple[int, int]: Return a tuple containing the column number, row number
         if no error occurred, otherwise raise a RuntimeError with the message.
     """
-    lib.CellNameToCoordinates.restype = types_go._CellNameToCoordinatesResult
     res = lib.CellNameToCoordinates(cell.encode(ENCODE))
-    err = res.err.decode(ENCODE)
+    err = c_string_to_py(res.err)
+    free_c_value(res)
     if not err:
         return res.col, res.row
     raise RuntimeError(err)
@@ -3658,9 +5580,9 @@ def column_name_to_number(name: str) -> int:
         int: Return the column number as a integer if no error occurred,
         otherwise raise a RuntimeError with the message.
     """
-    lib.ColumnNameToNumber.restype = types_go._IntErrorResult
     res = lib.ColumnNameToNumber(name.encode(ENCODE))
-    err = res.err.decode(ENCODE)
+    err = c_string_to_py(res.err)
+    free_c_value(res)
     if not err:
         return res.val
     raise RuntimeError(err)
@@ -3677,11 +5599,11 @@ def column_number_to_name(num: int) -> str:
         str: Return the column name as a string if no error occurred, otherwise
         raise a RuntimeError with the message.
     """
-    lib.ColumnNumberToName.restype = types_go._StringErrorResult
-    res = lib.ColumnNumberToName(c_int(num))
-    err = res.err.decode(ENCODE)
+    res = lib.ColumnNumberToName(num)
+    err, val = c_string_to_py(res.err), c_string_to_py(res.val)
+    free_c_value(res)
     if not err:
-        return res.val.decode(ENCODE)
+        return val
     raise RuntimeError(err)
 
 
@@ -3700,17 +5622,229 @@ def coordinates_to_cell_name(col: int, row: int, *is_absolute: bool) -> str:
         str: Return the cell name as a string if no error occurred, otherwise
         raise a RuntimeError with the message.
     """
-    lib.CoordinatesToCellName.restype = types_go._StringErrorResult
     options = False
     if len(is_absolute) > 0:
         options = is_absolute[0]
     res = lib.CoordinatesToCellName(col, row, options)
-    err = res.err.decode(ENCODE)
+    err, val = c_string_to_py(res.err), c_string_to_py(res.val)
+    free_c_value(res)
     if not err:
-        return res.val.decode(ENCODE)
+        return val
     raise RuntimeError(err)
 
 
+def dates_to_excel_serials(
+    values: Iterable[Optional[Union[datetime, date]]], date1904: bool = False
+) -> object:
+    """
+    Converts the datetimes and dates to the Excel serial numbers of the wall
+    clock times in bulk, the time zones of the datetimes are ignored. The
+    serial numbers can be written by columns as numbers with a date format.
+
+    Args:
+        values (Iterable[Optional[Union[datetime, date]]]): The datetimes and
+            dates, or a NumPy datetime64 array
+        date1904 (bool): Use the 1904 date system instead of the 1900 one
+
+    Returns:
+        object: The array.array of float64 of the Excel serial numbers, or the
+        NumPy float64 array for a NumPy datetime64 array, the serial numbers of
+        None and NaT values are NaN.
+
+    Example:
+        For example, get the serial numbers of a day's timestamps at one second
+        interval:
+
+        ```python
+        import numpy as np
+
+        ts = np.arange("2024-01-01", "2024-01-02", dtype="datetime64[s]")
+        serials = excelize.dates_to_excel_serials(ts)
+        ```
+    """
+    if getattr(getattr(values, "dtype", None), "kind", "") == "M":
+        import numpy
+
+        days = (numpy.asarray(values) - numpy.datetime64("1899-12-30")) / (
+            numpy.timedelta64(1, "D")
+        )
+        return days - 1462 if date1904 else numpy.where(days < 61, days - 1, days)
+    return array(
+        "d",
+        [
+            float("nan") if v is None else datetime_to_excel_serial(v, date1904)
+            for v in values
+        ],
+    )
+
+
+def default_async_executor() -> Executor:
+    """
+    Return the shared thread pool for running the calls of the AsyncFile
+    objects, which has a thread per processor and is created on first use.
+
+    Returns:
+        Executor: The shared thread pool
+    """
+    global async_executor
+    if async_executor is None:
+        async_executor = ThreadPoolExecutor(os.cpu_count() or 1)
+    return async_executor
+
+
+def generate_workbooks(
+    jobs: Iterable[WorkbookJob],
+    max_workers: Optional[int] = None,
+    chunk_size: int = 16,
+    max_pending: Optional[int] = None,
+) -> Iterator[Tuple[int, Union[bytes, str]]]:
+    """
+    Generate workbooks in parallel across worker processes. Each job creates a
+    new workbook or opens the template workbook, sets the cells of it and
+    saves it to the output path, or returns the content of the workbook if
+    the output path is empty. See the 'map_workbooks' function for the
+    details of the chunking, back-pressure and error handling.
+
+    Args:
+        jobs (Iterable[WorkbookJob]): The workbook jobs
+        max_workers (Optional[int]): The maximum number of worker processes,
+            defaults to the number of processors
+        chunk_size (int): The number of jobs sent to a worker at once
+        max_pending (Optional[int]): The maximum number of chunks in flight,
+            defaults to twice the number of workers
+
+    Returns:
+        Iterator[Tuple[int, Union[bytes, str]]]: Return a generator over the
+        index of each succeeded job and the output path or the content of the
+        workbook, in the order of the jobs. Raise a RuntimeError with the
+        messages of all failed jobs at the end.
+
+    Example:
+        For example, generate a statement workbook from the template for each
+        customer, with 8 worker processes:
+
+        ```python
+        jobs = (
+            excelize.WorkbookJob(
+                template="Template.xlsx",
+                cells={"Sheet1": {"B2": name, "C5": balance}},
+                output=f"Statement{i}.xlsx",
+            )
+            for i, (name, balance) in enumerate(customers)
+        )
+        try:
+            for i, path in excelize.generate_workbooks(jobs, max_workers=8):
+                print(path)
+        except RuntimeError as err:
+            print(err)
+        ```
+    """
+    return map_workbooks(run_workbook_job, jobs, max_workers, chunk_size, max_pending)
+
+
+def get_handle_counts() -> HandleCounts:
+    """
+    Get the number of live handles of the opened workbooks, stream writers,
+    rows and columns iterators. The handle is released when the workbook is
+    closed, the stream writer is flushed or the iterator is exhausted.
+
+    Returns:
+        HandleCounts: The number of live handles of each kind.
+
+    Example:
+        For example, check that all workbooks have been closed:
+
+        ```python
+        assert excelize.get_handle_counts().files == 0
+        ```
+    """
+    return c_value_to_py(lib.GetHandleCounts(), HandleCounts())
+
+
+def map_workbooks(
+    func: Callable,
+    items: Iterable,
+    max_workers: Optional[int] = None,
+    chunk_size: int = 16,
+    max_pending: Optional[int] = None,
+) -> Iterator[Tuple[int, object]]:
+    """
+    Apply the function to each item in parallel across worker processes, for
+    generating or reading many workbooks with multiple processors. The worker
+    processes are spawned instead of forked, since the library can't survive
+    a fork, and each of them loads the library once and runs many chunks of
+    items. At most max_pending chunks are in flight, so the items are consumed
+    lazily as the results are taken. A RuntimeError raised by the function
+    doesn't stop other items, and the messages of all failed items are raised
+    together in a RuntimeError at the end, one item per line. The function
+    must be defined at the top level of a module, so that it can be pickled,
+    and the calling script should be guarded by if __name__ == "__main__".
+
+    Args:
+        func (Callable): The function to be applied to each item
+        items (Iterable): The items, such as the paths of the workbooks
+        max_workers (Optional[int]): The maximum number of worker processes,
+            defaults to the number of processors
+        chunk_size (int): The number of items sent to a worker at once
+        max_pending (Optional[int]): The maximum number of chunks in flight,
+            defaults to twice the number of workers
+
+    Returns:
+        Iterator[Tuple[int, object]]: Return a generator over the index of each
+        succeeded item and the result of it, in the order of the items. Raise a
+        RuntimeError with the messages of all failed items at the end.
+
+    Example:
+        For example, read the first rows of many workbooks:
+
+        ```python
+        def first_row(path):
+            f = excelize.open_file(path)
+            try:
+                return next(f.rows("Sheet1"), [])
+            finally:
+                f.close()
+
+        if __name__ == "__main__":
+            try:
+                for i, row in excelize.map_workbooks(first_row, paths):
+                    print(paths[i], row)
+            except RuntimeError as err:
+                print(err)
+        ```
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    max_pending = max(max_pending or 2 * max_workers, 1)
+    chunk_size, errors, pending = max(chunk_size, 1), [], deque()
+
+    def chunks():
+        chunk = []
+        for item in enumerate(items):
+            chunk.append(item)
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def results(future):
+        for idx, ok, result in future.result():
+            if ok:
+                yield idx, result
+            else:
+                errors.append(f"{idx}: {result}")
+
+    with ProcessPoolExecutor(max_workers, mp_context=get_context("spawn")) as pool:
+        for chunk in chunks():
+            pending.append(pool.submit(run_workbook_chunk, func, chunk))
+            if len(pending) >= max_pending:
+                yield from results(pending.popleft())
+        while pending:
+            yield from results(pending.popleft())
+    if errors:
+        raise RuntimeError("\n".join(errors))
+
+
 def new_file() -> File:
     """
     Create new file by default template.
@@ -3734,35 +5868,251 @@ def open_file(filename: str, *opts: Options) -> File:
         File: Return a File object if if no error occurred, otherwise raise a
         RuntimeError with the message.
     """
-    lib.OpenFile.restype, options = types_go._IntErrorResult, None
+    options = None
     if len(opts) > 0:
         options = byref(py_value_to_c(opts[0], types_go._Options()))
     res = lib.OpenFile(filename.encode(ENCODE), options)
-    err = res.err.decode(ENCODE)
+    err = c_string_to_py(res.err)
+    free_c_value(res)
     if not err:
         return File(res.val)
     raise RuntimeError(err)
 
 
+async def open_file_async(
+    filename: str, *opts: Options, executor: Optional[Executor] = None
+) -> AsyncFile:
+    """
+    Open a spreadsheet file on the executor without blocking the event loop,
+    and return an asyncio facade of the workbook.
+
+    Args:
+        filename (str): The path to the Excel file to open.
+        *opts (Options): Optional parameters for opening the file.
+        executor (Optional[Executor]): The executor to run the calls on,
+            defaults to a shared thread pool with a thread per processor
+
+    Returns:
+        AsyncFile: Return an AsyncFile object if no error occurred, otherwise
+        raise a RuntimeError with the message.
+
+    Example:
+        For example, open a workbook, calculate a cell and save it in a
+        coroutine:
+
+        ```python
+        try:
+            async with await excelize.open_file_async("Book1.xlsx") as af:
+                print(await af.calc_cell_value("Sheet1", "A1"))
+                await af.save_as("Book2.xlsx")
+        except RuntimeError as err:
+            print(err)
+        ```
+    """
+    executor = executor or default_async_executor()
+    future = asyncio.get_running_loop().run_in_executor(
+        executor, partial(open_file, filename, *opts)
+    )
+
+    def close(future):
+        if not future.cancelled() and future.exception() is None:
+            future.result().close()
+
+    try:
+        return AsyncFile(await asyncio.shield(future), executor)
+    except asyncio.CancelledError:
+        # Close the workbook opened after the caller gave up waiting for it
+        future.add_done_callback(close)
+        raise
+
+
 def open_reader(
-    buffer: bytes, *opts: Options
+    buffer: Union[bytes, bytearray, memoryview, mmap], *opts: Options
 ) -> Optional[File]:
     """
-    Read data stream from bytes and return a populated spreadsheet file.
+    Read data stream from bytes and return a populated spreadsheet file. Any
+    object that supports the buffer protocol, such as a bytearray, memoryview
+    or a memory-mapped file, can be passed. The buffer is passed to the library
+    without copying it in Python or into the Go memory, but the library reads
+    the whole buffer into a copy of its own while opening the spreadsheet, so
+    the peak memory is about twice the size of the buffer.
 
     Args:
-        buffer (bytes): The contents buffer of the file
+        buffer (Union[bytes, bytearray, memoryview, mmap]): The contents buffer
+            of the file
         *opts (Options): Optional parameters for opening the file.
 
     Returns:
         Tuple[Optional[File], Optional[Exception]]: A tuple containing a File
         object if successful, or None and an Exception if an error occurred.
+
+    Example:
+        For example, open a spreadsheet by mapping the file into memory:
+
+        ```python
+        import mmap
+
+        try:
+            with open("Book1.xlsx", "rb") as file:
+                with mmap.mmap(file.fileno(), 0) as mm:
+                    f = excelize.open_reader(mm)
+        except RuntimeError as err:
+            print(err)
+        ```
     """
-    lib.OpenReader.restype, options = types_go._IntErrorResult, None
+    if isinstance(buffer, bytes):
+        buf, size = cast(buffer, POINTER(c_ubyte)), len(buffer)
+    else:
+        view = memoryview(buffer).cast("B")
+        if view.readonly:
+            # The address of a read-only buffer can't be taken by ctypes, so
+            # read it in chunks instead of copying the whole buffer.
+            offset = 0
+
+            def read(p: int, n: int) -> int:
+                nonlocal offset
+                chunk = view[offset : offset + n]
+                memmove(p, (c_ubyte * len(chunk)).from_buffer_copy(chunk), len(chunk))
+                offset += len(chunk)
+                return len(chunk)
+
+            return open_reader_callback(read, *opts)
+        buf, size = (c_ubyte * view.nbytes).from_buffer(view), view.nbytes
+    options = None
     if len(opts) > 0:
         options = byref(py_value_to_c(opts[0], types_go._Options()))
-    res = lib.OpenReader(cast(buffer, POINTER(c_ubyte)), len(buffer), options)
-    err = res.err.decode(ENCODE)
+    res = lib.OpenReader(buf, size, options)
+    err = c_string_to_py(res.err)
+    free_c_value(res)
     if err == "":
         return File(res.val)
     raise RuntimeError(err)
+
+
+def open_reader_callback(read: Callable[[int, int], int], *opts: Options) -> File:
+    """
+    Read data stream through the callback function and return a populated
+    spreadsheet file. The callback function accepts the address and the size
+    of the buffer, fills it and returns the number of bytes read, or 0 at the
+    end of the stream.
+
+    Args:
+        read (Callable[[int, int], int]): The callback function to read data
+        *opts (Options): Optional parameters for opening the file.
+
+    Returns:
+        File: Return a File object if no error occurred, otherwise raise a
+        RuntimeError with the message. The exception raised by the callback
+        function will be re-raised.
+    """
+    errors = []
+
+    def callback(p: int, n: int) -> int:
+        try:
+            return read(p, n)
+        except Exception as err:
+            errors.append(err)
+            return -1
+
+    options = (
+        byref(py_value_to_c(opts[0], types_go._Options()))
+        if opts
+        else POINTER(types_go._Options)()
+    )
+    res = lib.OpenStream(types_go._Reader(callback), options)
+    err = c_string_to_py(res.err)
+    free_c_value(res)
+    if errors:
+        raise errors[0]
+    if err == "":
+        return File(res.val)
+    raise RuntimeError(err)
+
+
+def open_stream(reader: BinaryIO, *opts: Options) -> File:
+    """
+    Read data stream from the readable object, such as a file opened in binary
+    mode or a socket stream, and return a populated spreadsheet file. The data
+    is pulled in chunks through the 'readinto' method of the object, or the
+    'read' method if 'readinto' is not available.
+
+    Args:
+        reader (BinaryIO): The readable object
+        *opts (Options): Optional parameters for opening the file.
+
+    Returns:
+        File: Return a File object if no error occurred, otherwise raise a
+        RuntimeError with the message. The exception raised by the reader will
+        be re-raised.
+
+    Example:
+        For example, open a spreadsheet from a file object:
+
+        ```python
+        try:
+            with open("Book1.xlsx", "rb") as file:
+                f = excelize.open_stream(file)
+        except RuntimeError as err:
+            print(err)
+        ```
+    """
+    readinto = getattr(reader, "readinto", None)
+
+    def read(p: int, n: int) -> int:
+        if readinto is not None:
+            return readinto((c_ubyte * n).from_address(p)) or 0
+        data = reader.read(n)
+        memmove(p, data, len(data))
+        return len(data)
+
+    return open_reader_callback(read, *opts)
+
+
+def run_workbook_chunk(
+    func: Callable, chunk: List[Tuple[int, object]]
+) -> List[Tuple[int, bool, object]]:
+    """
+    Apply the function to each item in the chunk in the worker process, the
+    RuntimeError raised by the function is returned with the message.
+
+    Args:
+        func (Callable): The function to be applied to each item
+        chunk (List[Tuple[int, object]]): The index and the item of each item
+
+    Returns:
+        List[Tuple[int, bool, object]]: The index of each item, whether it
+        succeeded, and the result or the error message of it.
+    """
+    results = []
+    for idx, item in chunk:
+        try:
+            results.append((idx, True, func(item)))
+        except RuntimeError as err:
+            results.append((idx, False, str(err)))
+    return results
+
+
+def run_workbook_job(job: WorkbookJob) -> Union[bytes, str]:
+    """
+    Run a workbook job: create a new workbook or open the template workbook,
+    set the cells of each worksheet, then save it to the output path or return
+    the content of it.
+
+    Args:
+        job (WorkbookJob): The workbook job
+
+    Returns:
+        Union[bytes, str]: Return the output path, or the content of the
+        workbook if the output path is empty, if no error occurred, otherwise
+        raise a RuntimeError with the message.
+    """
+    f = open_file(job.template) if job.template else new_file()
+    try:
+        for sheet, cells in (job.cells or {}).items():
+            f.set_cells(sheet, cells)
+        if job.output:
+            f.save_as(job.output)
+            return job.output
+        return f.write_to_buffer()
+    finally:
+        f.close()
@@ -14,16 +14,25 @@ package main
 
 /*
 #include "types_c.h"
+
+static inline int callWriter(Writer fn, unsigned char *p, int n) { return fn(p, n); }
+static inline int callReader(Reader fn, unsigned char *p, int n) { return fn(p, n); }
 */
 import "C"
 
 import (
 	"bytes"
+	"encoding/xml"
 	"errors"
+	"io"
+	"math"
+	"path"
 	"reflect"
+	"strconv"
+	"strings"
 	"sync"
+	"sync/atomic"
 	"time"
-	"unicode"
 	"unsafe"
 
 	_ "image/gif"
@@ -35,6 +44,10 @@ import (
 	"github.com/xuri/excelize/v2"
 )
 
+// maxChunkSize defined the maximum number of bytes passed to the C callback
+// function in a single call.
+const maxChunkSize = 1 << 20
+
 const (
 	Nil     C.int = 0
 	Int     C.int = 1
@@ -44,12 +57,192 @@ const (
 	Time    C.int = 5
 )
 
+// rowsIterator wraps the rows iterator of the worksheet with the options for
+// reading the cell values of each row.
+type rowsIterator struct {
+	rows *excelize.Rows
+	opts excelize.Options
+}
+
+// colsIterator wraps the columns iterator of the worksheet with the options
+// for reading the cell values and the range of columns to be read.
+type colsIterator struct {
+	cols          *excelize.Cols
+	opts          excelize.Options
+	col, min, max int
+}
+
+// stream holds the stream writer, and the style and the date system of the
+// date cells written by columns, which are looked up on first use.
+type stream struct {
+	*excelize.StreamWriter
+	dateStyle  int
+	dateOffset float64
+}
+
+// dates returns the style of the date cells, which uses the built-in date and
+// time number format, and the offset to convert the Excel serial numbers in
+// the 1900 date system to the date system of the workbook. The caller should
+// hold the exclusive lock of the workbook.
+func (s *stream) dates(f *excelize.File) (int, float64, error) {
+	if s.dateStyle == 0 {
+		props, err := f.GetWorkbookProps()
+		if err != nil {
+			return 0, 0, err
+		}
+		if props.Date1904 != nil && *props.Date1904 {
+			s.dateOffset = 1462
+		}
+		if s.dateStyle, err = f.NewStyle(&excelize.Style{NumFmt: 22}); err != nil {
+			return 0, 0, err
+		}
+	}
+	return s.dateStyle, s.dateOffset, nil
+}
+
+// registry stores the objects referenced by the handles which passed to the
+// Python side. The handles are allocated from a monotonically increasing
+// counter, so a handle will never be reused after its object was deleted.
+// The ctypes library releases the GIL around each call, so the exports may be
+// called concurrently by Python threads, and each object is guarded by a
+// read-write lock of its own: the read-only exports of the workbook take the
+// lock shared, so they can run in parallel on the same workbook, and the
+// others take it exclusive. The iterators and the stream writers are owned by
+// the workbook which opened them, they are always locked before the workbook,
+// and they are deleted when the workbook closed.
+type registry struct {
+	m         sync.Map
+	idx, live int64
+}
+
+// handle holds an object in the registry with the lock guarding it, and the
+// handle of the workbook owning it, which is 0 for the workbooks.
+type handle struct {
+	sync.RWMutex
+	val  interface{}
+	file int
+}
+
+// add stores the value in the registry and returns the new handle of it.
+func (r *registry) add(val interface{}) int {
+	return r.addChild(0, val)
+}
+
+// addChild stores the value owned by the workbook of the given handle in the
+// registry and returns the new handle of it.
+func (r *registry) addChild(file int, val interface{}) int {
+	idx := int(atomic.AddInt64(&r.idx, 1))
+	r.m.Store(idx, &handle{val: val, file: file})
+	atomic.AddInt64(&r.live, 1)
+	return idx
+}
+
+// acquire locks the handle, shared or exclusive, and returns the value for it
+// with the function to release the lock. The value will be not found if the
+// handle was deleted while waiting for the lock.
+func (r *registry) acquire(idx int, shared bool) (interface{}, func(), bool) {
+	h, ok := r.m.Load(idx)
+	if !ok {
+		return nil, nil, false
+	}
+	hd := h.(*handle)
+	unlock := hd.Unlock
+	if shared {
+		hd.RLock()
+		unlock = hd.RUnlock
+	} else {
+		hd.Lock()
+	}
+	if cur, ok := r.m.Load(idx); !ok || cur != h {
+		unlock()
+		return nil, nil, false
+	}
+	return hd.val, unlock, true
+}
+
+// lock locks the handle for writing and returns the value for it with the
+// function to release the lock.
+func (r *registry) lock(idx int) (interface{}, func(), bool) {
+	return r.acquire(idx, false)
+}
+
+// rLock locks the handle for reading and returns the value for it with the
+// function to release the lock.
+func (r *registry) rLock(idx int) (interface{}, func(), bool) {
+	return r.acquire(idx, true)
+}
+
+// lockChild locks the handle for writing, and then the workbook owning it,
+// shared or exclusive, and returns the value for the handle and the workbook
+// with the function to release the locks. The error is the given one if the
+// handle not found, or errFilePtr if the workbook was closed.
+func (r *registry) lockChild(idx int, shared bool, errPtr string) (interface{}, *excelize.File, func(), string) {
+	h, ok := r.m.Load(idx)
+	if !ok {
+		return nil, nil, nil, errPtr
+	}
+	val, unlock, ok := r.lock(idx)
+	if !ok {
+		return nil, nil, nil, errPtr
+	}
+	f, unlockFile, ok := files.acquire(h.(*handle).file, shared)
+	if !ok {
+		unlock()
+		return nil, nil, nil, errFilePtr
+	}
+	return val, f.(*excelize.File), func() {
+		unlockFile()
+		unlock()
+	}, ""
+}
+
+// Delete deletes the value for the handle, the caller should hold the
+// exclusive lock of it.
+func (r *registry) Delete(idx int) {
+	if _, ok := r.m.LoadAndDelete(idx); ok {
+		atomic.AddInt64(&r.live, -1)
+	}
+}
+
+// deleteChildren deletes the values owned by the workbook of the given handle,
+// and calls the function with each of them if it isn't nil. The caller should
+// hold the exclusive lock of the workbook.
+func (r *registry) deleteChildren(file int, fn func(val interface{})) {
+	r.m.Range(func(idx, h interface{}) bool {
+		if h.(*handle).file == file {
+			r.Delete(idx.(int))
+			if fn != nil {
+				fn(h.(*handle).val)
+			}
+		}
+		return true
+	})
+}
+
+// count returns the number of live handles in the registry.
+func (r *registry) count() int {
+	return int(atomic.LoadInt64(&r.live))
+}
+
 var (
-	files, sw          = sync.Map{}, sync.Map{}
-	emptyString        string
+	files, sw          registry
+	rowsIter, colsIter registry
 	errFilePtr         = "can not find file pointer"
 	errStreamWriterPtr = "can not find stream writer pointer"
+	errRowsIterPtr     = "can not find rows iterator pointer"
+	errColsIterPtr     = "can not find columns iterator pointer"
 	errArgType         = errors.New("invalid argument data type")
+	errWriter          = errors.New("failed to write to the writer")
+	errReader          = errors.New("failed to read from the reader")
+	// errColumnBufferType and errColumnBufferSize defined the errors of the
+	// buffers provided for the columns.
+	errColumnBufferType = errors.New("the column of the buffer is not a number column")
+	errColumnBufferSize = errors.New("the buffer is too small for the column")
+	// excelEpoch is the day 0 of the Excel serial numbers in the 1900 date
+	// system, counting the nonexistent day 1900-02-29.
+	excelEpoch = time.Date(1899, 12, 30, 0, 0, 0, 0, time.UTC)
+	// cellDateLayouts defined the layouts of the date cell values.
+	cellDateLayouts = []string{time.RFC3339Nano, "2006-01-02T15:04:05.999999999", "2006-01-02"}
 
 	// goBaseTypes defines Go's basic data types.
 	goBaseTypes = map[reflect.Kind]bool{
@@ -70,6 +263,29 @@ var (
 		reflect.Map:     true,
 		reflect.String:  true,
 	}
+	// cResultTypes defined the C structures returned by the library, the
+	// memory allocated for them can be released by the FreeCValue function.
+	cResultTypes = map[string]reflect.Type{
+		"BoolErrorResult":             reflect.TypeOf(C.struct_BoolErrorResult{}),
+		"CalcCellValuesResult":        reflect.TypeOf(C.struct_CalcCellValuesResult{}),
+		"CellNameToCoordinatesResult": reflect.TypeOf(C.struct_CellNameToCoordinatesResult{}),
+		"Float64ErrorResult":          reflect.TypeOf(C.struct_Float64ErrorResult{}),
+		"GetAllRowsResult":            reflect.TypeOf(C.struct_GetAllRowsResult{}),
+		"GetAppPropsResult":           reflect.TypeOf(C.struct_GetAppPropsResult{}),
+		"GetCellHyperLinkResult":      reflect.TypeOf(C.struct_GetCellHyperLinkResult{}),
+		"GetCellRichTextResult":       reflect.TypeOf(C.struct_GetCellRichTextResult{}),
+		"GetCellValuesResult":         reflect.TypeOf(C.struct_GetCellValuesResult{}),
+		"GetColumnBuffersResult":      reflect.TypeOf(C.struct_GetColumnBuffersResult{}),
+		"GetDictRowsResult":           reflect.TypeOf(C.struct_GetDictRowsResult{}),
+		"GetRowsResult":               reflect.TypeOf(C.struct_GetRowsResult{}),
+		"GetStyleResult":              reflect.TypeOf(C.struct_GetStyleResult{}),
+		"GetTablesResult":             reflect.TypeOf(C.struct_GetTablesResult{}),
+		"GetTypedRowsResult":          reflect.TypeOf(C.struct_GetTypedRowsResult{}),
+		"GetWorkbookPropsResult":      reflect.TypeOf(C.struct_GetWorkbookPropsResult{}),
+		"IntErrorResult":              reflect.TypeOf(C.struct_IntErrorResult{}),
+		"StringArrayErrorResult":      reflect.TypeOf(C.struct_StringArrayErrorResult{}),
+		"StringErrorResult":           reflect.TypeOf(C.struct_StringErrorResult{}),
+	}
 	// cToBaseGoTypeFuncs defined functions mapping for G to Go basic data types
 	// convention.
 	cToBaseGoTypeFuncs = map[reflect.Kind]func(cVal reflect.Value, kind reflect.Kind) (reflect.Value, error){
@@ -146,42 +362,46 @@ func cToGoBaseType(cVal reflect.Value, kind reflect.Kind) (reflect.Value, error)
 	return fn(cVal, kind)
 }
 
-// cToGoArray convert C language array to Go array base on the given Go	structure
-// types.
-func cToGoArray(cArray reflect.Value, cArrayLen int) reflect.Value {
-	switch cArray.Elem().Type().String() {
-	case "*main._Ctype_char":
-		return reflect.ValueOf(append([]*C.char{}, unsafe.Slice(cArray.Interface().(**C.char), cArrayLen)...))
-	case "*main._Ctype_struct_Options": // []*excelize.Options
-		val := cArray.Interface().(**C.struct_Options)
-		arr := unsafe.Slice(val, cArrayLen)
-		return reflect.ValueOf(arr)
-	case "main._Ctype_struct_Border":
-		val := cArray.Interface().(*C.struct_Border)
-		arr := unsafe.Slice(val, cArrayLen)
-		return reflect.ValueOf(arr)
-	case "main._Ctype_struct_ChartSeries":
-		val := cArray.Interface().(*C.struct_ChartSeries)
-		arr := unsafe.Slice(val, cArrayLen)
-		return reflect.ValueOf(arr)
-	case "main._Ctype_struct_ConditionalFormatOptions":
-		val := cArray.Interface().(*C.struct_ConditionalFormatOptions)
-		arr := unsafe.Slice(val, cArrayLen)
-		return reflect.ValueOf(arr)
-	case "main._Ctype_struct_PivotTableField":
-		val := cArray.Interface().(*C.struct_PivotTableField)
-		arr := unsafe.Slice(val, cArrayLen)
-		return reflect.ValueOf(arr)
-	case "main._Ctype_struct_RichTextRun":
-		val := cArray.Interface().(*C.struct_RichTextRun)
-		arr := unsafe.Slice(val, cArrayLen)
-		return reflect.ValueOf(arr)
-	case "main._Ctype_struct_Selection":
-		val := cArray.Interface().(*C.struct_Selection)
-		arr := unsafe.Slice(val, cArrayLen)
-		return reflect.ValueOf(arr)
-	}
-	return cArray
+// fieldPlan describes an exported field of the Go structure and the field of
+// the C structure with the same name, with the field of the length of the C
+// array if any.
+type fieldPlan struct {
+	goIdx, cIdx, lenIdx int
+	goType, cType       reflect.Type
+}
+
+// planKey identifies the conversion between a Go structure and a C structure.
+type planKey struct {
+	goType, cType reflect.Type
+}
+
+// structPlans caches the field plans of the conversions by the types of the
+// structures, so the fields are matched by name only once for each pair.
+var structPlans sync.Map
+
+// structPlan returns the field plans for converting between the Go structure
+// and the C structure, the fields which are unexported or absent from the C
+// structure are skipped.
+func structPlan(goType, cType reflect.Type) []fieldPlan {
+	key := planKey{goType: goType, cType: cType}
+	if plan, ok := structPlans.Load(key); ok {
+		return plan.([]fieldPlan)
+	}
+	plan := make([]fieldPlan, 0, goType.NumField())
+	for i := 0; i < goType.NumField(); i++ {
+		field := goType.Field(i)
+		cField, ok := cType.FieldByName(field.Name)
+		if !field.IsExported() || !ok {
+			continue
+		}
+		p := fieldPlan{goIdx: i, cIdx: cField.Index[0], lenIdx: -1, goType: field.Type, cType: cField.Type}
+		if cLen, ok := cType.FieldByName(field.Name + "Len"); ok {
+			p.lenIdx = cLen.Index[0]
+		}
+		plan = append(plan, p)
+	}
+	structPlans.Store(key, plan)
+	return plan
 }
 
 // cValueToGo convert C language object to Go variable base on the given Go
@@ -190,120 +410,93 @@ func cToGoArray(cArray reflect.Value, cArrayLen int) reflect.Value {
 func cValueToGo(cVal reflect.Value, goType reflect.Type) (reflect.Value, error) {
 	result := reflect.New(goType)
 	s := result.Elem()
-	for resultFieldIdx := 0; resultFieldIdx < s.NumField(); resultFieldIdx++ {
-		field := goType.Field(resultFieldIdx)
-		if unicode.IsLower(rune(field.Name[0])) {
-			continue
-		}
-		if goBaseTypes[field.Type.Kind()] {
-			cBaseVal := cVal.FieldByName(field.Name)
-			goBaseVal, err := cToGoBaseType(cBaseVal, field.Type.Kind())
+	for _, p := range structPlan(goType, cVal.Type()) {
+		goField, cField := s.Field(p.goIdx), cVal.Field(p.cIdx)
+		if goBaseTypes[p.goType.Kind()] {
+			goBaseVal, err := cToGoBaseType(cField, p.goType.Kind())
 			if err != nil {
 				return result, err
 			}
-			s.Field(resultFieldIdx).Set(goBaseVal.Convert(s.Field(resultFieldIdx).Type()))
+			goField.Set(goBaseVal.Convert(p.goType))
 			continue
 		}
-		switch field.Type.Kind() {
+		switch p.goType.Kind() {
 		case reflect.Ptr:
 			// Pointer of the Go data type, for example: *excelize.Options or *string
-			ptrType := field.Type.Elem()
+			ptrType := p.goType.Elem()
 			if !goBaseTypes[ptrType.Kind()] {
 				// Pointer of the Go struct, for example: *excelize.Options
-				cObjVal := cVal.FieldByName(field.Name)
-				if cObjVal.Elem().CanAddr() {
-					v, err := cValueToGo(cObjVal.Elem(), ptrType)
+				if cField.Elem().CanAddr() {
+					v, err := cValueToGo(cField.Elem(), ptrType)
 					if err != nil {
 						return result, err
 					}
-					s.Field(resultFieldIdx).Set(v)
+					goField.Set(v)
 				}
-			}
-			if goBaseTypes[ptrType.Kind()] {
+			} else if !cField.IsNil() {
 				// Pointer of the Go basic data type, for example: *string
-				cBaseVal := cVal.FieldByName(field.Name)
-				if !cBaseVal.IsNil() {
-					v, err := cToGoBaseType(cBaseVal.Elem(), ptrType.Kind())
-					if err != nil {
-						return result, err
-					}
-					x := reflect.New(ptrType)
-					x.Elem().Set(v)
-					s.Field(resultFieldIdx).Set(x.Elem().Addr())
+				v, err := cToGoBaseType(cField.Elem(), ptrType.Kind())
+				if err != nil {
+					return result, err
 				}
+				x := reflect.New(ptrType)
+				x.Elem().Set(v)
+				goField.Set(x)
 			}
 		case reflect.Struct:
 			// The Go struct, for example: excelize.Options, convert sub fields recursively
-			structType := field.Type
-			cObjVal := cVal.FieldByName(field.Name)
-			v, err := cValueToGo(cObjVal, structType)
+			v, err := cValueToGo(cField, p.goType)
 			if err != nil {
 				return result, err
 			}
-			s.Field(resultFieldIdx).Set(v.Elem())
+			goField.Set(v.Elem())
 		case reflect.Slice:
 			// The Go data type array, for example:
 			// []*excelize.Options, []excelize.Options, []string, []*string
-			ele := field.Type.Elem()
-			cArray := cVal.FieldByName(field.Name)
-			if cArray.IsZero() {
+			if cField.IsZero() || p.lenIdx < 0 {
 				continue
 			}
-			if ele.Kind() == reflect.Ptr {
-				// Pointer array of the Go data type, for example: []*excelize.Options or []*string
-				subEle := ele.Elem()
-				cArrayLen := int(cVal.FieldByName(field.Name + "Len").Int())
-				cArray = cToGoArray(cArray, cArrayLen)
-				for i := 0; i < cArray.Len(); i++ {
-					if goBaseTypes[subEle.Kind()] {
-						// Pointer array of the Go basic data type, for example: []*string
-						v, err := cToGoBaseType(cArray.Index(i), subEle.Kind())
-						if err != nil {
-							return result, err
-						}
-						x := reflect.New(subEle)
+			ele, cArrayLen := p.goType.Elem(), int(cVal.Field(p.lenIdx).Int())
+			if ele.Kind() == reflect.Uint8 { // []byte
+				goField.SetBytes(C.GoBytes(unsafe.Pointer(cField.Pointer()), C.int(cArrayLen)))
+				continue
+			}
+			if cArrayLen == 0 {
+				continue
+			}
+			slice, cEle := reflect.MakeSlice(p.goType, cArrayLen, cArrayLen), p.cType.Elem()
+			for i := 0; i < cArrayLen; i++ {
+				cItem := reflect.NewAt(cEle, unsafe.Add(unsafe.Pointer(cField.Pointer()), uintptr(i)*cEle.Size())).Elem()
+				var (
+					v   reflect.Value
+					err error
+				)
+				switch {
+				case ele.Kind() == reflect.Ptr && goBaseTypes[ele.Elem().Kind()]:
+					// Pointer array of the Go basic data type, for example: []*string
+					if v, err = cToGoBaseType(cItem, ele.Elem().Kind()); err == nil {
+						x := reflect.New(ele.Elem())
 						x.Elem().Set(v)
-						s.Field(resultFieldIdx).Set(reflect.Append(s.Field(resultFieldIdx), x.Elem().Addr()))
-					} else {
-						// Pointer array of the Go struct, for example: []*excelize.Options
-						v, err := cValueToGo(cArray.Index(i).Elem(), subEle)
-						if err != nil {
-							return result, err
-						}
-						x := reflect.New(subEle)
-						x.Elem().Set(v.Elem())
-						s.Field(resultFieldIdx).Set(reflect.Append(s.Field(resultFieldIdx), x.Elem().Addr()))
+						v = x
 					}
-				}
-			} else {
-				// The Go data type array, for example: []excelize.Options or []string
-				subEle := ele
-				cArrayLen := int(cVal.FieldByName(field.Name + "Len").Int())
-				if subEle.Kind() == reflect.Uint8 { // []byte
-					buf := C.GoBytes(unsafe.Pointer(cArray.Interface().(*C.uchar)), C.int(cArrayLen))
-					s.Field(resultFieldIdx).Set(reflect.ValueOf(buf))
-					continue
-				}
-				cArray = cToGoArray(cArray, cArrayLen)
-				for i := 0; i < cArray.Len(); i++ {
-					if goBaseTypes[subEle.Kind()] {
-						// The Go basic data type array, for example: []string
-						v, err := cToGoBaseType(cArray.Index(i), subEle.Kind())
-						if err != nil {
-							return result, err
-						}
-
-						s.Field(resultFieldIdx).Set(reflect.Append(s.Field(resultFieldIdx), v))
-					} else {
-						// The Go struct array, for example: []excelize.Options
-						v, err := cValueToGo(cArray.Index(i), subEle)
-						if err != nil {
-							return result, err
-						}
-						s.Field(resultFieldIdx).Set(reflect.Append(s.Field(resultFieldIdx), v.Elem()))
+				case ele.Kind() == reflect.Ptr:
+					// Pointer array of the Go struct, for example: []*excelize.Options
+					v, err = cValueToGo(cItem.Elem(), ele.Elem())
+				case goBaseTypes[ele.Kind()]:
+					// The Go basic data type array, for example: []string
+					v, err = cToGoBaseType(cItem, ele.Kind())
+				default:
+					// The Go struct array, for example: []excelize.Options
+					if v, err = cValueToGo(cItem, ele); err == nil {
+						v = v.Elem()
 					}
 				}
+				if err != nil {
+					return result, err
+				}
+				slice.Index(i).Set(v)
 			}
+			goField.Set(slice)
 		}
 	}
 	return result, nil
@@ -324,130 +517,854 @@ func goBaseTypeToC(goVal reflect.Value, kind reflect.Kind) (reflect.Value, error
 func goValueToC(goVal, cVal reflect.Value) (reflect.Value, error) {
 	result := cVal
 	c := result.Elem()
-	for i := 0; i < goVal.Type().NumField(); i++ {
-		cField, _ := c.Type().FieldByName(goVal.Type().Field(i).Name)
-		field := goVal.Type().Field(i)
-		if unicode.IsLower(rune(field.Name[0])) {
-			continue
-		}
-		if goBaseTypes[field.Type.Kind()] {
-			goBaseVal := goVal.FieldByName(field.Name)
-			cBaseVal, err := goBaseTypeToC(goBaseVal, goBaseVal.Type().Kind())
+	for _, p := range structPlan(goVal.Type(), c.Type()) {
+		goField, cField := goVal.Field(p.goIdx), c.Field(p.cIdx)
+		if goBaseTypes[p.goType.Kind()] {
+			cBaseVal, err := goBaseTypeToC(goField, p.goType.Kind())
 			if err != nil {
 				return result, err
 			}
-			c.FieldByName(field.Name).Set(cBaseVal.Convert(cField.Type))
+			cField.Set(cBaseVal.Convert(p.cType))
 			continue
 		}
-		switch goVal.Type().Field(i).Type.Kind() {
+		switch p.goType.Kind() {
 		case reflect.Ptr:
 			// Pointer of the Go data type, for example: *excelize.Options or *string
-			ptrType := field.Type.Elem()
+			ptrType := p.goType.Elem()
+			if goField.IsNil() {
+				cField.Set(reflect.Zero(p.cType))
+				continue
+			}
 			if !goBaseTypes[ptrType.Kind()] {
 				// Pointer of the Go struct, for example: *excelize.Options
-				goStructVal := goVal.Field(i)
-				if !goStructVal.IsNil() {
-					cPtr := C.malloc(C.size_t(cField.Type.Elem().Size()))
-					cStructPtr := reflect.NewAt(cField.Type.Elem(), cPtr)
-					v, err := goValueToC(goStructVal.Elem(), cStructPtr)
-					if err != nil {
-						return result, err
-					}
-					c.FieldByName(field.Name).Set(v)
+				cPtr := C.calloc(1, C.size_t(p.cType.Elem().Size()))
+				v, err := goValueToC(goField.Elem(), reflect.NewAt(p.cType.Elem(), cPtr))
+				if err != nil {
+					return result, err
 				}
+				cField.Set(v)
+				continue
 			}
-			if goBaseTypes[ptrType.Kind()] {
-				// Pointer of the Go basic data type, for example: *string
-				goBaseVal := goVal.Field(i)
-				if !goBaseVal.IsNil() {
-					v, err := goBaseTypeToC(goBaseVal.Elem(), ptrType.Kind())
-					if err != nil {
-						return result, err
-					}
-					cValPtr := C.malloc(C.size_t(unsafe.Sizeof(cField.Type.Elem().Size())))
-					ptrVal := reflect.NewAt(v.Type(), cValPtr).Elem()
-					ptrVal.Set(v)
-					c.FieldByName(field.Name).Set(ptrVal.Addr())
-				} else {
-					c.FieldByName(field.Name).Set(reflect.Zero(cField.Type))
-				}
+			// Pointer of the Go basic data type, for example: *string
+			v, err := goBaseTypeToC(goField.Elem(), ptrType.Kind())
+			if err != nil {
+				return result, err
 			}
+			ptrVal := reflect.NewAt(v.Type(), C.malloc(C.size_t(p.cType.Elem().Size()))).Elem()
+			ptrVal.Set(v)
+			cField.Set(ptrVal.Addr())
 		case reflect.Struct:
-			// The Go struct, for example: excelize.Options, convert sub fields recursively
-			goStructVal := goVal.Field(i)
-			v, err := goValueToC(goStructVal, reflect.New(cField.Type))
-			if err != nil {
+			// The Go struct, for example: excelize.Options, convert sub fields
+			// recursively into the field of the C structure in place
+			if _, err := goValueToC(goField, cField.Addr()); err != nil {
 				return result, err
 			}
-			c.FieldByName(field.Name).Set(v.Elem())
 		case reflect.Slice:
-			// The Go data type array, for example:
-			// []*excelize.Options, []excelize.Options, []string, []*string
-			goSlice := goVal.Field(i)
-			ele := goSlice.Type().Elem()
-			l, err := goBaseTypeToC(reflect.ValueOf(goSlice.Len()), reflect.Int)
+			// The Go data type array, for example: []excelize.Options or []string,
+			// the elements are converted into a single C array
+			if p.lenIdx < 0 {
+				continue
+			}
+			l, err := goBaseTypeToC(reflect.ValueOf(goField.Len()), reflect.Int)
 			if err != nil {
 				return result, err
 			}
-			c.FieldByName(field.Name + "Len").Set(l)
-			cArray := C.malloc(C.size_t(goSlice.Len()) * C.size_t(cField.Type.Elem().Size()))
-			for j := 0; j < goSlice.Len(); j++ {
+			c.Field(p.lenIdx).Set(l)
+			ele, cEle := p.goType.Elem(), p.cType.Elem()
+			cArray := C.calloc(C.size_t(goField.Len()), C.size_t(cEle.Size()))
+			for j := 0; j < goField.Len(); j++ {
+				cItem := reflect.NewAt(cEle, unsafe.Add(cArray, uintptr(j)*cEle.Size()))
 				if goBaseTypes[ele.Kind()] {
 					// The Go basic data type array, for example: []string
-					cBaseVal, err := goBaseTypeToC(goSlice.Index(j), goSlice.Index(j).Type().Kind())
+					cBaseVal, err := goBaseTypeToC(goField.Index(j), ele.Kind())
 					if err != nil {
 						return result, err
 					}
-					elePtr := unsafe.Pointer(uintptr(cArray) + uintptr(j)*cBaseVal.Type().Size())
-					ele := reflect.NewAt(cBaseVal.Type(), elePtr).Elem()
-					ele.Set(cBaseVal)
-				} else {
-					// The Go struct array, for example: []excelize.Options
-					cPtr := C.malloc(C.size_t(cField.Type.Elem().Size()))
-					cStructPtr := reflect.NewAt(cField.Type.Elem(), cPtr)
-					v, err := goValueToC(goSlice.Index(j), cStructPtr)
-					if err != nil {
-						return result, err
-					}
-					elePtr := unsafe.Pointer(uintptr(cArray) + uintptr(j)*cField.Type.Elem().Size())
-					ele := reflect.NewAt(cField.Type.Elem(), elePtr).Elem()
-					ele.Set(reflect.NewAt(cField.Type.Elem(), unsafe.Pointer(v.Pointer())).Elem())
+					cItem.Elem().Set(cBaseVal.Convert(cEle))
+					continue
+				}
+				// The Go struct array, for example: []excelize.Options
+				if _, err := goValueToC(goField.Index(j), cItem); err != nil {
+					return result, err
 				}
 			}
-			c.FieldByName(field.Name).Set(reflect.NewAt(cField.Type.Elem(), cArray))
+			cField.Set(reflect.NewAt(cEle, cArray))
 		}
 	}
 	return result, nil
 }
 
+// freeCValue release the C memory allocated by the goValueToC function and
+// the C strings for the fields of the C structure value recursively.
+func freeCValue(cVal reflect.Value) {
+	for i := 0; i < cVal.NumField(); i++ {
+		field, cField := cVal.Field(i), cVal.Type().Field(i)
+		switch field.Kind() {
+		case reflect.Struct:
+			freeCValue(field)
+		case reflect.Ptr:
+			if field.IsNil() {
+				continue
+			}
+			ptr, ele := unsafe.Pointer(field.Pointer()), cField.Type.Elem()
+			if l := cVal.FieldByName(cField.Name + "Len"); l.IsValid() {
+				// The C array, free the C strings and the fields of the C
+				// structures in the array
+				for j := 0; j < int(l.Int()); j++ {
+					eleVal := reflect.NewAt(ele, unsafe.Add(ptr, uintptr(j)*ele.Size())).Elem()
+					if ele.Kind() == reflect.Struct {
+						freeCValue(eleVal)
+					}
+					if ele.Kind() == reflect.Ptr && !eleVal.IsNil() {
+						C.free(unsafe.Pointer(eleVal.Pointer()))
+					}
+				}
+			} else if ele.Kind() == reflect.Struct {
+				freeCValue(reflect.NewAt(ele, ptr).Elem())
+			}
+			C.free(ptr)
+			*(*unsafe.Pointer)(unsafe.Pointer(field.UnsafeAddr())) = nil
+		}
+	}
+}
+
 // cInterfaceToGo convert C interface to Go interface data type value.
 func cInterfaceToGo(val C.struct_Interface) interface{} {
 	switch val.Type {
+	case Float:
+		return float64(val.Float64)
 	case Int:
-		return int(val.Integer)
+		return int64(val.Integer)
 	case String:
 		return C.GoString(val.String)
-	case Float:
-		return float64(val.Float64)
 	case Boolean:
 		return bool(val.Boolean)
 	case Time:
-		return time.Unix(int64(val.Integer), 0)
+		return serialToTime(float64(val.Float64))
+	default:
+		return nil
+	}
+}
+
+// serialToTime converts the Excel serial number in the 1900 date system to the
+// wall clock time in UTC rounded to microseconds, which is the inverse of the
+// timeToSerial function.
+func serialToTime(serial float64) time.Time {
+	if serial < 61 {
+		serial++
+	}
+	days := math.Floor(serial)
+	return excelEpoch.AddDate(0, 0, int(days)).Add(time.Duration(math.Round((serial-days)*86400e6)) * time.Microsecond)
+}
+
+// timeToSerial converts the wall clock time to the Excel serial number in the
+// 1900 date system, the dates before 1900-03-01 are shifted by the day
+// 1900-02-29 which doesn't exist.
+func timeToSerial(t time.Time) float64 {
+	date := time.Date(t.Year(), t.Month(), t.Day(), 0, 0, 0, 0, time.UTC)
+	days := float64((date.Unix() - excelEpoch.Unix()) / 86400)
+	if days < 61 {
+		days--
+	}
+	return days + float64(t.Hour()*3600+t.Minute()*60+t.Second())/86400 + float64(t.Nanosecond())/86400e9
+}
+
+// cColumnValueToGo returns the value in the given row of the C Column
+// structure, returns nil if the cell is marked as empty.
+func cColumnValueToGo(col C.struct_Column, row int) interface{} {
+	row += int(col.Offset)
+	if col.Null != nil && *(*C.uchar)(unsafe.Add(unsafe.Pointer(col.Null), row)) != 0 {
+		return nil
+	}
+	if col.Validity != nil && *(*C.uchar)(unsafe.Add(unsafe.Pointer(col.Validity), row/8))&(1<<(row%8)) == 0 {
+		return nil
+	}
+	switch col.Type {
+	case Int:
+		return int64(*(*C.longlong)(unsafe.Add(unsafe.Pointer(col.Int64), row*C.sizeof_longlong)))
+	case String:
+		if col.Offsets != nil {
+			offsets := unsafe.Slice(col.Offsets, row+2)
+			return C.GoStringN((*C.char)(unsafe.Add(unsafe.Pointer(col.Data), offsets[row])), offsets[row+1]-offsets[row])
+		}
+		if val := *(**C.char)(unsafe.Add(unsafe.Pointer(col.String), row*int(unsafe.Sizeof(col.String)))); val != nil {
+			return C.GoString(val)
+		}
+		return nil
+	case Float, Time:
+		return float64(*(*C.double)(unsafe.Add(unsafe.Pointer(col.Float64), row*C.sizeof_double)))
+	case Boolean:
+		return bool(*(*C.bool)(unsafe.Add(unsafe.Pointer(col.Boolean), row)))
 	default:
 		return nil
 	}
 }
 
+// typedCellValueToC converts the raw value of a cell to the C interface data
+// type value by the cell type. The integer numbers are converted to the Int
+// type if they are exactly representable as 64-bit integers, other numbers are
+// converted to the Float type, the date values are converted to the Time type
+// with the Excel serial number of the wall clock time and the unset cells
+// without value are converted to the Nil type.
+func typedCellValueToC(typ excelize.CellType, raw string) C.struct_Interface {
+	switch typ {
+	case excelize.CellTypeBool:
+		return C.struct_Interface{Type: Boolean, Boolean: C.bool(raw == "1" || strings.EqualFold(raw, "true"))}
+	case excelize.CellTypeDate:
+		for _, layout := range cellDateLayouts {
+			if t, err := time.Parse(layout, raw); err == nil {
+				return C.struct_Interface{Type: Time, Float64: C.double(timeToSerial(t))}
+			}
+		}
+	case excelize.CellTypeUnset, excelize.CellTypeNumber:
+		if raw == "" {
+			return C.struct_Interface{Type: Nil}
+		}
+		if num, err := strconv.ParseInt(raw, 10, 64); err == nil {
+			return C.struct_Interface{Type: Int, Integer: C.longlong(num)}
+		}
+		if num, err := strconv.ParseFloat(raw, 64); err == nil {
+			if num == math.Trunc(num) && math.Abs(num) <= 1<<53 {
+				return C.struct_Interface{Type: Int, Integer: C.longlong(num)}
+			}
+			return C.struct_Interface{Type: Float, Float64: C.double(num)}
+		}
+	}
+	return C.struct_Interface{Type: String, String: C.CString(raw)}
+}
+
+// cellValueToC returns the value of the cell as the C interface data type
+// value. The value is the formatted string if typed is false, otherwise the
+// raw value of the cell is converted to the native data type by the cell type.
+func cellValueToC(t *typedCells, sheet, cell string, typed bool, opts excelize.Options) (C.struct_Interface, error) {
+	if !typed {
+		val, err := t.f.GetCellValue(sheet, cell, opts)
+		if err != nil {
+			return C.struct_Interface{}, err
+		}
+		return C.struct_Interface{Type: String, String: C.CString(val)}, nil
+	}
+	var (
+		c   sheetCell
+		err error
+	)
+	if c.typ, err = t.f.GetCellType(sheet, cell); err != nil {
+		return C.struct_Interface{}, err
+	}
+	if c.style, err = t.f.GetCellStyle(sheet, cell); err != nil {
+		return C.struct_Interface{}, err
+	}
+	if c.raw, err = t.f.GetCellValue(sheet, cell, excelize.Options{RawCellValue: true}); err != nil {
+		return C.struct_Interface{}, err
+	}
+	return t.cellToC(c, false), nil
+}
+
+// cellAttr holds the type and the style of a cell in the worksheet.
+type cellAttr struct {
+	typ   excelize.CellType
+	style int
+}
+
+// cellTypes maps the type attributes of the cells in the worksheet to the cell
+// types.
+var cellTypes = map[string]excelize.CellType{
+	"b":         excelize.CellTypeBool,
+	"d":         excelize.CellTypeDate,
+	"n":         excelize.CellTypeNumber,
+	"e":         excelize.CellTypeError,
+	"s":         excelize.CellTypeSharedString,
+	"str":       excelize.CellTypeFormula,
+	"inlineStr": excelize.CellTypeInlineString,
+}
+
+// cellAttrReader reads the types and the styles of the cells row by row from
+// the XML decoder of a worksheet, the rows which are not asked for are
+// skipped without decoding the cells.
+type cellAttrReader struct {
+	decoder *xml.Decoder
+	row     int
+	pending bool
+	done    bool
+}
+
+// next returns the attributes of the cells in the row with the given number,
+// indexed by the column number minus one. The row numbers must be increasing
+// between calls.
+func (r *cellAttrReader) next(row int) ([]cellAttr, error) {
+	for !r.done {
+		if !r.pending {
+			token, err := r.decoder.Token()
+			if err == io.EOF {
+				r.done = true
+				break
+			}
+			if err != nil {
+				return nil, err
+			}
+			switch element := token.(type) {
+			case xml.StartElement:
+				if element.Name.Local == "row" {
+					r.row++
+					for _, attr := range element.Attr {
+						if num, err := strconv.Atoi(attr.Value); err == nil && attr.Name.Local == "r" {
+							r.row = num
+						}
+					}
+					r.pending = true
+				}
+			case xml.EndElement:
+				r.done = element.Name.Local == "sheetData"
+			}
+			continue
+		}
+		if r.row > row {
+			return nil, nil
+		}
+		r.pending = false
+		if r.row < row {
+			if err := r.decoder.Skip(); err != nil {
+				return nil, err
+			}
+			continue
+		}
+		return r.cells()
+	}
+	return nil, nil
+}
+
+// cells returns the attributes of the cells in the current row element.
+func (r *cellAttrReader) cells() ([]cellAttr, error) {
+	var (
+		attrs []cellAttr
+		col   int
+	)
+	for {
+		token, err := r.decoder.Token()
+		if err != nil {
+			return attrs, err
+		}
+		switch element := token.(type) {
+		case xml.StartElement:
+			if element.Name.Local != "c" {
+				if err := r.decoder.Skip(); err != nil {
+					return attrs, err
+				}
+				continue
+			}
+			var attr cellAttr
+			col++
+			for _, a := range element.Attr {
+				switch a.Name.Local {
+				case "r":
+					if c, _, err := excelize.CellNameToCoordinates(a.Value); err == nil {
+						col = c
+					}
+				case "t":
+					attr.typ = cellTypes[a.Value]
+				case "s":
+					attr.style, _ = strconv.Atoi(a.Value)
+				}
+			}
+			for len(attrs) < col {
+				attrs = append(attrs, cellAttr{})
+			}
+			attrs[col-1] = attr
+			if err := r.decoder.Skip(); err != nil {
+				return attrs, err
+			}
+		case xml.EndElement:
+			return attrs, nil
+		}
+	}
+}
+
+// workbookRels holds the relationships of the workbook part in the package.
+type workbookRels struct {
+	Relationships []struct {
+		ID     string `xml:"Id,attr"`
+		Target string `xml:",attr"`
+	} `xml:"Relationship"`
+}
+
+// sheetXMLPath returns the path of the worksheet part in the package, which is
+// resolved by the relationship of the sheet in the workbook, or an empty
+// string if it can't be resolved.
+func sheetXMLPath(f *excelize.File, sheet string) string {
+	var wbRels workbookRels
+	rels, ok := f.Relationships.Load("xl/_rels/workbook.xml.rels")
+	if !ok || f.WorkBook == nil {
+		return ""
+	}
+	output, err := xml.Marshal(rels)
+	if err != nil || xml.Unmarshal(output, &wbRels) != nil {
+		return ""
+	}
+	for _, ws := range f.WorkBook.Sheets.Sheet {
+		if !strings.EqualFold(ws.Name, sheet) {
+			continue
+		}
+		for _, rel := range wbRels.Relationships {
+			if rel.ID != ws.ID {
+				continue
+			}
+			if strings.HasPrefix(rel.Target, "/") {
+				return strings.TrimPrefix(path.Clean(rel.Target), "/")
+			}
+			return path.Join("xl", rel.Target)
+		}
+	}
+	return ""
+}
+
+// sheetCell holds the value of a cell in the rows with its type and style.
+type sheetCell struct {
+	cellAttr
+	raw string
+}
+
+// rowReader reads the rows of a worksheet in a single pass, with the types and
+// the styles of the cells along with the values, instead of looking up each
+// cell by reference which scans the rows of the worksheet every time. The
+// types and the styles are read from the XML of the worksheet part, which is
+// scanned along with the rows.
+type rowReader struct {
+	f     *excelize.File
+	sheet string
+	opts  excelize.Options
+	rows  *excelize.Rows
+	attrs *cellAttrReader
+	row   int
+	*typedCells
+}
+
+// newRowReader returns the reader of the rows in the worksheet, the values of
+// the cells are read with the given options. The cells are looked up by
+// reference for the types and the styles if the worksheet part can't be
+// found in the package.
+func newRowReader(f *excelize.File, sheet string, opts excelize.Options) (*rowReader, error) {
+	name := sheetXMLPath(f, sheet)
+	if _, ok := f.Pkg.Load(name); name != "" && !ok {
+		// The worksheet is kept out of the package while it is in a temporary
+		// file for exceeding the unzip XML size limit, or in a stream writer.
+		// Reading a cell loads it, and the rows iterator flushes the loaded
+		// worksheet into the package.
+		if _, err := f.GetCellType(sheet, "A1"); err != nil {
+			return nil, err
+		}
+	}
+	rows, err := f.Rows(sheet)
+	if err != nil {
+		return nil, err
+	}
+	r := &rowReader{f: f, sheet: sheet, opts: opts, rows: rows, typedCells: newTypedCells(f)}
+	if content, ok := f.Pkg.Load(name); ok {
+		if b, ok := content.([]byte); ok {
+			decoder := xml.NewDecoder(bytes.NewReader(b))
+			decoder.CharsetReader = f.CharsetReader
+			r.attrs = &cellAttrReader{decoder: decoder}
+		}
+	}
+	return r, nil
+}
+
+// next prepares the next row for reading with the cells function, returns
+// false if there are no more rows.
+func (r *rowReader) next() bool {
+	r.row++
+	return r.rows.Next()
+}
+
+// cells returns the cells of the current row, the continually blank cells in
+// the tail of the row are skipped.
+func (r *rowReader) cells() ([]sheetCell, error) {
+	values, err := r.rows.Columns(r.opts)
+	if err != nil || len(values) == 0 {
+		return nil, err
+	}
+	var attrs []cellAttr
+	if r.attrs != nil {
+		if attrs, err = r.attrs.next(r.row); err != nil {
+			return nil, err
+		}
+	}
+	cells := make([]sheetCell, len(values))
+	for c, raw := range values {
+		if cells[c].raw = raw; raw == "" {
+			continue
+		}
+		if r.attrs != nil {
+			if c < len(attrs) {
+				cells[c].cellAttr = attrs[c]
+			}
+			continue
+		}
+		cell, err := excelize.CoordinatesToCellName(c+1, r.row)
+		if err != nil {
+			return nil, err
+		}
+		if cells[c].typ, err = r.f.GetCellType(r.sheet, cell); err != nil {
+			return nil, err
+		}
+		if cells[c].style, err = r.f.GetCellStyle(r.sheet, cell); err != nil {
+			return nil, err
+		}
+	}
+	return cells, nil
+}
+
+// close closes the iterator of the rows.
+func (r *rowReader) close() {
+	_ = r.rows.Close()
+}
+
+// readRows returns the cells of the rows in the worksheet from the first row
+// number to the last row number, or to the last row of the worksheet if it is
+// 0. The rows before the first row are skipped without reading the cells, and
+// the blank rows in the tail are skipped.
+func (r *rowReader) readRows(firstRow, lastRow int) ([][]sheetCell, error) {
+	var (
+		rows  [][]sheetCell
+		count int
+	)
+	for (lastRow == 0 || r.row < lastRow) && r.next() {
+		if r.row < firstRow {
+			continue
+		}
+		cells, err := r.cells()
+		if err != nil {
+			return nil, err
+		}
+		if rows = append(rows, cells); len(cells) > 0 {
+			count = len(rows)
+		}
+	}
+	return rows[:count], nil
+}
+
+// typedCells converts the raw values of the cells to the native data types
+// by the cell types and the number formats of the cell styles.
+type typedCells struct {
+	f      *excelize.File
+	dates  map[int]bool
+	offset float64
+}
+
+// newTypedCells returns the converter of the cells in the workbook.
+func newTypedCells(f *excelize.File) *typedCells {
+	t := &typedCells{f: f, dates: make(map[int]bool)}
+	if props, err := f.GetWorkbookProps(); err == nil && props.Date1904 != nil && *props.Date1904 {
+		t.offset = 1462
+	}
+	return t
+}
+
+// isDate returns if the number format of the style is a date or time format.
+func (t *typedCells) isDate(styleID int) bool {
+	if date, ok := t.dates[styleID]; ok {
+		return date
+	}
+	var date bool
+	if style, err := t.f.GetStyle(styleID); err == nil && style != nil {
+		if style.CustomNumFmt != nil {
+			date = isDateNumFmtCode(*style.CustomNumFmt)
+		} else {
+			date = isDateNumFmtID(style.NumFmt)
+		}
+	}
+	t.dates[styleID] = date
+	return date
+}
+
+// cellToC returns the value of the cell as the C interface data type value by
+// the cell type, or the cell type as the Int type if typesOnly is true. The
+// cell type of the cell without type but with value is the number type, and
+// the numbers with a date or time number format are converted to the Time
+// type.
+func (t *typedCells) cellToC(cell sheetCell, typesOnly bool) C.struct_Interface {
+	typ := cell.typ
+	if cell.raw == "" {
+		typ = excelize.CellTypeUnset
+	} else if typ == excelize.CellTypeUnset {
+		typ = excelize.CellTypeNumber
+	}
+	if typesOnly {
+		return C.struct_Interface{Type: Int, Integer: C.longlong(typ)}
+	}
+	if typ == excelize.CellTypeNumber && cell.style != 0 && t.isDate(cell.style) {
+		if serial, err := strconv.ParseFloat(cell.raw, 64); err == nil {
+			return C.struct_Interface{Type: Time, Float64: C.double(serial + t.offset)}
+		}
+	}
+	return typedCellValueToC(typ, cell.raw)
+}
+
+// isDateNumFmtID returns if the built-in number format is a date or time
+// format, including the built-in formats of the East Asian languages.
+func isDateNumFmtID(id int) bool {
+	return (id >= 14 && id <= 22) || (id >= 27 && id <= 36) || (id >= 45 && id <= 47) ||
+		(id >= 50 && id <= 58) || (id >= 71 && id <= 81)
+}
+
+// isDateNumFmtCode returns if the custom number format code is a date or time
+// format, which has a date or time token outside the literal strings, the
+// escaped characters and the brackets except the elapsed time.
+func isDateNumFmtCode(code string) bool {
+	for i := 0; i < len(code); i++ {
+		switch c := code[i]; c {
+		case '"':
+			if j := strings.IndexByte(code[i+1:], '"'); j >= 0 {
+				i += j + 1
+			}
+		case '\\', '_', '*':
+			i++
+		case '[':
+			j := strings.IndexByte(code[i:], ']')
+			if j < 0 {
+				return false
+			}
+			if token := strings.ToLower(code[i+1 : i+j]); token != "" && strings.Trim(token, "hms") == "" {
+				return true
+			}
+			i += j
+		case 'y', 'Y', 'm', 'M', 'd', 'D', 'h', 'H', 's', 'S':
+			return true
+		}
+	}
+	return false
+}
+
+// rangeRefToCoordinates returns the coordinates of the top-left and the
+// bottom-right cells of the range reference.
+func rangeRefToCoordinates(rangeRef string) (int, int, int, int, error) {
+	refs := strings.Split(rangeRef, ":")
+	if len(refs) > 2 {
+		return 0, 0, 0, 0, excelize.ErrParameterInvalid
+	}
+	col1, row1, err := excelize.CellNameToCoordinates(refs[0])
+	if err != nil {
+		return 0, 0, 0, 0, err
+	}
+	col2, row2 := col1, row1
+	if len(refs) == 2 {
+		if col2, row2, err = excelize.CellNameToCoordinates(refs[1]); err != nil {
+			return 0, 0, 0, 0, err
+		}
+	}
+	if col1 > col2 {
+		col1, col2 = col2, col1
+	}
+	if row1 > row2 {
+		row1, row2 = row2, row1
+	}
+	return col1, row1, col2, row2, nil
+}
+
+// rangeRefToCells returns the cell references in the range reference row by
+// row, and the number of columns in the range.
+func rangeRefToCells(rangeRef string) ([]string, int, error) {
+	col1, row1, col2, row2, err := rangeRefToCoordinates(rangeRef)
+	if err != nil {
+		return nil, 0, err
+	}
+	cells := make([]string, 0, (col2-col1+1)*(row2-row1+1))
+	for row := row1; row <= row2; row++ {
+		for col := col1; col <= col2; col++ {
+			cell, err := excelize.CoordinatesToCellName(col, row)
+			if err != nil {
+				return nil, 0, err
+			}
+			cells = append(cells, cell)
+		}
+	}
+	return cells, col2 - col1 + 1, nil
+}
+
+// cellRefs returns the cell references in the range reference row by row with
+// the number of columns in the range, or the cell references in the array if
+// the range reference is nil.
+func cellRefs(rangeRef *C.char, cells **C.char, cellsLen int) ([]string, int, error) {
+	if rangeRef != nil {
+		return rangeRefToCells(C.GoString(rangeRef))
+	}
+	refs := make([]string, cellsLen)
+	for i, cell := range unsafe.Slice(cells, cellsLen) {
+		refs[i] = C.GoString(cell)
+	}
+	return refs, 0, nil
+}
+
+// forEach calls the function with each index less than n, concurrently on up
+// to the given number of goroutines.
+func forEach(n, workers int, fn func(i int)) {
+	var wg sync.WaitGroup
+	jobs := make(chan int)
+	for w := 0; w < workers && w < n; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for i := range jobs {
+				fn(i)
+			}
+		}()
+	}
+	for i := 0; i < n; i++ {
+		jobs <- i
+	}
+	close(jobs)
+	wg.Wait()
+}
+
+// columnBuffer holds the values of a column while walking the rows, the
+// column is a string column once it has a value which is not a number.
+type columnBuffer struct {
+	name   string
+	valid  []bool
+	nums   []float64
+	strs   []string
+	isText bool
+}
+
+// toC allocates the C buffers of the column in the layout of the Arrow
+// columnar format, with 64-bit offsets for the string column. The values of
+// the float column are written to the values buffer provided by the caller
+// instead if buf isn't nil. The values of the null slots are NaN in the float
+// column.
+func (col *columnBuffer) toC(buf *C.struct_ColumnBuffer) C.struct_ColumnBuffer {
+	n := len(col.valid)
+	cCol := C.struct_ColumnBuffer{Name: C.CString(col.name), Type: Float, Length: C.int(n)}
+	cCol.Validity = (*C.uchar)(C.calloc(C.size_t(n/8+1), 1))
+	validity := unsafe.Slice(cCol.Validity, n/8+1)
+	for i, valid := range col.valid {
+		if valid {
+			validity[i/8] |= 1 << (i % 8)
+		} else {
+			cCol.NullCount++
+		}
+	}
+	if !col.isText {
+		if buf == nil {
+			cCol.Float64 = (*C.double)(C.calloc(C.size_t(n+1), C.sizeof_double))
+			buf = &cCol
+		}
+		values := unsafe.Slice(buf.Float64, n)
+		for i, num := range col.nums {
+			if values[i] = C.double(num); !col.valid[i] {
+				values[i] = C.double(math.NaN())
+			}
+		}
+		return cCol
+	}
+	var size int
+	for _, str := range col.strs {
+		size += len(str)
+	}
+	cCol.Type, cCol.DataSize = String, C.longlong(size)
+	cCol.Offsets = (*C.longlong)(C.calloc(C.size_t(n+1), C.sizeof_longlong))
+	cCol.Data = (*C.char)(C.malloc(C.size_t(size + 1)))
+	offsets, data := unsafe.Slice(cCol.Offsets, n+1), unsafe.Slice((*byte)(unsafe.Pointer(cCol.Data)), size)
+	var offset int
+	for i, str := range col.strs {
+		offset += copy(data[offset:], str)
+		offsets[i+1] = C.longlong(offset)
+	}
+	return cCol
+}
+
+// goRowsToC convert two-dimensional array of the cell values to the C
+// GetRowsResult structure.
+func goRowsToC(rows [][]string) C.struct_GetRowsResult {
+	return C.struct_GetRowsResult{Rows: stringMatrixToC(rows)}
+}
+
+// stringMatrixToC packs the two-dimensional array of the strings into the C
+// StringMatrix structure, the values of all cells are copied into a single
+// buffer instead of allocating a C string for each cell.
+func stringMatrixToC(rows [][]string) C.struct_StringMatrix {
+	var cells, size int
+	for _, row := range rows {
+		cells += len(row)
+		for _, cell := range row {
+			size += len(cell)
+		}
+	}
+	matrix := C.struct_StringMatrix{RowsLen: C.int(len(rows)), CellsLen: C.int(cells), DataSize: C.longlong(size)}
+	matrix.RowLens = (*C.int)(C.calloc(C.size_t(len(rows)+1), C.sizeof_int))
+	matrix.Offsets = (*C.longlong)(C.calloc(C.size_t(cells+1), C.sizeof_longlong))
+	matrix.Data = (*C.char)(C.malloc(C.size_t(size + 1)))
+	rowLens, offsets := unsafe.Slice(matrix.RowLens, len(rows)), unsafe.Slice(matrix.Offsets, cells+1)
+	data := unsafe.Slice((*byte)(unsafe.Pointer(matrix.Data)), size)
+	var cell, offset int
+	for i, row := range rows {
+		rowLens[i] = C.int(len(row))
+		for _, val := range row {
+			offset += copy(data[offset:], val)
+			cell++
+			offsets[cell] = C.longlong(offset)
+		}
+	}
+	return matrix
+}
+
+// cReader implements io.Reader by reading each chunk of bytes from the C
+// callback function.
+type cReader struct {
+	fn C.Reader
+}
+
+// Read reads up to maxChunkSize bytes from the C callback function into the
+// given buffer.
+func (r cReader) Read(p []byte) (int, error) {
+	if len(p) == 0 {
+		return 0, nil
+	}
+	if len(p) > maxChunkSize {
+		p = p[:maxChunkSize]
+	}
+	n := int(C.callReader(r.fn, (*C.uchar)(unsafe.Pointer(&p[0])), C.int(len(p))))
+	if n < 0 {
+		return 0, errReader
+	}
+	if n == 0 {
+		return 0, io.EOF
+	}
+	return n, nil
+}
+
+// cWriter implements io.Writer by passing each chunk of bytes to the C
+// callback function.
+type cWriter struct {
+	fn C.Writer
+}
+
+// Write writes the bytes to the C callback function in chunks of up to
+// maxChunkSize bytes.
+func (w cWriter) Write(p []byte) (int, error) {
+	var n int
+	for n < len(p) {
+		chunk := p[n:]
+		if len(chunk) > maxChunkSize {
+			chunk = chunk[:maxChunkSize]
+		}
+		if int(C.callWriter(w.fn, (*C.uchar)(unsafe.Pointer(&chunk[0])), C.int(len(chunk)))) != len(chunk) {
+			return n, errWriter
+		}
+		n += len(chunk)
+	}
+	return n, nil
+}
+
 // AddChart provides the method to add chart in a sheet by given chart format
 // set (such as offset, scale, aspect ratio setting and print settings) and
 // properties set.
 //
 //export AddChart
 func AddChart(idx int, sheet, cell *C.char, chart *C.struct_Chart, length int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	charts := make([]*excelize.Chart, length)
 	for i, c := range unsafe.Slice(chart, length) {
 		goVal, err := cValueToGo(reflect.ValueOf(c), reflect.TypeOf(excelize.Chart{}))
@@ -461,12 +1378,12 @@ func AddChart(idx int, sheet, cell *C.char, chart *C.struct_Chart, length int) *
 		if err := f.(*excelize.File).AddChart(C.GoString(sheet), C.GoString(cell), charts[0], charts[1:]...); err != nil {
 			return C.CString(err.Error())
 		}
-		return C.CString(emptyString)
+		return nil
 	}
 	if err := f.(*excelize.File).AddChart(C.GoString(sheet), C.GoString(cell), charts[0]); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // AddChartSheet provides the method to create a chartsheet by given chart
@@ -476,10 +1393,11 @@ func AddChart(idx int, sheet, cell *C.char, chart *C.struct_Chart, length int) *
 //
 //export AddChartSheet
 func AddChartSheet(idx int, sheet *C.char, chart *C.struct_Chart, length int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	charts := make([]*excelize.Chart, length)
 	for i, c := range unsafe.Slice(chart, length) {
 		goVal, err := cValueToGo(reflect.ValueOf(c), reflect.TypeOf(excelize.Chart{}))
@@ -493,12 +1411,12 @@ func AddChartSheet(idx int, sheet *C.char, chart *C.struct_Chart, length int) *C
 		if err := f.(*excelize.File).AddChartSheet(C.GoString(sheet), charts[0], charts[1:]...); err != nil {
 			return C.CString(err.Error())
 		}
-		return C.CString(emptyString)
+		return nil
 	}
 	if err := f.(*excelize.File).AddChartSheet(C.GoString(sheet), charts[0]); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // AddComment provides the method to add comments in a sheet by giving the
@@ -514,14 +1432,15 @@ func AddComment(idx int, sheet *C.char, opts *C.struct_Comment) *C.char {
 		return C.CString(err.Error())
 	}
 	comment = goVal.Elem().Interface().(excelize.Comment)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).AddComment(C.GoString(sheet), comment); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // AddFormControl provides the method to add form control button in a worksheet
@@ -538,14 +1457,15 @@ func AddFormControl(idx int, sheet *C.char, opts *C.struct_FormControl) *C.char
 		return C.CString(err.Error())
 	}
 	options = goVal.Elem().Interface().(excelize.FormControl)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).AddFormControl(C.GoString(sheet), options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // Add picture in a sheet by given picture format set (such as offset, scale,
@@ -554,10 +1474,11 @@ func AddFormControl(idx int, sheet *C.char, opts *C.struct_FormControl) *C.char
 //
 //export AddPicture
 func AddPicture(idx int, sheet, cell, name *C.char, opts *C.struct_GraphicOptions) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if opts != nil {
 		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.GraphicOptions{}))
 		if err != nil {
@@ -567,12 +1488,12 @@ func AddPicture(idx int, sheet, cell, name *C.char, opts *C.struct_GraphicOption
 		if err := f.(*excelize.File).AddPicture(C.GoString(sheet), C.GoString(cell), C.GoString(name), &options); err != nil {
 			return C.CString(err.Error())
 		}
-		return C.CString(emptyString)
+		return nil
 	}
 	if err := f.(*excelize.File).AddPicture(C.GoString(sheet), C.GoString(cell), C.GoString(name), nil); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // AddPictureFromBytes provides the method to add picture in a sheet by given
@@ -585,10 +1506,11 @@ func AddPicture(idx int, sheet, cell, name *C.char, opts *C.struct_GraphicOption
 //
 //export AddPictureFromBytes
 func AddPictureFromBytes(idx int, sheet, cell *C.char, pic *C.struct_Picture) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	goVal, err := cValueToGo(reflect.ValueOf(*pic), reflect.TypeOf(excelize.Picture{}))
 	if err != nil {
 		return C.CString(err.Error())
@@ -597,7 +1519,7 @@ func AddPictureFromBytes(idx int, sheet, cell *C.char, pic *C.struct_Picture) *C
 	if err := f.(*excelize.File).AddPictureFromBytes(C.GoString(sheet), C.GoString(cell), &options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // AddPivotTable provides the method to add pivot table by given pivot table
@@ -606,10 +1528,11 @@ func AddPictureFromBytes(idx int, sheet, cell *C.char, pic *C.struct_Picture) *C
 //
 //export AddPivotTable
 func AddPivotTable(idx int, opts *C.struct_PivotTableOptions) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.PivotTableOptions{}))
 	if err != nil {
 		return C.CString(err.Error())
@@ -618,7 +1541,7 @@ func AddPivotTable(idx int, opts *C.struct_PivotTableOptions) *C.char {
 	if err := f.(*excelize.File).AddPivotTable(&options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // AddShape provides the method to add shape in a sheet by given worksheet
@@ -633,14 +1556,15 @@ func AddShape(idx int, sheet *C.char, opts *C.struct_Shape) *C.char {
 		return C.CString(err.Error())
 	}
 	options = goVal.Elem().Interface().(excelize.Shape)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).AddShape(C.GoString(sheet), &options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // AddSlicer function inserts a slicer by giving the worksheet name and slicer
@@ -654,14 +1578,15 @@ func AddSlicer(idx int, sheet *C.char, opts *C.struct_SlicerOptions) *C.char {
 		return C.CString(err.Error())
 	}
 	options = goVal.Elem().Interface().(excelize.SlicerOptions)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).AddSlicer(C.GoString(sheet), &options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // AddSparkline provides a function to add sparklines to the worksheet by
@@ -678,14 +1603,15 @@ func AddSparkline(idx int, sheet *C.char, opts *C.struct_SparklineOptions) *C.ch
 		return C.CString(err.Error())
 	}
 	options = goVal.Elem().Interface().(excelize.SparklineOptions)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).AddSparkline(C.GoString(sheet), &options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // AddTable provides the method to add table in a worksheet by given worksheet
@@ -699,14 +1625,15 @@ func AddTable(idx int, sheet *C.char, table *C.struct_Table) *C.char {
 		return C.CString(err.Error())
 	}
 	tbl = goVal.Elem().Interface().(excelize.Table)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).AddTable(C.GoString(sheet), &tbl); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // AddVBAProject provides the method to add vbaProject.bin file which contains
@@ -714,15 +1641,16 @@ func AddTable(idx int, sheet *C.char, table *C.struct_Table) *C.char {
 //
 //export AddVBAProject
 func AddVBAProject(idx int, file *C.uchar, fileLen C.int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	buf := C.GoBytes(unsafe.Pointer(file), fileLen)
 	if err := f.(*excelize.File).AddVBAProject(buf); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // AutoFilter provides the method to add auto filter in a worksheet by given
@@ -731,10 +1659,11 @@ func AddVBAProject(idx int, file *C.uchar, fileLen C.int) *C.char {
 //
 //export AutoFilter
 func AutoFilter(idx int, sheet, rangeRef *C.char, opts *C.struct_AutoFilterOptions, length int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	options := make([]excelize.AutoFilterOptions, length)
 	for i, val := range unsafe.Slice(opts, length) {
 		goVal, err := cValueToGo(reflect.ValueOf(val), reflect.TypeOf(excelize.AutoFilterOptions{}))
@@ -746,7 +1675,7 @@ func AutoFilter(idx int, sheet, rangeRef *C.char, opts *C.struct_AutoFilterOptio
 	if err := f.(*excelize.File).AutoFilter(C.GoString(sheet), C.GoString(rangeRef), options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // CalcCellValue provides a function to get calculated cell value. This feature
@@ -757,14 +1686,15 @@ func AutoFilter(idx int, sheet, rangeRef *C.char, opts *C.struct_AutoFilterOptio
 //export CalcCellValue
 func CalcCellValue(idx int, sheet, cell *C.char, opts *C.struct_Options) C.struct_StringErrorResult {
 	var options excelize.Options
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
-		return C.struct_StringErrorResult{val: C.CString(emptyString), err: C.CString(errFilePtr)}
+		return C.struct_StringErrorResult{err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	if opts != nil {
 		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
 		if err != nil {
-			return C.struct_StringErrorResult{val: C.CString(emptyString), err: C.CString(err.Error())}
+			return C.struct_StringErrorResult{err: C.CString(err.Error())}
 		}
 		options = goVal.Elem().Interface().(excelize.Options)
 	}
@@ -772,7 +1702,57 @@ func CalcCellValue(idx int, sheet, cell *C.char, opts *C.struct_Options) C.struc
 	if err != nil {
 		return C.struct_StringErrorResult{val: C.CString(val), err: C.CString(err.Error())}
 	}
-	return C.struct_StringErrorResult{val: C.CString(val), err: C.CString(emptyString)}
+	return C.struct_StringErrorResult{val: C.CString(val)}
+}
+
+// CalcCellValues provides a function to get the calculated values of cells in
+// bulk by given worksheet name and the range reference or an array of cell
+// references. The values of the cells in the range are returned row by row,
+// with the number of columns in the range. The intermediate results are kept
+// in the calculation cache of the workbook, so the formulas referenced by many
+// cells are calculated once. The cells are calculated one by one if the given
+// number of goroutines is less than 2, otherwise concurrently by up to the
+// number of goroutines, which share the calculation cache of the workbook. The
+// error of calculating each cell is returned in the Errors field at the same
+// index as the value of it.
+//
+//export CalcCellValues
+func CalcCellValues(idx int, sheet, rangeRef *C.char, cells **C.char, cellsLen, workers int, opts *C.struct_Options) C.struct_CalcCellValuesResult {
+	var options excelize.Options
+	f, unlock, ok := files.rLock(idx)
+	if !ok {
+		return C.struct_CalcCellValuesResult{Err: C.CString(errFilePtr)}
+	}
+	defer unlock()
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_CalcCellValuesResult{Err: C.CString(err.Error())}
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+	}
+	refs, cols, err := cellRefs(rangeRef, cells, cellsLen)
+	if err != nil {
+		return C.struct_CalcCellValuesResult{Err: C.CString(err.Error())}
+	}
+	result := C.struct_CalcCellValuesResult{ValuesLen: C.int(len(refs)), ErrorsLen: C.int(len(refs)), Cols: C.int(cols)}
+	if len(refs) == 0 {
+		return result
+	}
+	result.Values = (**C.char)(C.calloc(C.size_t(len(refs)), C.size_t(unsafe.Sizeof((*C.char)(nil)))))
+	result.Errors = (**C.char)(C.calloc(C.size_t(len(refs)), C.size_t(unsafe.Sizeof((*C.char)(nil)))))
+	if workers < 1 {
+		workers = 1
+	}
+	sheetName := C.GoString(sheet)
+	values, errs := unsafe.Slice(result.Values, len(refs)), unsafe.Slice(result.Errors, len(refs))
+	forEach(len(refs), workers, func(i int) {
+		val, err := f.(*excelize.File).CalcCellValue(sheetName, refs[i], options)
+		if values[i] = C.CString(val); err != nil {
+			errs[i] = C.CString(err.Error())
+		}
+	})
+	return result
 }
 
 // CellNameToCoordinates converts alphanumeric cell name to [X, Y] coordinates
@@ -784,7 +1764,97 @@ func CellNameToCoordinates(cell *C.char) C.struct_CellNameToCoordinatesResult {
 	if err != nil {
 		return C.struct_CellNameToCoordinatesResult{col: C.int(col), row: C.int(row), err: C.CString(err.Error())}
 	}
-	return C.struct_CellNameToCoordinatesResult{col: C.int(col), row: C.int(row), err: C.CString(emptyString)}
+	return C.struct_CellNameToCoordinatesResult{col: C.int(col), row: C.int(row)}
+}
+
+// Cols returns a columns iterator, used for streaming reading data for a
+// worksheet with a large data. The columns specifies the range of columns to
+// be read, for example "B:D" or "C", all columns will be read if it is empty.
+// The options will be applied on reading the cell values of each column.
+//
+//export Cols
+func Cols(idx int, sheet, columns *C.char, opts *C.struct_Options) C.struct_IntErrorResult {
+	var (
+		options  excelize.Options
+		min, max int
+		err      error
+	)
+	f, unlock, ok := files.rLock(idx)
+	if !ok {
+		return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(errFilePtr)}
+	}
+	defer unlock()
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+	}
+	if colsRange := C.GoString(columns); colsRange != "" {
+		cols := strings.Split(colsRange, ":")
+		if min, err = excelize.ColumnNameToNumber(cols[0]); err != nil {
+			return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
+		}
+		if max, err = excelize.ColumnNameToNumber(cols[len(cols)-1]); err != nil {
+			return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
+		}
+		if max < min {
+			min, max = max, min
+		}
+	}
+	cols, err := f.(*excelize.File).Cols(C.GoString(sheet))
+	if err != nil {
+		return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
+	}
+	colsIdx := colsIter.addChild(idx, &colsIterator{cols: cols, opts: options, min: min, max: max})
+	return C.struct_IntErrorResult{val: C.int(colsIdx)}
+}
+
+// ColsNext reads the cell values of up to the given number of columns from the
+// columns iterator. An empty result indicates that all columns in the range
+// have been read. The cell values of each column are returned in the Row
+// field of the GetRowsResult structure.
+//
+//export ColsNext
+func ColsNext(colsIdx, batchSize int) C.struct_GetRowsResult {
+	it, _, unlock, errPtr := colsIter.lockChild(colsIdx, true, errColsIterPtr)
+	if errPtr != "" {
+		return C.struct_GetRowsResult{err: C.CString(errPtr)}
+	}
+	defer unlock()
+	iter := it.(*colsIterator)
+	if batchSize < 1 {
+		batchSize = 1
+	}
+	cols := make([][]string, 0, batchSize)
+	for len(cols) < batchSize && (iter.max == 0 || iter.col < iter.max) && iter.cols.Next() {
+		if iter.col++; iter.col < iter.min {
+			continue
+		}
+		col, err := iter.cols.Rows(iter.opts)
+		if err != nil {
+			return C.struct_GetRowsResult{err: C.CString(err.Error())}
+		}
+		cols = append(cols, col)
+	}
+	if err := iter.cols.Error(); err != nil {
+		return C.struct_GetRowsResult{err: C.CString(err.Error())}
+	}
+	return goRowsToC(cols)
+}
+
+// ColsClose releases the columns iterator.
+//
+//export ColsClose
+func ColsClose(colsIdx int) *C.char {
+	_, _, unlock, errPtr := colsIter.lockChild(colsIdx, true, errColsIterPtr)
+	if errPtr != "" {
+		return C.CString(errPtr)
+	}
+	defer unlock()
+	colsIter.Delete(colsIdx)
+	return nil
 }
 
 // ColumnNameToNumber provides a function to convert Excel sheet column name
@@ -797,7 +1867,7 @@ func ColumnNameToNumber(name *C.char) C.struct_IntErrorResult {
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(col), err: C.CString(err.Error())}
 	}
-	return C.struct_IntErrorResult{val: C.int(col), err: C.CString(emptyString)}
+	return C.struct_IntErrorResult{val: C.int(col)}
 }
 
 // ColumnNumberToName provides a function to convert the integer to Excel
@@ -809,7 +1879,7 @@ func ColumnNumberToName(num int) C.struct_StringErrorResult {
 	if err != nil {
 		return C.struct_StringErrorResult{val: C.CString(col), err: C.CString(err.Error())}
 	}
-	return C.struct_StringErrorResult{val: C.CString(col), err: C.CString(emptyString)}
+	return C.struct_StringErrorResult{val: C.CString(col)}
 }
 
 // CoordinatesToCellName converts [X, Y] coordinates to alpha-numeric cell name
@@ -821,22 +1891,26 @@ func CoordinatesToCellName(col, row int, abs bool) C.struct_StringErrorResult {
 	if err != nil {
 		return C.struct_StringErrorResult{val: C.CString(cell), err: C.CString(err.Error())}
 	}
-	return C.struct_StringErrorResult{val: C.CString(cell), err: C.CString(emptyString)}
+	return C.struct_StringErrorResult{val: C.CString(cell)}
 }
 
 // Close closes and cleanup the open temporary file for the spreadsheet.
 //
 //export Close
 func Close(idx int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	defer files.Delete(idx)
+	rowsIter.deleteChildren(idx, func(it interface{}) { _ = it.(*rowsIterator).rows.Close() })
+	colsIter.deleteChildren(idx, nil)
+	sw.deleteChildren(idx, nil)
 	if err := f.(*excelize.File).Close(); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // CopySheet provides a function to duplicate a worksheet by gave source and
@@ -845,14 +1919,15 @@ func Close(idx int) *C.char {
 //
 //export CopySheet
 func CopySheet(idx, from, to int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).CopySheet(from, to); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // DeleteChart provides a function to delete chart in spreadsheet by given
@@ -860,14 +1935,15 @@ func CopySheet(idx, from, to int) *C.char {
 //
 //export DeleteChart
 func DeleteChart(idx int, sheet, cell *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).DeleteChart(C.GoString(sheet), C.GoString(cell)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // DeleteComment provides the method to delete comment in a sheet by given
@@ -875,14 +1951,15 @@ func DeleteChart(idx int, sheet, cell *C.char) *C.char {
 //
 //export DeleteComment
 func DeleteComment(idx int, sheet, cell *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).DeleteComment(C.GoString(sheet), C.GoString(cell)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // DeleteDefinedName provides a function to delete the defined names of the
@@ -897,14 +1974,15 @@ func DeleteDefinedName(idx int, definedName *C.struct_DefinedName) *C.char {
 		return C.CString(err.Error())
 	}
 	df = goVal.Elem().Interface().(excelize.DefinedName)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).DeleteDefinedName(&df); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // DeletePicture provides a function to delete charts in spreadsheet by given
@@ -913,14 +1991,15 @@ func DeleteDefinedName(idx int, definedName *C.struct_DefinedName) *C.char {
 //
 //export DeletePicture
 func DeletePicture(idx int, sheet, cell *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).DeletePicture(C.GoString(sheet), C.GoString(cell)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // DeleteSheet provides a function to delete worksheet in a workbook by given
@@ -931,28 +2010,30 @@ func DeletePicture(idx int, sheet, cell *C.char) *C.char {
 //
 //export DeleteSheet
 func DeleteSheet(idx int, sheet *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).DeleteSheet(C.GoString(sheet)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // DeleteSlicer provides the method to delete a slicer by a given slicer name.
 //
 //export DeleteSlicer
 func DeleteSlicer(idx int, name *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).DeleteSlicer(C.GoString(name)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // DuplicateRow inserts a copy of specified row (by its Excel row number)
@@ -963,14 +2044,15 @@ func DeleteSlicer(idx int, name *C.char) *C.char {
 //
 //export DuplicateRow
 func DuplicateRow(idx int, sheet *C.char, row int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).DuplicateRow(C.GoString(sheet), row); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // DuplicateRowTo inserts a copy of specified row by it Excel number to
@@ -982,14 +2064,45 @@ func DuplicateRow(idx int, sheet *C.char, row int) *C.char {
 //
 //export DuplicateRowTo
 func DuplicateRowTo(idx int, sheet *C.char, row, row2 int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).DuplicateRowTo(C.GoString(sheet), row, row2); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
+}
+
+// FreeCString release the memory of the C string returned by the library.
+//
+//export FreeCString
+func FreeCString(str *C.char) {
+	C.free(unsafe.Pointer(str))
+}
+
+// FreeCValue release the memory allocated for the fields of the C structure
+// returned by the library by given structure name and pointer.
+//
+//export FreeCValue
+func FreeCValue(name *C.char, ptr unsafe.Pointer) {
+	if typ, ok := cResultTypes[C.GoString(name)]; ok && ptr != nil {
+		freeCValue(reflect.NewAt(typ, ptr).Elem())
+	}
+}
+
+// GetHandleCounts provides a function to get the number of live handles of the
+// opened workbooks, stream writers, rows and columns iterators.
+//
+//export GetHandleCounts
+func GetHandleCounts() C.struct_HandleCounts {
+	return C.struct_HandleCounts{
+		Files:         C.int(files.count()),
+		StreamWriters: C.int(sw.count()),
+		Rows:          C.int(rowsIter.count()),
+		Cols:          C.int(colsIter.count()),
+	}
 }
 
 // GetActiveSheetIndex provides a function to get active sheet index of the
@@ -997,21 +2110,75 @@ func DuplicateRowTo(idx int, sheet *C.char, row, row2 int) *C.char {
 //
 //export GetActiveSheetIndex
 func GetActiveSheetIndex(idx int) int {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return 0
 	}
+	defer unlock()
 	return f.(*excelize.File).GetActiveSheetIndex()
 }
 
+// GetAllRows provides a function to get all the rows in the worksheets by
+// given worksheet names, or in all the worksheets of the workbook if the names
+// were not given. The worksheets are read one by one if the given number of
+// goroutines is less than 2, otherwise concurrently by up to the number of
+// goroutines. The error of reading each worksheet is returned in the Err field
+// of it.
+//
+//export GetAllRows
+func GetAllRows(idx int, sheets **C.char, sheetsLen, workers int, opts *C.struct_Options) C.struct_GetAllRowsResult {
+	var options excelize.Options
+	f, unlock, ok := files.rLock(idx)
+	if !ok {
+		return C.struct_GetAllRowsResult{Err: C.CString(errFilePtr)}
+	}
+	defer unlock()
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_GetAllRowsResult{Err: C.CString(err.Error())}
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+	}
+	names := f.(*excelize.File).GetSheetList()
+	if sheets != nil {
+		names = make([]string, sheetsLen)
+		for i, sheet := range unsafe.Slice(sheets, sheetsLen) {
+			names[i] = C.GoString(sheet)
+		}
+	}
+	if workers < 1 {
+		workers = 1
+	}
+	results := make([]C.struct_GetRowsResult, len(names))
+	forEach(len(names), workers, func(i int) {
+		rows, err := f.(*excelize.File).GetRows(names[i], options)
+		if err != nil {
+			results[i] = C.struct_GetRowsResult{err: C.CString(err.Error())}
+			return
+		}
+		results[i] = goRowsToC(rows)
+	})
+	result := C.struct_GetAllRowsResult{SheetsLen: C.int(len(names))}
+	if len(names) > 0 {
+		result.Sheets = (*C.struct_SheetRows)(C.calloc(C.size_t(len(names)), C.sizeof_struct_SheetRows))
+	}
+	sheetRows := unsafe.Slice(result.Sheets, len(names))
+	for i, res := range results {
+		sheetRows[i] = C.struct_SheetRows{Sheet: C.CString(names[i]), Rows: res.Rows, Err: res.err}
+	}
+	return result
+}
+
 // GetAppProps provides a function to get document application properties.
 //
 //export GetAppProps
 func GetAppProps(idx int) C.struct_GetAppPropsResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_GetAppPropsResult{err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	opts, err := f.(*excelize.File).GetAppProps()
 	if err != nil {
 		return C.struct_GetAppPropsResult{err: C.CString(err.Error())}
@@ -1020,7 +2187,7 @@ func GetAppProps(idx int) C.struct_GetAppPropsResult {
 	if err != nil {
 		return C.struct_GetAppPropsResult{err: C.CString(err.Error())}
 	}
-	return C.struct_GetAppPropsResult{opts: cVal.Elem().Interface().(C.struct_AppProperties), err: C.CString(emptyString)}
+	return C.struct_GetAppPropsResult{opts: cVal.Elem().Interface().(C.struct_AppProperties)}
 }
 
 // GetCellFormula provides a function to get formula from cell by given
@@ -1028,15 +2195,16 @@ func GetAppProps(idx int) C.struct_GetAppPropsResult {
 //
 //export GetCellFormula
 func GetCellFormula(idx int, sheet, cell *C.char) C.struct_StringErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
-		return C.struct_StringErrorResult{val: C.CString(emptyString), err: C.CString(errFilePtr)}
+		return C.struct_StringErrorResult{err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	formula, err := f.(*excelize.File).GetCellFormula(C.GoString(sheet), C.GoString(cell))
 	if err != nil {
 		return C.struct_StringErrorResult{val: C.CString(formula), err: C.CString(err.Error())}
 	}
-	return C.struct_StringErrorResult{val: C.CString(formula), err: C.CString(emptyString)}
+	return C.struct_StringErrorResult{val: C.CString(formula)}
 }
 
 // GetCellHyperLink gets a cell hyperlink based on the given worksheet name and
@@ -1046,15 +2214,16 @@ func GetCellFormula(idx int, sheet, cell *C.char) C.struct_StringErrorResult {
 //
 //export GetCellHyperLink
 func GetCellHyperLink(idx int, sheet, cell *C.char) C.struct_GetCellHyperLinkResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
-		return C.struct_GetCellHyperLinkResult{link: false, target: C.CString(emptyString), err: C.CString(errFilePtr)}
+		return C.struct_GetCellHyperLinkResult{link: false, err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	link, target, err := f.(*excelize.File).GetCellHyperLink(C.GoString(sheet), C.GoString(cell))
 	if err != nil {
 		return C.struct_GetCellHyperLinkResult{link: C._Bool(link), target: C.CString(target), err: C.CString(err.Error())}
 	}
-	return C.struct_GetCellHyperLinkResult{link: C._Bool(link), target: C.CString(target), err: C.CString(emptyString)}
+	return C.struct_GetCellHyperLinkResult{link: C._Bool(link), target: C.CString(target)}
 }
 
 // GetCellRichText provides a function to get rich text of cell by given
@@ -1062,10 +2231,11 @@ func GetCellHyperLink(idx int, sheet, cell *C.char) C.struct_GetCellHyperLinkRes
 //
 //export GetCellRichText
 func GetCellRichText(idx int, sheet, cell *C.char) C.struct_GetCellRichTextResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_GetCellRichTextResult{Err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	runs, err := f.(*excelize.File).GetCellRichText(C.GoString(sheet), C.GoString(cell))
 	if err != nil {
 		return C.struct_GetCellRichTextResult{Err: C.CString(err.Error())}
@@ -1078,7 +2248,7 @@ func GetCellRichText(idx int, sheet, cell *C.char) C.struct_GetCellRichTextResul
 		}
 		*(*C.struct_RichTextRun)(unsafe.Pointer(uintptr(unsafe.Pointer(cArray)) + uintptr(i)*unsafe.Sizeof(C.struct_RichTextRun{}))) = cVal.Elem().Interface().(C.struct_RichTextRun)
 	}
-	return C.struct_GetCellRichTextResult{RunsLen: C.int(len(runs)), Runs: (*C.struct_RichTextRun)(cArray), Err: C.CString(emptyString)}
+	return C.struct_GetCellRichTextResult{RunsLen: C.int(len(runs)), Runs: (*C.struct_RichTextRun)(cArray)}
 }
 
 // GetCellStyle provides a function to get cell style index by given worksheet
@@ -1086,43 +2256,254 @@ func GetCellRichText(idx int, sheet, cell *C.char) C.struct_GetCellRichTextResul
 //
 //export GetCellStyle
 func GetCellStyle(idx int, sheet, cell *C.char) C.struct_IntErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	idx, err := f.(*excelize.File).GetCellStyle(C.GoString(sheet), C.GoString(cell))
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(idx), err: C.CString(err.Error())}
 	}
-	return C.struct_IntErrorResult{val: C.int(idx), err: C.CString(emptyString)}
+	return C.struct_IntErrorResult{val: C.int(idx)}
+}
+
+// GetCellValue provides a function to get formatted value from cell by given
+// worksheet name and cell reference in spreadsheet. The return value is
+// converted to the `string` data type. If the cell format can be applied to
+// the value of a cell, the applied value will be returned, otherwise the
+// original value will be returned. All cells' values will be the same in a
+// merged range.
+//
+//export GetCellValue
+func GetCellValue(idx int, sheet, cell *C.char, opts *C.struct_Options) C.struct_StringErrorResult {
+	var options excelize.Options
+	f, unlock, ok := files.rLock(idx)
+	if !ok {
+		return C.struct_StringErrorResult{err: C.CString(errFilePtr)}
+	}
+	defer unlock()
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_StringErrorResult{err: C.CString(err.Error())}
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+	}
+	val, err := f.(*excelize.File).GetCellValue(C.GoString(sheet), C.GoString(cell), options)
+	if err != nil {
+		return C.struct_StringErrorResult{val: C.CString(val), err: C.CString(err.Error())}
+	}
+	return C.struct_StringErrorResult{val: C.CString(val)}
+}
+
+// GetCellValues provides a function to get the values of cells in bulk by
+// given worksheet name and the range reference or an array of cell references.
+// The values of the cells in the range are returned row by row, with the
+// number of columns in the range. If typed is false, the formatted values are
+// returned as strings, otherwise the raw values are returned in the native
+// data types by the cell types.
+//
+//export GetCellValues
+func GetCellValues(idx int, sheet, rangeRef *C.char, cells **C.char, cellsLen int, typed bool, opts *C.struct_Options) C.struct_GetCellValuesResult {
+	var (
+		options excelize.Options
+		refs    []string
+		cols    int
+		err     error
+	)
+	f, unlock, ok := files.rLock(idx)
+	if !ok {
+		return C.struct_GetCellValuesResult{Err: C.CString(errFilePtr)}
+	}
+	defer unlock()
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_GetCellValuesResult{Err: C.CString(err.Error())}
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+	}
+	if rangeRef != nil {
+		return rangeCellValuesToC(f.(*excelize.File), C.GoString(sheet), C.GoString(rangeRef), typed, options)
+	}
+	if refs, cols, err = cellRefs(rangeRef, cells, cellsLen); err != nil {
+		return C.struct_GetCellValuesResult{Err: C.CString(err.Error())}
+	}
+	if len(refs) == 0 {
+		return C.struct_GetCellValuesResult{Cols: C.int(cols)}
+	}
+	result := C.struct_GetCellValuesResult{
+		ValuesLen: C.int(len(refs)),
+		Values:    (*C.struct_Interface)(C.calloc(C.size_t(len(refs)), C.sizeof_struct_Interface)),
+		Cols:      C.int(cols),
+	}
+	sheetName, values, t := C.GoString(sheet), unsafe.Slice(result.Values, len(refs)), newTypedCells(f.(*excelize.File))
+	for i, cell := range refs {
+		if values[i], err = cellValueToC(t, sheetName, cell, typed, options); err != nil {
+			result.Err = C.CString(err.Error())
+			break
+		}
+	}
+	return result
+}
+
+// rangeCellValuesToC returns the values of the cells in the range row by row
+// in the C GetCellValuesResult structure, the rows of the worksheet are read
+// once up to the last row of the range.
+func rangeCellValuesToC(f *excelize.File, sheet, rangeRef string, typed bool, opts excelize.Options) C.struct_GetCellValuesResult {
+	col1, row1, col2, row2, err := rangeRefToCoordinates(rangeRef)
+	if err != nil {
+		return C.struct_GetCellValuesResult{Err: C.CString(err.Error())}
+	}
+	if typed {
+		opts = excelize.Options{RawCellValue: true}
+	}
+	r, err := newRowReader(f, sheet, opts)
+	if err != nil {
+		return C.struct_GetCellValuesResult{Err: C.CString(err.Error())}
+	}
+	defer r.close()
+	rows, err := r.readRows(row1, row2)
+	if err != nil {
+		return C.struct_GetCellValuesResult{Err: C.CString(err.Error())}
+	}
+	cols, n := col2-col1+1, (col2-col1+1)*(row2-row1+1)
+	result := C.struct_GetCellValuesResult{
+		ValuesLen: C.int(n),
+		Values:    (*C.struct_Interface)(C.calloc(C.size_t(n), C.sizeof_struct_Interface)),
+		Cols:      C.int(cols),
+	}
+	values := unsafe.Slice(result.Values, n)
+	for i := range values {
+		var cell sheetCell
+		if row, col := i/cols, col1+i%cols; row < len(rows) && col <= len(rows[row]) {
+			cell = rows[row][col-1]
+		}
+		if typed {
+			values[i] = r.cellToC(cell, false)
+			continue
+		}
+		values[i] = C.struct_Interface{Type: String, String: C.CString(cell.raw)}
+	}
+	return result
 }
 
-// GetCellValue provides a function to get formatted value from cell by given
-// worksheet name and cell reference in spreadsheet. The return value is
-// converted to the `string` data type. If the cell format can be applied to
-// the value of a cell, the applied value will be returned, otherwise the
-// original value will be returned. All cells' values will be the same in a
-// merged range.
+// GetColumnBuffers provides a function to get the values of the cells in the
+// range of the worksheet column by column, in the layout of the Arrow columnar
+// format. The used range of the worksheet is read if the range reference is
+// NULL. A column is a float column if all of its values are numbers, otherwise
+// it's a string column, and the blank cells are nulls. If header is true, the
+// first row of the range is the names of the columns, otherwise the columns are
+// named by the column names of the worksheet. The rows are read in a single
+// pass up to the last row of the range. The values of the float columns are
+// written to the Float64 buffers of the given buffers with the same names
+// instead of the buffers allocated by the library, the Length of each given
+// buffer is the number of values it can hold.
 //
-//export GetCellValue
-func GetCellValue(idx int, sheet, cell *C.char, opts *C.struct_Options) C.struct_StringErrorResult {
+//export GetColumnBuffers
+func GetColumnBuffers(idx int, sheet, rangeRef *C.char, header bool, opts *C.struct_Options, bufs *C.struct_ColumnBuffer, bufsLen int) C.struct_GetColumnBuffersResult {
 	var options excelize.Options
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
-		return C.struct_StringErrorResult{val: C.CString(emptyString), err: C.CString(errFilePtr)}
+		return C.struct_GetColumnBuffersResult{Err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	if opts != nil {
 		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
 		if err != nil {
-			return C.struct_StringErrorResult{val: C.CString(emptyString), err: C.CString(err.Error())}
+			return C.struct_GetColumnBuffersResult{Err: C.CString(err.Error())}
 		}
 		options = goVal.Elem().Interface().(excelize.Options)
 	}
-	val, err := f.(*excelize.File).GetCellValue(C.GoString(sheet), C.GoString(cell), options)
+	options.RawCellValue = true
+	reader, err := newRowReader(f.(*excelize.File), C.GoString(sheet), options)
 	if err != nil {
-		return C.struct_StringErrorResult{val: C.CString(val), err: C.CString(err.Error())}
+		return C.struct_GetColumnBuffersResult{Err: C.CString(err.Error())}
+	}
+	defer reader.close()
+	col1, row1, col2, row2 := 1, 1, 0, 0
+	if rangeRef != nil {
+		if col1, row1, col2, row2, err = rangeRefToCoordinates(C.GoString(rangeRef)); err != nil {
+			return C.struct_GetColumnBuffersResult{Err: C.CString(err.Error())}
+		}
+	}
+	rows, err := reader.readRows(row1, row2)
+	if err != nil {
+		return C.struct_GetColumnBuffersResult{Err: C.CString(err.Error())}
+	}
+	if rangeRef == nil {
+		row2 = len(rows)
+		for _, row := range rows {
+			if len(row) > col2 {
+				col2 = len(row)
+			}
+		}
+	}
+	cols := make([]columnBuffer, col2-col1+1)
+	for c := range cols {
+		name, err := excelize.ColumnNumberToName(col1 + c)
+		if err != nil {
+			return C.struct_GetColumnBuffersResult{Err: C.CString(err.Error())}
+		}
+		cols[c].name = name
+	}
+	for r := row1; r <= row2; r++ {
+		for c := range cols {
+			var cell sheetCell
+			if r-row1 < len(rows) && col1+c <= len(rows[r-row1]) {
+				cell = rows[r-row1][col1+c-1]
+			}
+			raw, typ := cell.raw, cell.typ
+			if header && r == row1 {
+				if raw != "" {
+					cols[c].name = raw
+				}
+				continue
+			}
+			col := &cols[c]
+			col.valid, col.nums, col.strs = append(col.valid, raw != ""), append(col.nums, 0), append(col.strs, raw)
+			if raw == "" {
+				continue
+			}
+			if typ == excelize.CellTypeBool {
+				col.strs[len(col.strs)-1] = "FALSE"
+				if raw == "1" {
+					col.strs[len(col.strs)-1] = "TRUE"
+				}
+			}
+			if num, err := strconv.ParseFloat(raw, 64); err == nil && (typ == excelize.CellTypeUnset || typ == excelize.CellTypeNumber) {
+				col.nums[len(col.nums)-1] = num
+				continue
+			}
+			col.isText = true
+		}
+	}
+	colBufs := make([]*C.struct_ColumnBuffer, len(cols))
+	for _, buf := range unsafe.Slice(bufs, bufsLen) {
+		buf := buf
+		for c := range cols {
+			if cols[c].name != C.GoString(buf.Name) {
+				continue
+			}
+			if cols[c].isText {
+				return C.struct_GetColumnBuffersResult{Err: C.CString(errColumnBufferType.Error())}
+			}
+			if buf.Float64 == nil || int(buf.Length) < len(cols[c].valid) {
+				return C.struct_GetColumnBuffersResult{Err: C.CString(errColumnBufferSize.Error())}
+			}
+			colBufs[c] = &buf
+		}
+	}
+	result := C.struct_GetColumnBuffersResult{ColumnsLen: C.int(len(cols))}
+	if len(cols) > 0 {
+		result.Columns = (*C.struct_ColumnBuffer)(C.calloc(C.size_t(len(cols)), C.sizeof_struct_ColumnBuffer))
 	}
-	return C.struct_StringErrorResult{val: C.CString(val), err: C.CString(emptyString)}
+	columns := unsafe.Slice(result.Columns, len(cols))
+	for c := range cols {
+		columns[c] = cols[c].toC(colBufs[c])
+	}
+	return result
 }
 
 // GetColOutlineLevel provides a function to get outline level of a single
@@ -1130,15 +2511,16 @@ func GetCellValue(idx int, sheet, cell *C.char, opts *C.struct_Options) C.struct
 //
 //export GetColOutlineLevel
 func GetColOutlineLevel(idx int, sheet, col *C.char) C.struct_IntErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	val, err := f.(*excelize.File).GetColOutlineLevel(C.GoString(sheet), C.GoString(col))
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(int32(val)), err: C.CString(err.Error())}
 	}
-	return C.struct_IntErrorResult{val: C.int(int32(val)), err: C.CString(emptyString)}
+	return C.struct_IntErrorResult{val: C.int(int32(val))}
 }
 
 // GetColStyle provides a function to get column style ID by given worksheet
@@ -1146,15 +2528,16 @@ func GetColOutlineLevel(idx int, sheet, col *C.char) C.struct_IntErrorResult {
 //
 //export GetColStyle
 func GetColStyle(idx int, sheet, col *C.char) C.struct_IntErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	val, err := f.(*excelize.File).GetColStyle(C.GoString(sheet), C.GoString(col))
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(val), err: C.CString(err.Error())}
 	}
-	return C.struct_IntErrorResult{val: C.int(val), err: C.CString(emptyString)}
+	return C.struct_IntErrorResult{val: C.int(val)}
 }
 
 // GetColVisible provides a function to get visible of a single column by given
@@ -1162,15 +2545,16 @@ func GetColStyle(idx int, sheet, col *C.char) C.struct_IntErrorResult {
 //
 //export GetColVisible
 func GetColVisible(idx int, sheet, col *C.char) C.struct_BoolErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_BoolErrorResult{val: C._Bool(false), err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	val, err := f.(*excelize.File).GetColVisible(C.GoString(sheet), C.GoString(col))
 	if err != nil {
 		return C.struct_BoolErrorResult{val: C._Bool(val), err: C.CString(err.Error())}
 	}
-	return C.struct_BoolErrorResult{val: C._Bool(val), err: C.CString(emptyString)}
+	return C.struct_BoolErrorResult{val: C._Bool(val)}
 }
 
 // GetColWidth provides a function to get column width by given worksheet name
@@ -1178,15 +2562,45 @@ func GetColVisible(idx int, sheet, col *C.char) C.struct_BoolErrorResult {
 //
 //export GetColWidth
 func GetColWidth(idx int, sheet, col *C.char) C.struct_Float64ErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_Float64ErrorResult{val: C.double(0), err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	val, err := f.(*excelize.File).GetColWidth(C.GoString(sheet), C.GoString(col))
 	if err != nil {
 		return C.struct_Float64ErrorResult{val: C.double(val), err: C.CString(err.Error())}
 	}
-	return C.struct_Float64ErrorResult{val: C.double(val), err: C.CString(emptyString)}
+	return C.struct_Float64ErrorResult{val: C.double(val)}
+}
+
+// GetCols return all the columns in a sheet by given worksheet name, returned
+// as a two-dimensional array, where the value of the cell is converted to the
+// string type. If the cell format can be applied to the value of the cell,
+// the applied value will be used, otherwise the original value will be used.
+// The cell values of each column are returned in the Row field of the
+// GetRowsResult structure.
+//
+//export GetCols
+func GetCols(idx int, sheet *C.char, opts *C.struct_Options) C.struct_GetRowsResult {
+	var options excelize.Options
+	f, unlock, ok := files.rLock(idx)
+	if !ok {
+		return C.struct_GetRowsResult{err: C.CString(errFilePtr)}
+	}
+	defer unlock()
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_GetRowsResult{err: C.CString(err.Error())}
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+	}
+	cols, err := f.(*excelize.File).GetCols(C.GoString(sheet), options)
+	if err != nil {
+		return C.struct_GetRowsResult{err: C.CString(err.Error())}
+	}
+	return goRowsToC(cols)
 }
 
 // GetDefaultFont provides the default font name currently set in the
@@ -1194,15 +2608,79 @@ func GetColWidth(idx int, sheet, col *C.char) C.struct_Float64ErrorResult {
 //
 //export GetDefaultFont
 func GetDefaultFont(idx int) C.struct_StringErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
-		return C.struct_StringErrorResult{val: C.CString(emptyString), err: C.CString(errFilePtr)}
+		return C.struct_StringErrorResult{err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	val, err := f.(*excelize.File).GetDefaultFont()
 	if err != nil {
 		return C.struct_StringErrorResult{val: C.CString(val), err: C.CString(err.Error())}
 	}
-	return C.struct_StringErrorResult{val: C.CString(val), err: C.CString(emptyString)}
+	return C.struct_StringErrorResult{val: C.CString(val)}
+}
+
+// GetDictRows provides a function to get all the rows in a sheet by given
+// worksheet name in dictionary encoding. Each distinct cell value is returned
+// once in the dictionary, and the cells of all rows are returned in one array
+// of the indexes of their values in the dictionary, with the number of cells
+// in each row. The rows are read with the rows iterator and the values are
+// interned as they are read, so the rows of the worksheet are never held as
+// strings all at once. The blank rows in the tail of the worksheet are
+// skipped as the GetRows function does.
+//
+//export GetDictRows
+func GetDictRows(idx int, sheet *C.char, opts *C.struct_Options) C.struct_GetDictRowsResult {
+	var options excelize.Options
+	f, unlock, ok := files.rLock(idx)
+	if !ok {
+		return C.struct_GetDictRowsResult{Err: C.CString(errFilePtr)}
+	}
+	defer unlock()
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_GetDictRowsResult{Err: C.CString(err.Error())}
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+	}
+	rows, err := f.(*excelize.File).Rows(C.GoString(sheet))
+	if err != nil {
+		return C.struct_GetDictRowsResult{Err: C.CString(err.Error())}
+	}
+	defer rows.Close()
+	var (
+		rowLens, indices []C.int
+		rowsLen, cells   int
+		dict, index      = []string{}, make(map[string]int)
+	)
+	for rows.Next() {
+		row, err := rows.Columns(options)
+		if err != nil {
+			return C.struct_GetDictRowsResult{Err: C.CString(err.Error())}
+		}
+		for _, val := range row {
+			j, ok := index[val]
+			if !ok {
+				j, index[val] = len(dict), len(dict)
+				dict = append(dict, val)
+			}
+			indices = append(indices, C.int(j))
+		}
+		if rowLens = append(rowLens, C.int(len(row))); len(row) > 0 {
+			rowsLen, cells = len(rowLens), len(indices)
+		}
+	}
+	if err := rows.Error(); err != nil {
+		return C.struct_GetDictRowsResult{Err: C.CString(err.Error())}
+	}
+	result := C.struct_GetDictRowsResult{RowsLen: C.int(rowsLen), CellsLen: C.int(cells)}
+	result.RowLens = (*C.int)(C.calloc(C.size_t(rowsLen+1), C.sizeof_int))
+	result.Indices = (*C.int)(C.calloc(C.size_t(cells+1), C.sizeof_int))
+	copy(unsafe.Slice(result.RowLens, rowsLen), rowLens)
+	copy(unsafe.Slice(result.Indices, cells), indices)
+	result.Dict = stringMatrixToC([][]string{dict})
+	return result
 }
 
 // GetRowVisible provides a function to get visible of a single row by given
@@ -1210,15 +2688,16 @@ func GetDefaultFont(idx int) C.struct_StringErrorResult {
 //
 //export GetRowVisible
 func GetRowVisible(idx int, sheet *C.char, row int) C.struct_BoolErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_BoolErrorResult{val: C._Bool(false), err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	val, err := f.(*excelize.File).GetRowVisible(C.GoString(sheet), row)
 	if err != nil {
 		return C.struct_BoolErrorResult{val: C._Bool(val), err: C.CString(err.Error())}
 	}
-	return C.struct_BoolErrorResult{val: C._Bool(val), err: C.CString(emptyString)}
+	return C.struct_BoolErrorResult{val: C._Bool(val)}
 }
 
 // GetRows return all the rows in a sheet by given worksheet name, returned as
@@ -1231,20 +2710,12 @@ func GetRowVisible(idx int, sheet *C.char, row int) C.struct_BoolErrorResult {
 //
 //export GetRows
 func GetRows(idx int, sheet *C.char, opts *C.struct_Options) C.struct_GetRowsResult {
-	type Row struct {
-		Cell []string
-	}
-	type GetRowsResult struct {
-		Row []Row
-	}
-	var (
-		options excelize.Options
-		result  GetRowsResult
-	)
-	f, ok := files.Load(idx)
+	var options excelize.Options
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_GetRowsResult{err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	if opts != nil {
 		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
 		if err != nil {
@@ -1256,33 +2727,23 @@ func GetRows(idx int, sheet *C.char, opts *C.struct_Options) C.struct_GetRowsRes
 	if err != nil {
 		return C.struct_GetRowsResult{err: C.CString(err.Error())}
 	}
-	for _, row := range rows {
-		var r Row
-		r.Cell = append(r.Cell, row...)
-		result.Row = append(result.Row, r)
-	}
-	cVal, err := goValueToC(reflect.ValueOf(result), reflect.ValueOf(&C.struct_GetRowsResult{}))
-	if err != nil {
-		return C.struct_GetRowsResult{err: C.CString(err.Error())}
-	}
-	ret := cVal.Elem().Interface().(C.struct_GetRowsResult)
-	ret.err = C.CString(emptyString)
-	return ret
+	return goRowsToC(rows)
 }
 
 // GetSheetDimension provides the method to get the used range of the worksheet.
 //
 //export GetSheetDimension
 func GetSheetDimension(idx int, sheet *C.char) C.struct_StringErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
-		return C.struct_StringErrorResult{val: C.CString(emptyString), err: C.CString(errFilePtr)}
+		return C.struct_StringErrorResult{err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	dimension, err := f.(*excelize.File).GetSheetDimension(C.GoString(sheet))
 	if err != nil {
 		return C.struct_StringErrorResult{val: C.CString(dimension), err: C.CString(err.Error())}
 	}
-	return C.struct_StringErrorResult{val: C.CString(dimension), err: C.CString(emptyString)}
+	return C.struct_StringErrorResult{val: C.CString(dimension)}
 }
 
 // GetSheetIndex provides a function to get a sheet index of the workbook by
@@ -1291,15 +2752,16 @@ func GetSheetDimension(idx int, sheet *C.char) C.struct_StringErrorResult {
 //
 //export GetSheetIndex
 func GetSheetIndex(idx int, sheet *C.char) C.struct_IntErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	idx, err := f.(*excelize.File).GetSheetIndex(C.GoString(sheet))
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(idx), err: C.CString(err.Error())}
 	}
-	return C.struct_IntErrorResult{val: C.int(idx), err: C.CString(emptyString)}
+	return C.struct_IntErrorResult{val: C.int(idx)}
 }
 
 // GetSheetName provides a function to get the sheet name by the given worksheet index.
@@ -1307,21 +2769,23 @@ func GetSheetIndex(idx int, sheet *C.char) C.struct_IntErrorResult {
 //
 //export GetSheetName
 func GetSheetName(idx int, sheetIndex int) C.struct_StringErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
-		return C.struct_StringErrorResult{val: C.CString(emptyString), err: C.CString(errFilePtr)}
+		return C.struct_StringErrorResult{err: C.CString(errFilePtr)}
 	}
-	return C.struct_StringErrorResult{val: C.CString(f.(*excelize.File).GetSheetName(sheetIndex)), err: C.CString(emptyString)}
+	defer unlock()
+	return C.struct_StringErrorResult{val: C.CString(f.(*excelize.File).GetSheetName(sheetIndex))}
 }
 
 // GetStyle provides a function to get style definition by given style index.
 //
 //export GetStyle
 func GetStyle(idx, styleID int) C.struct_GetStyleResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_GetStyleResult{err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	style, err := f.(*excelize.File).GetStyle(styleID)
 	if err != nil {
 		return C.struct_GetStyleResult{err: C.CString(err.Error())}
@@ -1330,7 +2794,7 @@ func GetStyle(idx, styleID int) C.struct_GetStyleResult {
 	if err != nil {
 		return C.struct_GetStyleResult{err: C.CString(err.Error())}
 	}
-	return C.struct_GetStyleResult{style: cVal.Elem().Interface().(C.struct_Style), err: C.CString(emptyString)}
+	return C.struct_GetStyleResult{style: cVal.Elem().Interface().(C.struct_Style)}
 }
 
 // GetTables provides the method to get all tables in a worksheet by given
@@ -1338,10 +2802,11 @@ func GetStyle(idx, styleID int) C.struct_GetStyleResult {
 //
 //export GetTables
 func GetTables(idx int, sheet *C.char) C.struct_GetTablesResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_GetTablesResult{Err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	tables, err := f.(*excelize.File).GetTables(C.GoString(sheet))
 	if err != nil {
 		return C.struct_GetTablesResult{Err: C.CString(err.Error())}
@@ -1354,17 +2819,73 @@ func GetTables(idx int, sheet *C.char) C.struct_GetTablesResult {
 		}
 		*(*C.struct_Table)(unsafe.Pointer(uintptr(unsafe.Pointer(cArray)) + uintptr(i)*unsafe.Sizeof(C.struct_Table{}))) = cVal.Elem().Interface().(C.struct_Table)
 	}
-	return C.struct_GetTablesResult{TablesLen: C.int(len(tables)), Tables: (*C.struct_Table)(cArray), Err: C.CString(emptyString)}
+	return C.struct_GetTablesResult{TablesLen: C.int(len(tables)), Tables: (*C.struct_Table)(cArray)}
+}
+
+// GetTypedRows provides a function to get all the rows in a sheet by given
+// worksheet name, where the raw values of the cells are converted to the
+// native data types by the cell types, or the cell types are returned as
+// integers if typesOnly is true. The numbers with a date or time number format
+// are converted to the Time type. The rows are read in a single pass, and the
+// cells of all rows are returned in one array, with the number of cells in
+// each row.
+//
+//export GetTypedRows
+func GetTypedRows(idx int, sheet *C.char, opts *C.struct_Options, typesOnly bool) C.struct_GetTypedRowsResult {
+	var options excelize.Options
+	f, unlock, ok := files.rLock(idx)
+	if !ok {
+		return C.struct_GetTypedRowsResult{Err: C.CString(errFilePtr)}
+	}
+	defer unlock()
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_GetTypedRowsResult{Err: C.CString(err.Error())}
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+	}
+	options.RawCellValue = true
+	reader, err := newRowReader(f.(*excelize.File), C.GoString(sheet), options)
+	if err != nil {
+		return C.struct_GetTypedRowsResult{Err: C.CString(err.Error())}
+	}
+	defer reader.close()
+	rows, err := reader.readRows(1, 0)
+	if err != nil {
+		return C.struct_GetTypedRowsResult{Err: C.CString(err.Error())}
+	}
+	var cells, i int
+	for _, row := range rows {
+		cells += len(row)
+	}
+	result := C.struct_GetTypedRowsResult{RowsLen: C.int(len(rows)), ValuesLen: C.int(cells)}
+	if len(rows) > 0 {
+		result.RowLens = (*C.int)(C.calloc(C.size_t(len(rows)), C.sizeof_int))
+	}
+	if cells > 0 {
+		result.Values = (*C.struct_Interface)(C.calloc(C.size_t(cells), C.sizeof_struct_Interface))
+	}
+	rowLens, values := unsafe.Slice(result.RowLens, len(rows)), unsafe.Slice(result.Values, cells)
+	for r, row := range rows {
+		rowLens[r] = C.int(len(row))
+		for _, cell := range row {
+			values[i] = reader.cellToC(cell, typesOnly)
+			i++
+		}
+	}
+	return result
 }
 
 // GetWorkbookProps provides a function to gets workbook properties.
 //
 //export GetWorkbookProps
 func GetWorkbookProps(idx int) C.struct_GetWorkbookPropsResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
 		return C.struct_GetWorkbookPropsResult{err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	opts, err := f.(*excelize.File).GetWorkbookProps()
 	if err != nil {
 		return C.struct_GetWorkbookPropsResult{err: C.CString(err.Error())}
@@ -1373,7 +2894,7 @@ func GetWorkbookProps(idx int) C.struct_GetWorkbookPropsResult {
 	if err != nil {
 		return C.struct_GetWorkbookPropsResult{err: C.CString(err.Error())}
 	}
-	return C.struct_GetWorkbookPropsResult{opts: cVal.Elem().Interface().(C.struct_WorkbookPropsOptions), err: C.CString(emptyString)}
+	return C.struct_GetWorkbookPropsResult{opts: cVal.Elem().Interface().(C.struct_WorkbookPropsOptions)}
 }
 
 // GroupSheets provides a function to group worksheets by given worksheets
@@ -1381,10 +2902,11 @@ func GetWorkbookProps(idx int) C.struct_GetWorkbookPropsResult {
 //
 //export GroupSheets
 func GroupSheets(idx int, sheets **C.char, length int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	array := make([]string, length)
 	for i, val := range unsafe.Slice(sheets, length) {
 		array[i] = C.GoString(val)
@@ -1392,7 +2914,7 @@ func GroupSheets(idx int, sheets **C.char, length int) *C.char {
 	if err := f.(*excelize.File).GroupSheets(array); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // InsertCols provides a function to insert new columns before the given column
@@ -1400,14 +2922,15 @@ func GroupSheets(idx int, sheets **C.char, length int) *C.char {
 //
 //export InsertCols
 func InsertCols(idx int, sheet, col *C.char, n int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).InsertCols(C.GoString(sheet), C.GoString(col), n); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // InsertPageBreak create a page break to determine where the printed page
@@ -1417,14 +2940,15 @@ func InsertCols(idx int, sheet, col *C.char, n int) *C.char {
 //
 //export InsertPageBreak
 func InsertPageBreak(idx int, sheet, cell *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).InsertPageBreak(C.GoString(sheet), C.GoString(cell)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // InsertRows provides a function to insert new rows after the given Excel row
@@ -1432,14 +2956,15 @@ func InsertPageBreak(idx int, sheet, cell *C.char) *C.char {
 //
 //export InsertRows
 func InsertRows(idx int, sheet *C.char, row, n int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).InsertRows(C.GoString(sheet), row, n); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // MergeCell provides a function to merge cells by given range reference and
@@ -1448,14 +2973,15 @@ func InsertRows(idx int, sheet *C.char, row, n int) *C.char {
 //
 //export MergeCell
 func MergeCell(idx int, sheet, topLeftCell, bottomRightCell *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).MergeCell(C.GoString(sheet), C.GoString(topLeftCell), C.GoString(bottomRightCell)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // MoveSheet moves a sheet to a specified position in the workbook. The function
@@ -1466,14 +2992,15 @@ func MergeCell(idx int, sheet, topLeftCell, bottomRightCell *C.char) *C.char {
 //
 //export MoveSheet
 func MoveSheet(idx int, source, target *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).MoveSheet(C.GoString(source), C.GoString(target)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // NewConditionalStyle provides a function to create style for conditional
@@ -1488,29 +3015,23 @@ func NewConditionalStyle(idx int, style *C.struct_Style) C.struct_IntErrorResult
 		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(err.Error())}
 	}
 	s = goVal.Elem().Interface().(excelize.Style)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	styleID, err := f.(*excelize.File).NewConditionalStyle(&s)
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(styleID), err: C.CString(err.Error())}
 	}
-	return C.struct_IntErrorResult{val: C.int(styleID), err: C.CString(emptyString)}
+	return C.struct_IntErrorResult{val: C.int(styleID)}
 }
 
 // NewFile provides a function to create new file by default template.
 //
 //export NewFile
 func NewFile() int {
-	f, idx := excelize.NewFile(), 0
-	files.Range(func(_, _ interface{}) bool {
-		idx++
-		return true
-	})
-	idx++
-	files.Store(idx, f)
-	return idx
+	return files.add(excelize.NewFile())
 }
 
 // NewSheet provides the function to create a new sheet by given a worksheet
@@ -1520,15 +3041,16 @@ func NewFile() int {
 //
 //export NewSheet
 func NewSheet(idx int, sheet *C.char) C.struct_IntErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	idx, err := f.(*excelize.File).NewSheet(C.GoString(sheet))
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(idx), err: C.CString(err.Error())}
 	}
-	return C.struct_IntErrorResult{val: C.int(idx), err: C.CString(emptyString)}
+	return C.struct_IntErrorResult{val: C.int(idx)}
 }
 
 // NewStreamWriter returns stream writer struct by given worksheet name used for
@@ -1543,22 +3065,16 @@ func NewSheet(idx int, sheet *C.char) C.struct_IntErrorResult {
 //
 //export NewStreamWriter
 func NewStreamWriter(idx int, sheet *C.char) C.struct_IntErrorResult {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	streamWriter, err := f.(*excelize.File).NewStreamWriter(C.GoString(sheet))
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(err.Error())}
 	}
-	var swIdx int
-	sw.Range(func(_, _ interface{}) bool {
-		swIdx++
-		return true
-	})
-	swIdx++
-	sw.Store(swIdx, streamWriter)
-	return C.struct_IntErrorResult{val: C.int(swIdx), err: C.CString(emptyString)}
+	return C.struct_IntErrorResult{val: C.int(sw.addChild(idx, &stream{StreamWriter: streamWriter}))}
 }
 
 // StreamAddTable creates an Excel table for the StreamWriter using the given
@@ -1567,19 +3083,20 @@ func NewStreamWriter(idx int, sheet *C.char) C.struct_IntErrorResult {
 //export StreamAddTable
 func StreamAddTable(swIdx int, table *C.struct_Table) *C.char {
 	var tbl excelize.Table
-	streamWriter, ok := sw.Load(swIdx)
-	if !ok {
-		return C.CString(errStreamWriterPtr)
+	streamWriter, _, unlock, errPtr := sw.lockChild(swIdx, false, errStreamWriterPtr)
+	if errPtr != "" {
+		return C.CString(errPtr)
 	}
+	defer unlock()
 	goVal, err := cValueToGo(reflect.ValueOf(*table), reflect.TypeOf(excelize.Table{}))
 	if err != nil {
 		return C.CString(err.Error())
 	}
 	tbl = goVal.Elem().Interface().(excelize.Table)
-	if err := streamWriter.(*excelize.StreamWriter).AddTable(&tbl); err != nil {
+	if err := streamWriter.(*stream).AddTable(&tbl); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // StreamInsertPageBreak creates a page break to determine where the printed
@@ -1589,14 +3106,15 @@ func StreamAddTable(swIdx int, table *C.struct_Table) *C.char {
 //
 //export StreamInsertPageBreak
 func StreamInsertPageBreak(swIDx int, cell *C.char) *C.char {
-	streamWriter, ok := sw.Load(swIDx)
-	if !ok {
-		return C.CString(errStreamWriterPtr)
+	streamWriter, _, unlock, errPtr := sw.lockChild(swIDx, false, errStreamWriterPtr)
+	if errPtr != "" {
+		return C.CString(errPtr)
 	}
-	if err := streamWriter.(*excelize.StreamWriter).InsertPageBreak(C.GoString(cell)); err != nil {
+	defer unlock()
+	if err := streamWriter.(*stream).InsertPageBreak(C.GoString(cell)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // StreamMergeCell provides a function to merge cells by a given range reference
@@ -1605,14 +3123,15 @@ func StreamInsertPageBreak(swIDx int, cell *C.char) *C.char {
 //
 //export StreamMergeCell
 func StreamMergeCell(swIDx int, topLeftCell, bottomRightCell *C.char) *C.char {
-	streamWriter, ok := sw.Load(swIDx)
-	if !ok {
-		return C.CString(errStreamWriterPtr)
+	streamWriter, _, unlock, errPtr := sw.lockChild(swIDx, false, errStreamWriterPtr)
+	if errPtr != "" {
+		return C.CString(errPtr)
 	}
-	if err := streamWriter.(*excelize.StreamWriter).MergeCell(C.GoString(topLeftCell), C.GoString(bottomRightCell)); err != nil {
+	defer unlock()
+	if err := streamWriter.(*stream).MergeCell(C.GoString(topLeftCell), C.GoString(bottomRightCell)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // StreamSetColWidth provides a function to set the width of a single column or
@@ -1621,14 +3140,15 @@ func StreamMergeCell(swIDx int, topLeftCell, bottomRightCell *C.char) *C.char {
 //
 //export StreamSetColWidth
 func StreamSetColWidth(swIDx int, minVal, maxVal int, width float64) *C.char {
-	streamWriter, ok := sw.Load(swIDx)
-	if !ok {
-		return C.CString(errStreamWriterPtr)
+	streamWriter, _, unlock, errPtr := sw.lockChild(swIDx, false, errStreamWriterPtr)
+	if errPtr != "" {
+		return C.CString(errPtr)
 	}
-	if err := streamWriter.(*excelize.StreamWriter).SetColWidth(minVal, maxVal, width); err != nil {
+	defer unlock()
+	if err := streamWriter.(*stream).SetColWidth(minVal, maxVal, width); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // StreamSetPanes provides a function to create and remove freeze panes and
@@ -1642,15 +3162,16 @@ func StreamSetPanes(swIDx int, opts *C.struct_Panes) *C.char {
 	if err != nil {
 		return C.CString(err.Error())
 	}
-	streamWriter, ok := sw.Load(swIDx)
-	if !ok {
-		return C.CString(errStreamWriterPtr)
+	streamWriter, _, unlock, errPtr := sw.lockChild(swIDx, false, errStreamWriterPtr)
+	if errPtr != "" {
+		return C.CString(errPtr)
 	}
+	defer unlock()
 	options = goVal.Elem().Interface().(excelize.Panes)
-	if err := streamWriter.(*excelize.StreamWriter).SetPanes(&options); err != nil {
+	if err := streamWriter.(*stream).SetPanes(&options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // StreamSetRow writes an array to stream rows by giving starting cell reference
@@ -1659,32 +3180,127 @@ func StreamSetPanes(swIDx int, opts *C.struct_Panes) *C.char {
 //
 //export StreamSetRow
 func StreamSetRow(swIDx int, cell *C.char, row *C.struct_Interface, length int) *C.char {
-	streamWriter, ok := sw.Load(swIDx)
-	if !ok {
-		return C.CString(errStreamWriterPtr)
+	streamWriter, _, unlock, errPtr := sw.lockChild(swIDx, false, errStreamWriterPtr)
+	if errPtr != "" {
+		return C.CString(errPtr)
 	}
+	defer unlock()
 	cells := make([]interface{}, length)
 	for i, val := range unsafe.Slice(row, length) {
 		cells[i] = cInterfaceToGo(val)
 	}
-	if err := streamWriter.(*excelize.StreamWriter).SetRow(C.GoString(cell), cells); err != nil {
+	if err := streamWriter.(*stream).SetRow(C.GoString(cell), cells); err != nil {
+		return C.CString(err.Error())
+	}
+	return nil
+}
+
+// StreamSetRows writes multiple rows to stream rows by giving starting cell
+// reference, a pointer to an array of values of all rows, a pointer to an
+// array of the number of values in each row and the number of rows. Note that
+// you must call the 'StreamFlush' function to end the streaming writing
+// process.
+//
+//export StreamSetRows
+func StreamSetRows(swIDx int, cell *C.char, values *C.struct_Interface, rowLens *C.int, rowsLen int) *C.char {
+	streamWriter, _, unlock, errPtr := sw.lockChild(swIDx, false, errStreamWriterPtr)
+	if errPtr != "" {
+		return C.CString(errPtr)
+	}
+	defer unlock()
+	col, row, err := excelize.CellNameToCoordinates(C.GoString(cell))
+	if err != nil {
+		return C.CString(err.Error())
+	}
+	var (
+		offset int
+		cells  []interface{}
+	)
+	for r, rowLen := range unsafe.Slice(rowLens, rowsLen) {
+		cells = cells[:0]
+		ptr := (*C.struct_Interface)(unsafe.Add(unsafe.Pointer(values), offset*C.sizeof_struct_Interface))
+		for _, val := range unsafe.Slice(ptr, int(rowLen)) {
+			cells = append(cells, cInterfaceToGo(val))
+		}
+		offset += int(rowLen)
+		ref, err := excelize.CoordinatesToCellName(col, row+r)
+		if err != nil {
+			return C.CString(err.Error())
+		}
+		if err := streamWriter.(*stream).SetRow(ref, cells); err != nil {
+			return C.CString(err.Error())
+		}
+	}
+	return nil
+}
+
+// StreamSetColumns writes the values of columns to stream rows by giving
+// starting cell reference, a pointer to an array of columns and the number of
+// rows. Note that you must call the 'StreamFlush' function to end the streaming
+// writing process.
+//
+//export StreamSetColumns
+func StreamSetColumns(swIDx int, cell *C.char, cols *C.struct_Column, colsLen, rowsLen int) *C.char {
+	streamWriter, f, unlock, errPtr := sw.lockChild(swIDx, false, errStreamWriterPtr)
+	if errPtr != "" {
+		return C.CString(errPtr)
+	}
+	defer unlock()
+	col, row, err := excelize.CellNameToCoordinates(C.GoString(cell))
+	if err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	var (
+		dateStyle  int
+		dateOffset float64
+	)
+	columns := unsafe.Slice(cols, colsLen)
+	cells, styles := make([]interface{}, colsLen), make([]int, colsLen)
+	for c, column := range columns {
+		if styles[c] = int(column.StyleID); column.Type == Time && dateStyle == 0 {
+			if dateStyle, dateOffset, err = streamWriter.(*stream).dates(f); err != nil {
+				return C.CString(err.Error())
+			}
+		}
+		if column.Type == Time && styles[c] == 0 {
+			styles[c] = dateStyle
+		}
+	}
+	for r := 0; r < rowsLen; r++ {
+		for c, column := range columns {
+			cells[c] = cColumnValueToGo(column, r)
+			if serial, ok := cells[c].(float64); ok && column.Type == Time {
+				cells[c] = serial - dateOffset
+			}
+			if styles[c] != 0 {
+				cells[c] = excelize.Cell{StyleID: styles[c], Value: cells[c]}
+			}
+		}
+		ref, err := excelize.CoordinatesToCellName(col, row+r)
+		if err != nil {
+			return C.CString(err.Error())
+		}
+		if err := streamWriter.(*stream).SetRow(ref, cells); err != nil {
+			return C.CString(err.Error())
+		}
+	}
+	return nil
 }
 
 // StreamFlush ending the streaming writing process.
 //
 //export StreamFlush
-func StreamFlush(swIDx int, sheet *C.char) *C.char {
-	streamWriter, ok := sw.Load(swIDx)
-	if !ok {
-		return C.CString(errStreamWriterPtr)
+func StreamFlush(swIDx int) *C.char {
+	streamWriter, _, unlock, errPtr := sw.lockChild(swIDx, false, errStreamWriterPtr)
+	if errPtr != "" {
+		return C.CString(errPtr)
 	}
-	if err := streamWriter.(*excelize.StreamWriter).Flush(); err != nil {
+	defer unlock()
+	if err := streamWriter.(*stream).Flush(); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	sw.Delete(swIDx)
+	return nil
 }
 
 // NewStyle provides a function to create the style for cells by given options.
@@ -1698,15 +3314,16 @@ func NewStyle(idx int, style *C.struct_Style) C.struct_IntErrorResult {
 		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(err.Error())}
 	}
 	s = goVal.Elem().Interface().(excelize.Style)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.struct_IntErrorResult{val: C.int(0), err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	styleID, err := f.(*excelize.File).NewStyle(&s)
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(styleID), err: C.CString(err.Error())}
 	}
-	return C.struct_IntErrorResult{val: C.int(styleID), err: C.CString(emptyString)}
+	return C.struct_IntErrorResult{val: C.int(styleID)}
 }
 
 // OpenFile take the name of a spreadsheet file and returns a populated
@@ -1726,21 +3343,14 @@ func OpenFile(filename *C.char, opts *C.struct_Options) C.struct_IntErrorResult
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
 	}
-	var idx int
-	files.Range(func(_, _ interface{}) bool {
-		idx++
-		return true
-	})
-	idx++
-	files.Store(idx, f)
-	return C.struct_IntErrorResult{val: C.int(idx), err: C.CString(emptyString)}
+	return C.struct_IntErrorResult{val: C.int(files.add(f))}
 }
 
 // OpenReader read data stream from io.Reader and return a populated spreadsheet
 // file.
 //
 //export OpenReader
-func OpenReader(b *C.uchar, bLen C.int, opts *C.struct_Options) C.struct_IntErrorResult {
+func OpenReader(b *C.uchar, bLen C.longlong, opts *C.struct_Options) C.struct_IntErrorResult {
 	var options excelize.Options
 	if opts != nil {
 		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
@@ -1749,19 +3359,35 @@ func OpenReader(b *C.uchar, bLen C.int, opts *C.struct_Options) C.struct_IntErro
 		}
 		options = goVal.Elem().Interface().(excelize.Options)
 	}
-	buf := C.GoBytes(unsafe.Pointer(b), bLen)
+	// The buffer is passed to the library without copying it into the Go
+	// memory first, this is safe because the library reads it entirely into a
+	// copy of its own before OpenReader returns.
+	buf := unsafe.Slice((*byte)(unsafe.Pointer(b)), int64(bLen))
 	f, err := excelize.OpenReader(bytes.NewReader(buf), options)
 	if err != nil {
 		return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
 	}
-	var idx int
-	files.Range(func(_, _ interface{}) bool {
-		idx++
-		return true
-	})
-	idx++
-	files.Store(idx, f)
-	return C.struct_IntErrorResult{val: C.int(idx), err: C.CString(emptyString)}
+	return C.struct_IntErrorResult{val: C.int(files.add(f))}
+}
+
+// OpenStream read data stream from the reader callback function and return a
+// populated spreadsheet file.
+//
+//export OpenStream
+func OpenStream(reader C.Reader, opts *C.struct_Options) C.struct_IntErrorResult {
+	var options excelize.Options
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+	}
+	f, err := excelize.OpenReader(cReader{fn: reader}, options)
+	if err != nil {
+		return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
+	}
+	return C.struct_IntErrorResult{val: C.int(files.add(f))}
 }
 
 // ProtectSheet provides a function to prevent other users from accidentally or
@@ -1778,14 +3404,15 @@ func ProtectSheet(idx int, sheet *C.char, opts *C.struct_SheetProtectionOptions)
 		return C.CString(err.Error())
 	}
 	options = goVal.Elem().Interface().(excelize.SheetProtectionOptions)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).ProtectSheet(C.GoString(sheet), &options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // ProtectWorkbook provides a function to prevent other users from viewing
@@ -1804,14 +3431,15 @@ func ProtectWorkbook(idx int, opts *C.struct_WorkbookProtectionOptions) *C.char
 		return C.CString(err.Error())
 	}
 	options = goVal.Elem().Interface().(excelize.WorkbookProtectionOptions)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).ProtectWorkbook(&options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // RemoveCol provides a function to remove single column by given worksheet
@@ -1819,14 +3447,15 @@ func ProtectWorkbook(idx int, opts *C.struct_WorkbookProtectionOptions) *C.char
 //
 //export RemoveCol
 func RemoveCol(idx int, sheet, col *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).RemoveCol(C.GoString(sheet), C.GoString(col)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // RemovePageBreak remove a page break by given worksheet name and cell
@@ -1834,14 +3463,15 @@ func RemoveCol(idx int, sheet, col *C.char) *C.char {
 //
 //export RemovePageBreak
 func RemovePageBreak(idx int, sheet, cell *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).RemovePageBreak(C.GoString(sheet), C.GoString(cell)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // RemoveRow provides a function to remove single row by given worksheet name
@@ -1849,24 +3479,98 @@ func RemovePageBreak(idx int, sheet, cell *C.char) *C.char {
 //
 //export RemoveRow
 func RemoveRow(idx int, sheet *C.char, row int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).RemoveRow(C.GoString(sheet), row); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
+}
+
+// Rows returns a rows iterator, used for streaming reading data for a
+// worksheet with a large data. The options will be applied on reading the
+// cell values of each row.
+//
+//export Rows
+func Rows(idx int, sheet *C.char, opts *C.struct_Options) C.struct_IntErrorResult {
+	var options excelize.Options
+	f, unlock, ok := files.rLock(idx)
+	if !ok {
+		return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(errFilePtr)}
+	}
+	defer unlock()
+	if opts != nil {
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+	}
+	rows, err := f.(*excelize.File).Rows(C.GoString(sheet))
+	if err != nil {
+		return C.struct_IntErrorResult{val: C.int(-1), err: C.CString(err.Error())}
+	}
+	rowsIdx := rowsIter.addChild(idx, &rowsIterator{rows: rows, opts: options})
+	return C.struct_IntErrorResult{val: C.int(rowsIdx)}
+}
+
+// RowsNext reads up to the given number of rows from the rows iterator. An
+// empty result indicates that all rows of the worksheet have been read.
+//
+//export RowsNext
+func RowsNext(rowsIdx, batchSize int) C.struct_GetRowsResult {
+	it, _, unlock, errPtr := rowsIter.lockChild(rowsIdx, true, errRowsIterPtr)
+	if errPtr != "" {
+		return C.struct_GetRowsResult{err: C.CString(errPtr)}
+	}
+	defer unlock()
+	iter := it.(*rowsIterator)
+	if batchSize < 1 {
+		batchSize = 1
+	}
+	rows := make([][]string, 0, batchSize)
+	for len(rows) < batchSize && iter.rows.Next() {
+		row, err := iter.rows.Columns(iter.opts)
+		if err != nil {
+			return C.struct_GetRowsResult{err: C.CString(err.Error())}
+		}
+		rows = append(rows, row)
+	}
+	if err := iter.rows.Error(); err != nil {
+		return C.struct_GetRowsResult{err: C.CString(err.Error())}
+	}
+	return goRowsToC(rows)
+}
+
+// RowsClose closes the open worksheet XML file in the system temporary
+// directory and releases the rows iterator.
+//
+//export RowsClose
+func RowsClose(rowsIdx int) *C.char {
+	it, _, unlock, errPtr := rowsIter.lockChild(rowsIdx, true, errRowsIterPtr)
+	if errPtr != "" {
+		return C.CString(errPtr)
+	}
+	defer unlock()
+	rowsIter.Delete(rowsIdx)
+	if err := it.(*rowsIterator).rows.Close(); err != nil {
+		return C.CString(err.Error())
+	}
+	return nil
 }
 
 // Save provides a function to override the spreadsheet with origin path.
 //
 //export Save
 func Save(idx int, opts *C.struct_Options) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if opts != nil {
 		var options excelize.Options
 		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
@@ -1877,12 +3581,12 @@ func Save(idx int, opts *C.struct_Options) *C.char {
 		if err := f.(*excelize.File).Save(options); err != nil {
 			return C.CString(err.Error())
 		}
-		return C.CString(emptyString)
+		return nil
 	}
 	if err := f.(*excelize.File).Save(); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SaveAs provides a function to create or update to a spreadsheet at the
@@ -1890,10 +3594,11 @@ func Save(idx int, opts *C.struct_Options) *C.char {
 //
 //export SaveAs
 func SaveAs(idx int, name *C.char, opts *C.struct_Options) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if opts != nil {
 		var options excelize.Options
 		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
@@ -1904,35 +3609,33 @@ func SaveAs(idx int, name *C.char, opts *C.struct_Options) *C.char {
 		if err := f.(*excelize.File).SaveAs(C.GoString(name), options); err != nil {
 			return C.CString(err.Error())
 		}
-		return C.CString(emptyString)
+		return nil
 	}
 	if err := f.(*excelize.File).SaveAs(C.GoString(name)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SearchSheet provides a function to get cell reference by given worksheet name,
 // cell value, and regular expression. The function doesn't support searching
 // on the calculated result, formatted numbers and conditional lookup
 // currently. If it is a merged cell, it will return the cell reference of the
-// upper left cell of the merged range reference.
+// upper left cell of the merged range reference. The cell references are
+// returned in the single row of the result.
 //
 //export SearchSheet
-func SearchSheet(idx int, sheet, value *C.char, reg bool) C.struct_StringArrayErrorResult {
-	f, ok := files.Load(idx)
+func SearchSheet(idx int, sheet, value *C.char, reg bool) C.struct_GetRowsResult {
+	f, unlock, ok := files.rLock(idx)
 	if !ok {
-		return C.struct_StringArrayErrorResult{Err: C.CString(errFilePtr)}
+		return C.struct_GetRowsResult{err: C.CString(errFilePtr)}
 	}
+	defer unlock()
 	result, err := f.(*excelize.File).SearchSheet(C.GoString(sheet), C.GoString(value), reg)
 	if err != nil {
-		return C.struct_StringArrayErrorResult{Err: C.CString(err.Error())}
-	}
-	cArray := C.malloc(C.size_t(len(result)) * C.size_t(unsafe.Sizeof(uintptr(0))))
-	for i, v := range result {
-		*(*unsafe.Pointer)(unsafe.Pointer(uintptr(unsafe.Pointer(cArray)) + uintptr(i)*unsafe.Sizeof(uintptr(0)))) = unsafe.Pointer(C.CString(v))
+		return C.struct_GetRowsResult{err: C.CString(err.Error())}
 	}
-	return C.struct_StringArrayErrorResult{ArrLen: C.int(len(result)), Arr: (**C.char)(cArray), Err: C.CString(emptyString)}
+	return goRowsToC([][]string{result})
 }
 
 // SetActiveSheet provides a function to set the default active sheet of the
@@ -1942,12 +3645,13 @@ func SearchSheet(idx int, sheet, value *C.char, reg bool) C.struct_StringArrayEr
 //
 //export SetActiveSheet
 func SetActiveSheet(idx, index int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	f.(*excelize.File).SetActiveSheet(index)
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetCellBool provides a function to set bool type value of a cell by given
@@ -1955,14 +3659,15 @@ func SetActiveSheet(idx, index int) *C.char {
 //
 //export SetCellBool
 func SetCellBool(idx int, sheet, cell *C.char, value bool) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetCellBool(C.GoString(sheet), C.GoString(cell), value); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetCellFormula provides a function to set formula on the cell is taken
@@ -1975,10 +3680,11 @@ func SetCellBool(idx int, sheet, cell *C.char, value bool) *C.char {
 //
 //export SetCellFormula
 func SetCellFormula(idx int, sheet, cell, formula *C.char, opts *C.struct_FormulaOpts) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if opts != nil {
 		var options excelize.FormulaOpts
 		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.FormulaOpts{}))
@@ -1989,12 +3695,12 @@ func SetCellFormula(idx int, sheet, cell, formula *C.char, opts *C.struct_Formul
 		if err := f.(*excelize.File).SetCellFormula(C.GoString(sheet), C.GoString(cell), C.GoString(formula), options); err != nil {
 			return C.CString(err.Error())
 		}
-		return C.CString(emptyString)
+		return nil
 	}
 	if err := f.(*excelize.File).SetCellFormula(C.GoString(sheet), C.GoString(cell), C.GoString(formula)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetCellHyperLink provides a function to set cell hyperlink by given
@@ -2008,10 +3714,11 @@ func SetCellFormula(idx int, sheet, cell, formula *C.char, opts *C.struct_Formul
 //
 //export SetCellHyperLink
 func SetCellHyperLink(idx int, sheet, cell, link, linkType *C.char, opts *C.struct_HyperlinkOpts) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if opts != nil {
 		var options excelize.HyperlinkOpts
 		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.HyperlinkOpts{}))
@@ -2022,12 +3729,12 @@ func SetCellHyperLink(idx int, sheet, cell, link, linkType *C.char, opts *C.stru
 		if err := f.(*excelize.File).SetCellHyperLink(C.GoString(sheet), C.GoString(cell), C.GoString(link), C.GoString(linkType), options); err != nil {
 			return C.CString(err.Error())
 		}
-		return C.CString(emptyString)
+		return nil
 	}
 	if err := f.(*excelize.File).SetCellHyperLink(C.GoString(sheet), C.GoString(cell), C.GoString(link), C.GoString(linkType)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetCellInt provides a function to set int type value of a cell by given
@@ -2035,14 +3742,15 @@ func SetCellHyperLink(idx int, sheet, cell, link, linkType *C.char, opts *C.stru
 //
 //export SetCellInt
 func SetCellInt(idx int, sheet, cell *C.char, value int64) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetCellInt(C.GoString(sheet), C.GoString(cell), value); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetCellRichText provides a function to set cell with rich text by given
@@ -2050,10 +3758,11 @@ func SetCellInt(idx int, sheet, cell *C.char, value int64) *C.char {
 //
 //export SetCellRichText
 func SetCellRichText(idx int, sheet, cell *C.char, runs *C.struct_RichTextRun, length int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	textRuns := make([]excelize.RichTextRun, length)
 	for i, val := range unsafe.Slice(runs, length) {
 		goVal, err := cValueToGo(reflect.ValueOf(val), reflect.TypeOf(excelize.RichTextRun{}))
@@ -2065,7 +3774,7 @@ func SetCellRichText(idx int, sheet, cell *C.char, runs *C.struct_RichTextRun, l
 	if err := f.(*excelize.File).SetCellRichText(C.GoString(sheet), C.GoString(cell), textRuns); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetCellStr provides a function to set string type value of a cell. Total
@@ -2073,14 +3782,15 @@ func SetCellRichText(idx int, sheet, cell *C.char, runs *C.struct_RichTextRun, l
 //
 //export SetCellStr
 func SetCellStr(idx int, sheet, cell, value *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetCellStr(C.GoString(sheet), C.GoString(cell), C.GoString(value)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetCellStyle provides a function to add style attribute for cells by given
@@ -2091,14 +3801,15 @@ func SetCellStr(idx int, sheet, cell, value *C.char) *C.char {
 //
 //export SetCellStyle
 func SetCellStyle(idx int, sheet, topLeftCell, bottomRightCell *C.char, styleID int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetCellStyle(C.GoString(sheet), C.GoString(topLeftCell), C.GoString(bottomRightCell), styleID); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetCellValue provides a function to set the value of a cell. The specified
@@ -2112,14 +3823,47 @@ func SetCellStyle(idx int, sheet, topLeftCell, bottomRightCell *C.char, styleID
 //
 //export SetCellValue
 func SetCellValue(idx int, sheet, cell *C.char, value *C.struct_Interface) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetCellValue(C.GoString(sheet), C.GoString(cell), cInterfaceToGo(*value)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
+}
+
+// SetCells provides a function to set the values and the optional styles of
+// cells in bulk by given worksheet name, a pointer to an array of cells and the
+// number of cells. It doesn't stop at the failed cells, the errors of all the
+// failed cells are returned together, one cell per line.
+//
+//export SetCells
+func SetCells(idx int, sheet *C.char, cells *C.struct_CellValue, length int) *C.char {
+	f, unlock, ok := files.lock(idx)
+	if !ok {
+		return C.CString(errFilePtr)
+	}
+	defer unlock()
+	var (
+		sheetName = C.GoString(sheet)
+		errs      []string
+	)
+	for _, c := range unsafe.Slice(cells, length) {
+		cell := C.GoString(c.Cell)
+		err := f.(*excelize.File).SetCellValue(sheetName, cell, cInterfaceToGo(c.Value))
+		if err == nil && c.StyleID != 0 {
+			err = f.(*excelize.File).SetCellStyle(sheetName, cell, cell, int(c.StyleID))
+		}
+		if err != nil {
+			errs = append(errs, cell+": "+err.Error())
+		}
+	}
+	if len(errs) > 0 {
+		return C.CString(strings.Join(errs, "\n"))
+	}
+	return nil
 }
 
 // SetColOutlineLevel provides a function to set outline level of a single
@@ -2128,14 +3872,15 @@ func SetCellValue(idx int, sheet, cell *C.char, value *C.struct_Interface) *C.ch
 //
 //export SetColOutlineLevel
 func SetColOutlineLevel(idx int, sheet, col *C.char, level int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetColOutlineLevel(C.GoString(sheet), C.GoString(col), uint8(level)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetColStyle provides a function to set style of columns by given worksheet
@@ -2145,14 +3890,15 @@ func SetColOutlineLevel(idx int, sheet, col *C.char, level int) *C.char {
 //
 //export SetColStyle
 func SetColStyle(idx int, sheet, columns *C.char, styleID int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetColStyle(C.GoString(sheet), C.GoString(columns), styleID); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetColVisible provides a function to set visible columns by given worksheet
@@ -2160,14 +3906,15 @@ func SetColStyle(idx int, sheet, columns *C.char, styleID int) *C.char {
 //
 //export SetColVisible
 func SetColVisible(idx int, sheet, columns *C.char, visible bool) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetColVisible(C.GoString(sheet), C.GoString(columns), visible); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetColWidth provides a function to set the width of a single column or
@@ -2175,14 +3922,15 @@ func SetColVisible(idx int, sheet, columns *C.char, visible bool) *C.char {
 //
 //export SetColWidth
 func SetColWidth(idx int, sheet, startCol, endCol *C.char, width float64) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetColWidth(C.GoString(sheet), C.GoString(startCol), C.GoString(endCol), width); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetConditionalFormat provides a function to create conditional formatting
@@ -2192,10 +3940,11 @@ func SetColWidth(idx int, sheet, startCol, endCol *C.char, width float64) *C.cha
 //
 //export SetConditionalFormat
 func SetConditionalFormat(idx int, sheet, rangeRef *C.char, opts *C.struct_ConditionalFormatOptions, length int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	options := make([]excelize.ConditionalFormatOptions, length)
 	for i, val := range unsafe.Slice(opts, length) {
 		goVal, err := cValueToGo(reflect.ValueOf(val), reflect.TypeOf(excelize.ConditionalFormatOptions{}))
@@ -2207,7 +3956,7 @@ func SetConditionalFormat(idx int, sheet, rangeRef *C.char, opts *C.struct_Condi
 	if err := f.(*excelize.File).SetConditionalFormat(C.GoString(sheet), C.GoString(rangeRef), options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetDefaultFont provides the default font name currently set in the
@@ -2215,14 +3964,15 @@ func SetConditionalFormat(idx int, sheet, rangeRef *C.char, opts *C.struct_Condi
 //
 //export SetDefaultFont
 func SetDefaultFont(idx int, fontName *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetDefaultFont(C.GoString(fontName)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetDefinedName provides a function to set the defined names of the workbook
@@ -2236,14 +3986,15 @@ func SetDefinedName(idx int, definedName *C.struct_DefinedName) *C.char {
 		return C.CString(err.Error())
 	}
 	df = goVal.Elem().Interface().(excelize.DefinedName)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetDefinedName(&df); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetDocProps provides a function to set document core properties.
@@ -2256,14 +4007,15 @@ func SetDocProps(idx int, docProperties *C.struct_DocProperties) *C.char {
 		return C.CString(err.Error())
 	}
 	options = goVal.Elem().Interface().(excelize.DocProperties)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetDocProps(&options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetHeaderFooter provides a function to set headers and footers by given
@@ -2277,14 +4029,15 @@ func SetHeaderFooter(idx int, sheet *C.char, opts *C.struct_HeaderFooterOptions)
 		return C.CString(err.Error())
 	}
 	options = goVal.Elem().Interface().(excelize.HeaderFooterOptions)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetHeaderFooter(C.GoString(sheet), &options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetPageLayout provides a function to sets worksheet page layout.
@@ -2297,14 +4050,15 @@ func SetPageLayout(idx int, sheet *C.char, opts *C.struct_PageLayoutOptions) *C.
 		return C.CString(err.Error())
 	}
 	options = goVal.Elem().Interface().(excelize.PageLayoutOptions)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetPageLayout(C.GoString(sheet), &options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetPageMargins provides a function to set worksheet page margins.
@@ -2317,14 +4071,15 @@ func SetPageMargins(idx int, sheet *C.char, opts *C.struct_PageLayoutMarginsOpti
 		return C.CString(err.Error())
 	}
 	options = goVal.Elem().Interface().(excelize.PageLayoutMarginsOptions)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetPageMargins(C.GoString(sheet), &options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetPanes provides a function to create and remove freeze panes and split panes
@@ -2338,14 +4093,15 @@ func SetPanes(idx int, sheet *C.char, opts *C.struct_Panes) *C.char {
 		return C.CString(err.Error())
 	}
 	options = goVal.Elem().Interface().(excelize.Panes)
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetPanes(C.GoString(sheet), &options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetRowHeight provides a function to set the height of a single row. If the
@@ -2354,14 +4110,15 @@ func SetPanes(idx int, sheet *C.char, opts *C.struct_Panes) *C.char {
 //
 //export SetRowHeight
 func SetRowHeight(idx int, sheet *C.char, row int, height float64) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetRowHeight(C.GoString(sheet), row, height); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetRowOutlineLevel provides a function to set outline level number of a
@@ -2370,14 +4127,15 @@ func SetRowHeight(idx int, sheet *C.char, row int, height float64) *C.char {
 //
 //export SetRowOutlineLevel
 func SetRowOutlineLevel(idx int, sheet *C.char, row, level int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetRowOutlineLevel(C.GoString(sheet), row, uint8(level)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetRowStyle provides a function to set the style of rows by given worksheet
@@ -2386,14 +4144,15 @@ func SetRowOutlineLevel(idx int, sheet *C.char, row, level int) *C.char {
 //
 //export SetRowStyle
 func SetRowStyle(idx int, sheet *C.char, start, end, styleID int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetRowStyle(C.GoString(sheet), start, end, styleID); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetRowVisible provides a function to set visible of a single row by given
@@ -2401,14 +4160,15 @@ func SetRowStyle(idx int, sheet *C.char, start, end, styleID int) *C.char {
 //
 //export SetRowVisible
 func SetRowVisible(idx int, sheet *C.char, row int, visible bool) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetRowVisible(C.GoString(sheet), row, visible); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetSheetBackground provides a function to set background picture by given
@@ -2417,14 +4177,15 @@ func SetRowVisible(idx int, sheet *C.char, row int, visible bool) *C.char {
 //
 //export SetSheetBackground
 func SetSheetBackground(idx int, sheet, picture *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetSheetBackground(C.GoString(sheet), C.GoString(picture)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetSheetBackgroundFromBytes provides a function to set background picture by
@@ -2433,15 +4194,16 @@ func SetSheetBackground(idx int, sheet, picture *C.char) *C.char {
 //
 //export SetSheetBackgroundFromBytes
 func SetSheetBackgroundFromBytes(idx int, sheet, extension *C.char, picture *C.uchar, pictureLen C.int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	buf := C.GoBytes(unsafe.Pointer(picture), pictureLen)
 	if err := f.(*excelize.File).SetSheetBackgroundFromBytes(C.GoString(sheet), C.GoString(extension), buf); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetSheetCol writes an array to column by given worksheet name, starting
@@ -2449,10 +4211,11 @@ func SetSheetBackgroundFromBytes(idx int, sheet, extension *C.char, picture *C.u
 //
 //export SetSheetCol
 func SetSheetCol(idx int, sheet, cell *C.char, slice *C.struct_Interface, length int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	cells := make([]interface{}, length)
 	for i, val := range unsafe.Slice(slice, length) {
 		cells[i] = cInterfaceToGo(val)
@@ -2460,7 +4223,7 @@ func SetSheetCol(idx int, sheet, cell *C.char, slice *C.struct_Interface, length
 	if err := f.(*excelize.File).SetSheetCol(C.GoString(sheet), C.GoString(cell), &cells); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetSheetDimension provides the method to set or remove the used range of the
@@ -2471,14 +4234,15 @@ func SetSheetCol(idx int, sheet, cell *C.char, slice *C.struct_Interface, length
 //
 //export SetSheetDimension
 func SetSheetDimension(idx int, sheet, rangeRef *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetSheetDimension(C.GoString(sheet), C.GoString(rangeRef)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetSheetName provides a function to set the worksheet name by given source and
@@ -2489,24 +4253,26 @@ func SetSheetDimension(idx int, sheet, rangeRef *C.char) *C.char {
 //
 //export SetSheetName
 func SetSheetName(idx int, source, target *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetSheetName(C.GoString(source), C.GoString(target)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetSheetProps provides a function to set worksheet properties.
 //
 //export SetSheetProps
 func SetSheetProps(idx int, sheet *C.char, opts *C.struct_SheetPropsOptions) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.SheetPropsOptions{}))
 	if err != nil {
 		return C.CString(err.Error())
@@ -2515,7 +4281,7 @@ func SetSheetProps(idx int, sheet *C.char, opts *C.struct_SheetPropsOptions) *C.
 	if err := f.(*excelize.File).SetSheetProps(C.GoString(sheet), &options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetSheetRow writes an array to row by given worksheet name, starting
@@ -2524,10 +4290,11 @@ func SetSheetProps(idx int, sheet *C.char, opts *C.struct_SheetPropsOptions) *C.
 //
 //export SetSheetRow
 func SetSheetRow(idx int, sheet, cell *C.char, row *C.struct_Interface, length int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	cells := make([]interface{}, length)
 	for i, val := range unsafe.Slice(row, length) {
 		cells[i] = cInterfaceToGo(val)
@@ -2535,7 +4302,7 @@ func SetSheetRow(idx int, sheet, cell *C.char, row *C.struct_Interface, length i
 	if err := f.(*excelize.File).SetSheetRow(C.GoString(sheet), C.GoString(cell), &cells); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetSheetView sets sheet view options. The viewIndex may be negative and if
@@ -2543,10 +4310,11 @@ func SetSheetRow(idx int, sheet, cell *C.char, row *C.struct_Interface, length i
 //
 //export SetSheetView
 func SetSheetView(idx int, sheet *C.char, viewIndex int, opts *C.struct_ViewOptions) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.ViewOptions{}))
 	if err != nil {
 		return C.CString(err.Error())
@@ -2555,7 +4323,7 @@ func SetSheetView(idx int, sheet *C.char, viewIndex int, opts *C.struct_ViewOpti
 	if err := f.(*excelize.File).SetSheetView(C.GoString(sheet), viewIndex, &options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetSheetVisible provides a function to set worksheet visible by given
@@ -2565,24 +4333,26 @@ func SetSheetView(idx int, sheet *C.char, viewIndex int, opts *C.struct_ViewOpti
 //
 //export SetSheetVisible
 func SetSheetVisible(idx int, sheet *C.char, visible, veryHidden bool) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).SetSheetVisible(C.GoString(sheet), visible, veryHidden); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // SetWorkbookProps provides a function to sets workbook properties.
 //
 //export SetWorkbookProps
 func SetWorkbookProps(idx int, opts *C.struct_WorkbookPropsOptions) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.WorkbookPropsOptions{}))
 	if err != nil {
 		return C.CString(err.Error())
@@ -2591,35 +4361,37 @@ func SetWorkbookProps(idx int, opts *C.struct_WorkbookPropsOptions) *C.char {
 	if err := f.(*excelize.File).SetWorkbookProps(&options); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // UngroupSheets provides a function to ungroup worksheets.
 //
 //export UngroupSheets
 func UngroupSheets(idx int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).UngroupSheets(); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // UnmergeCell provides a function to unmerge a given range reference.
 //
 //export UnmergeCell
 func UnmergeCell(idx int, sheet, topLeftCell, bottomRightCell *C.char) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).UnmergeCell(C.GoString(sheet), C.GoString(topLeftCell), C.GoString(bottomRightCell)); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
 }
 
 // UpdateLinkedValue fix linked values within a spreadsheet are not updating in
@@ -2628,14 +4400,44 @@ func UnmergeCell(idx int, sheet, topLeftCell, bottomRightCell *C.char) *C.char {
 //
 //export UpdateLinkedValue
 func UpdateLinkedValue(idx int) *C.char {
-	f, ok := files.Load(idx)
+	f, unlock, ok := files.lock(idx)
 	if !ok {
 		return C.CString(errFilePtr)
 	}
+	defer unlock()
 	if err := f.(*excelize.File).UpdateLinkedValue(); err != nil {
 		return C.CString(err.Error())
 	}
-	return C.CString(emptyString)
+	return nil
+}
+
+// WriteTo provides a function to write the spreadsheet to the writer callback
+// function in chunks, the workbook will be packed into the writer directly
+// without creating an intermediate buffer.
+//
+//export WriteTo
+func WriteTo(idx int, writer C.Writer, opts *C.struct_Options) *C.char {
+	f, unlock, ok := files.lock(idx)
+	if !ok {
+		return C.CString(errFilePtr)
+	}
+	defer unlock()
+	if opts != nil {
+		var options excelize.Options
+		goVal, err := cValueToGo(reflect.ValueOf(*opts), reflect.TypeOf(excelize.Options{}))
+		if err != nil {
+			return C.CString(err.Error())
+		}
+		options = goVal.Elem().Interface().(excelize.Options)
+		if _, err := f.(*excelize.File).WriteTo(cWriter{fn: writer}, options); err != nil {
+			return C.CString(err.Error())
+		}
+		return nil
+	}
+	if _, err := f.(*excelize.File).WriteTo(cWriter{fn: writer}); err != nil {
+		return C.CString(err.Error())
+	}
+	return nil
 }
 
 func main() {
@@ -0,0 +1,145 @@
+package main
+
+import (
+	"encoding/xml"
+	"reflect"
+	"strconv"
+	"strings"
+	"testing"
+
+	"github.com/xuri/excelize/v2"
+)
+
+// benchStyle returns a style with nested structures, pointers and arrays for
+// benchmarking the conversions between the Go and C structures.
+func benchStyle() excelize.Style {
+	return excelize.Style{
+		Border: []excelize.Border{
+			{Type: "left", Color: "0000FF", Style: 3},
+			{Type: "top", Color: "00FF00", Style: 4},
+			{Type: "bottom", Color: "FFFF00", Style: 5},
+			{Type: "right", Color: "FF0000", Style: 6},
+		},
+		Fill:   excelize.Fill{Type: "pattern", Color: []string{"E0EBF5"}, Pattern: 1},
+		Font:   &excelize.Font{Bold: true, Italic: true, Family: "Times New Roman", Size: 36, Color: "777777"},
+		NumFmt: 22,
+	}
+}
+
+// styleCType returns the type of the C structure of the style.
+func styleCType() reflect.Type {
+	cType, _ := cResultTypes["GetStyleResult"].FieldByName("style")
+	return cType.Type
+}
+
+func TestCellAttrReader(t *testing.T) {
+	r := &cellAttrReader{decoder: xml.NewDecoder(strings.NewReader(`<worksheet><sheetData>
+<row r="1"><c r="A1" t="s"><v>0</v></c><c r="C1" s="2"><f>A1</f><v>1</v></c></row>
+<row r="3"><c t="b"><v>1</v></c><c t="str"><v>x</v></c></row>
+<row><c r="B4" t="inlineStr"><is><t>y</t></is></c></row>
+<row r="6"><c r="A6" t="e"><v>#N/A</v></c></row>
+</sheetData></worksheet>`))}
+	for _, c := range []struct {
+		row   int
+		attrs []cellAttr
+	}{
+		{1, []cellAttr{{typ: excelize.CellTypeSharedString}, {}, {style: 2}}},
+		{2, nil},
+		{3, []cellAttr{{typ: excelize.CellTypeBool}, {typ: excelize.CellTypeFormula}}},
+		{4, []cellAttr{{}, {typ: excelize.CellTypeInlineString}}},
+		{7, nil},
+		{8, nil},
+	} {
+		attrs, err := r.next(c.row)
+		if err != nil {
+			t.Fatal(err)
+		}
+		if !reflect.DeepEqual(attrs, c.attrs) {
+			t.Errorf("row %d: got %v, want %v", c.row, attrs, c.attrs)
+		}
+	}
+}
+
+func TestSheetXMLPath(t *testing.T) {
+	f := excelize.NewFile()
+	if _, err := f.NewSheet("Sheet2"); err != nil {
+		t.Fatal(err)
+	}
+	for sheet, name := range map[string]string{
+		"Sheet1": "xl/worksheets/sheet1.xml",
+		"sheet2": "xl/worksheets/sheet2.xml",
+		"SheetN": "",
+	} {
+		if got := sheetXMLPath(f, sheet); got != name {
+			t.Errorf("sheetXMLPath(%q) = %q, want %q", sheet, got, name)
+		}
+	}
+}
+
+func TestIsDateNumFmt(t *testing.T) {
+	for code, date := range map[string]bool{
+		"yyyy-mm-dd":              true,
+		"h:mm AM/PM":              true,
+		"[h]:mm:ss":               true,
+		"[$-409]d-mmm-yy":         true,
+		"General":                 false,
+		"0.00%":                   false,
+		"[Red]#,##0.00":           false,
+		`"Days:" 0`:               false,
+		`0\ \d`:                   false,
+		"_(* #,##0_);_(* (#,##0)": false,
+	} {
+		if isDateNumFmtCode(code) != date {
+			t.Errorf("isDateNumFmtCode(%q) != %v", code, date)
+		}
+	}
+	for id, date := range map[int]bool{0: false, 2: false, 14: true, 22: true, 45: true, 49: false} {
+		if isDateNumFmtID(id) != date {
+			t.Errorf("isDateNumFmtID(%d) != %v", id, date)
+		}
+	}
+}
+
+func BenchmarkGoValueToC(b *testing.B) {
+	style, cType := benchStyle(), styleCType()
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		cVal, err := goValueToC(reflect.ValueOf(style), reflect.New(cType))
+		if err != nil {
+			b.Fatal(err)
+		}
+		freeCValue(cVal.Elem())
+	}
+}
+
+func BenchmarkCValueToGo(b *testing.B) {
+	style, cType := benchStyle(), styleCType()
+	cVal, err := goValueToC(reflect.ValueOf(style), reflect.New(cType))
+	if err != nil {
+		b.Fatal(err)
+	}
+	defer freeCValue(cVal.Elem())
+	goType := reflect.TypeOf(style)
+	b.ReportAllocs()
+	b.ResetTimer()
+	for i := 0; i < b.N; i++ {
+		if _, err := cValueToGo(cVal.Elem(), goType); err != nil {
+			b.Fatal(err)
+		}
+	}
+}
+
+func BenchmarkGoRowsToC(b *testing.B) {
+	rows := make([][]string, 1000)
+	for r := range rows {
+		rows[r] = make([]string, 10)
+		for c := range rows[r] {
+			rows[r][c] = strconv.Itoa(r * c)
+		}
+	}
+	b.ReportAllocs()
+	for i := 0; i < b.N; i++ {
+		res := goRowsToC(rows)
+		freeCValue(reflect.ValueOf(&res).Elem())
+	}
+}
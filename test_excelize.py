@@ -13,8 +13,17 @@ amounts of data. This library needs Python version 3.9 or later.
 import unittest
 from dataclasses import dataclass
 from unittest.mock import patch
+import array
+import asyncio
 import datetime
+import decimal
+import io
+import math
+import mmap
 import random
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 from ctypes import (
     c_int,
@@ -24,6 +33,19 @@ from ctypes import (
 import os
 import excelize
 
+try:
+    import resource
+except ImportError:
+    resource = None
+try:
+    import numpy
+except ImportError:
+    numpy = None
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 
 class TestExcelize(unittest.TestCase):
     """
@@ -139,6 +161,207 @@ class TestExcelize(unittest.TestCase):
         self.assertIsNone(sw.flush())
         self.assertIsNone(f.save_as(os.path.join("test", "TestStreamWriter.xlsx")))
 
+    def test_stream_writer_rows(self):
+        f = excelize.new_file()
+        sw = f.new_stream_writer("Sheet1")
+        self.assertIsNone(
+            sw.set_rows(
+                "B2",
+                ([r, "Text", None, r * 0.5, r % 2 == 0] for r in range(1, 6)),
+                chunk_size=2,
+            )
+        )
+        self.assertIsNone(sw.set_rows("B7", []))
+        self.assertIsNone(sw.set_rows("B7", [[], ["End"]]))
+        with self.assertRaises(RuntimeError) as context:
+            sw.set_rows("B", [[1]])
+        self.assertEqual(
+            str(context.exception),
+            'cannot convert cell "B" to coordinates: invalid cell name "B"',
+        )
+        self.assertIsNone(sw.flush())
+        rows = f.get_rows("Sheet1")
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[0], ["", "1", "Text", "", "0.5", "FALSE"])
+        self.assertEqual(rows[4], ["", "5", "Text", "", "2.5", "FALSE"])
+        self.assertEqual(rows[5], ["", "End"])
+        self.assertIsNone(f.close())
+
+        sw = excelize.StreamWriter(100)
+        with self.assertRaises(RuntimeError) as context:
+            sw.set_rows("A1", [[1]])
+        self.assertEqual(str(context.exception), "can not find stream writer pointer")
+
+    def test_stream_writer_columns(self):
+        f = excelize.new_file()
+        sw = f.new_stream_writer("Sheet1")
+        self.assertIsNone(sw.set_row("A1", ["Float", "Int", "Text", "Bool"]))
+        self.assertIsNone(
+            sw.write_columns(
+                "A2",
+                [
+                    array.array("d", [1.5, 2.5, 3.5]),
+                    array.array("q", [1, 2, 3]),
+                    ["a", None, "c"],
+                    [True, False, None],
+                ],
+                nulls=[bytearray(b"\x00\x01\x00"), None, None, None],
+                block_size=2,
+            )
+        )
+        self.assertIsNone(sw.write_columns("A5", [array.array("i", [4]), [4.5]]))
+        with self.assertRaises(RuntimeError) as context:
+            sw.write_columns("A6", [[1, 2], [1]])
+        self.assertEqual(
+            str(context.exception), "the number of values of each column must be same"
+        )
+        with self.assertRaises(RuntimeError) as context:
+            sw.write_columns("A6", [[b"Bytes"]])
+        self.assertEqual(str(context.exception), "invalid argument data type")
+        self.assertIsNone(sw.flush())
+        self.assertEqual(
+            f.get_rows("Sheet1"),
+            [
+                ["Float", "Int", "Text", "Bool"],
+                ["1.5", "1", "a", "TRUE"],
+                ["", "2", "", "FALSE"],
+                ["3.5", "3", "c"],
+                ["4", "4.5"],
+            ],
+        )
+        self.assertIsNone(f.close())
+
+        sw = excelize.StreamWriter(100)
+        with self.assertRaises(RuntimeError) as context:
+            sw.write_columns("A1", [[1]])
+        self.assertEqual(str(context.exception), "can not find stream writer pointer")
+
+    def test_stream_writer_dates(self):
+        values = [
+            datetime.datetime(1900, 1, 1),
+            datetime.date(1900, 3, 1),
+            datetime.datetime(2024, 1, 1, 12),
+            None,
+        ]
+        serials = excelize.dates_to_excel_serials(values)
+        self.assertEqual(list(serials[:3]), [1, 61, 45292.5])
+        self.assertTrue(math.isnan(serials[3]))
+        self.assertEqual(
+            list(excelize.dates_to_excel_serials(values[2:3], date1904=True)),
+            [43830.5],
+        )
+        for value in values[:3] + [datetime.datetime(2024, 1, 1, 12, 30, 15, 500000)]:
+            if type(value) is datetime.date:
+                value = datetime.datetime(value.year, value.month, value.day)
+            self.assertEqual(
+                excelize.c_interface_to_py(excelize.py_value_to_c_interface(value)),
+                value,
+            )
+
+        f = excelize.new_file()
+        sw = f.new_stream_writer("Sheet1")
+        self.assertIsNone(sw.write_columns("A1", [values, [1, 2, 3, 4]]))
+        self.assertIsNone(sw.flush())
+        # The dates are written as numbers with a date format, which are read
+        # back as datetimes in the typed mode
+        self.assertEqual(
+            f.get_cell_values("Sheet1", "A1:A4", typed=True),
+            [
+                [datetime.datetime(1900, 1, 1)],
+                [datetime.datetime(1900, 3, 1)],
+                [datetime.datetime(2024, 1, 1, 12)],
+                [None],
+            ],
+        )
+        self.assertNotEqual(f.get_cell_style("Sheet1", "A3"), 0)
+        self.assertEqual(f.get_cell_style("Sheet1", "B3"), 0)
+        self.assertIsNone(f.close())
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_stream_writer_datetime64(self):
+        values = numpy.array(
+            ["2024-01-01T12:00", "NaT", "1900-02-28"], dtype="datetime64[s]"
+        )
+        serials = excelize.dates_to_excel_serials(values)
+        self.assertEqual(serials[0], 45292.5)
+        self.assertTrue(numpy.isnan(serials[1]))
+        self.assertEqual(serials[2], 59)
+        f = excelize.new_file()
+        self.assertIsNone(
+            f.set_workbook_props(excelize.WorkbookPropsOptions(date1904=True))
+        )
+        sw = f.new_stream_writer("Sheet1")
+        self.assertIsNone(sw.write_columns("A1", [values]))
+        self.assertIsNone(sw.flush())
+        self.assertEqual(
+            f.get_cell_values("Sheet1", ["A1", "A2"], typed=True),
+            [datetime.datetime(2024, 1, 1, 12), None],
+        )
+        self.assertEqual(
+            f.get_cell_value("Sheet1", "A1", excelize.Options(raw_cell_value=True)),
+            "43830.5",
+        )
+        self.assertIsNone(f.close())
+
+    def test_stream_writer_table(self):
+        f = excelize.new_file()
+        style_id = f.new_style(excelize.Style(font=excelize.Font(bold=True)))
+        sw = f.new_stream_writer("Sheet1")
+        self.assertIsNone(
+            sw.write_table(
+                "B2",
+                {"ID": array.array("q", [1, 2]), "Name": ["Alice", None]},
+                styles={"Name": style_id},
+            )
+        )
+        self.assertIsNone(sw.write_table("B5", {"ID": [3]}, header=False))
+        with self.assertRaises(RuntimeError) as context:
+            sw.write_table("B6", {"ID": [1, 2], "Name": ["Alice"]}, header=False)
+        self.assertEqual(
+            str(context.exception), "the number of values of each column must be same"
+        )
+        self.assertIsNone(sw.flush())
+        self.assertEqual(
+            f.get_rows("Sheet1"),
+            [["", "ID", "Name"], ["", "1", "Alice"], ["", "2"], ["", "3"]],
+        )
+        self.assertEqual(f.get_cell_style("Sheet1", "C3"), style_id)
+        self.assertEqual(f.get_cell_style("Sheet1", "B3"), 0)
+        self.assertIsNone(f.from_arrow("Sheet1", {"Total": [1.5]}, "A1"))
+        self.assertEqual(f.get_rows("Sheet1"), [["Total"], ["1.5"]])
+        with self.assertRaises(RuntimeError) as context:
+            f.from_arrow("SheetN", {"Total": [1.5]})
+        self.assertEqual(str(context.exception), "sheet SheetN does not exist")
+        self.assertIsNone(f.close())
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_from_arrow(self):
+        f = excelize.new_file()
+        table = pyarrow.table(
+            {
+                "Int": pyarrow.array([0, 1, None, 3], pyarrow.int32()),
+                "Float": [0.5, 1.5, 2.5, None],
+                "Text": ["x", "a", None, "c"],
+                "Bool": [False, True, None, False],
+            }
+        )
+        self.assertIsNone(f.from_arrow("Sheet1", table.slice(1)))
+        self.assertEqual(
+            f.get_rows("Sheet1"),
+            [
+                ["Int", "Float", "Text", "Bool"],
+                ["1", "1.5", "a", "TRUE"],
+                ["", "2.5"],
+                ["3", "", "c", "FALSE"],
+            ],
+        )
+        with self.assertRaises(RuntimeError) as context:
+            f.from_arrow(
+                "Sheet1", pyarrow.table({"Date": [datetime.date(2016, 8, 30)]})
+            )
+        self.assertEqual(str(context.exception), "invalid argument data type")
+        self.assertIsNone(f.close())
+
     def test_style(self):
         f = excelize.new_file()
         s = excelize.Style(
@@ -533,6 +756,9 @@ class TestExcelize(unittest.TestCase):
         with self.assertRaises(RuntimeError) as context:
             f.save()
         self.assertEqual(str(context.exception), expected)
+        with self.assertRaises(RuntimeError) as context:
+            f.write_to_buffer()
+        self.assertEqual(str(context.exception), expected)
 
         f = excelize.new_file()
         sw = f.new_stream_writer("Sheet1")
@@ -1161,6 +1387,33 @@ class TestExcelize(unittest.TestCase):
             _ = f.calc_cell_value("SheetN", "A1")
         self.assertEqual(str(context.exception), "sheet SheetN does not exist")
 
+    def test_calc_cell_values(self):
+        f = excelize.new_file()
+        for row in range(1, 11):
+            self.assertIsNone(f.set_cell_value("Sheet1", f"A{row}", row))
+            self.assertIsNone(f.set_cell_formula("Sheet1", f"B{row}", f"A{row}*2"))
+        self.assertIsNone(f.set_cell_formula("Sheet1", "C1", "SUM(B1:B10)"))
+        self.assertIsNone(f.set_cell_formula("Sheet1", "C2", "1/0"))
+        values, errors = f.calc_cell_values("Sheet1", "B1:C2")
+        self.assertEqual(values, [["2", "110"], ["4", "#DIV/0!"]])
+        self.assertEqual(errors, [[None, None], [None, "#DIV/0!"]])
+        for workers in (0, 4):
+            values, errors = f.calc_cell_values(
+                "Sheet1", [f"B{row}" for row in range(10, 0, -1)], workers=workers
+            )
+            self.assertEqual(values, [str(row * 2) for row in range(10, 0, -1)])
+            self.assertEqual(errors, [None] * 10)
+        self.assertEqual(f.calc_cell_values("Sheet1", []), ([], []))
+        values, errors = f.calc_cell_values("SheetN", ["A1"])
+        self.assertEqual(errors, ["sheet SheetN does not exist"])
+        with self.assertRaises(RuntimeError) as context:
+            f.calc_cell_values("Sheet1", "A1:B2:C3")
+        self.assertEqual(str(context.exception), "parameter is invalid")
+        self.assertIsNone(f.close())
+        with self.assertRaises(RuntimeError) as context:
+            f.calc_cell_values("Sheet1", "A1:B2")
+        self.assertEqual(str(context.exception), "can not find file pointer")
+
     def test_cell_name_to_coordinates(self):
         col, row = excelize.cell_name_to_coordinates("Z3")
         self.assertEqual(col, 26)
@@ -1461,6 +1714,298 @@ class TestExcelize(unittest.TestCase):
         self.assertIsNone(f.save_as(os.path.join("test", "TestDocProps.xlsx")))
         self.assertIsNone(f.close())
 
+    def test_get_all_rows(self):
+        f = excelize.new_file()
+        for i in range(1, 5):
+            sheet = f"Sheet{i}"
+            if i > 1:
+                self.assertEqual(f.new_sheet(sheet), i - 1)
+            for row in range(1, i * 10 + 1):
+                self.assertIsNone(f.set_sheet_row(sheet, f"A{row}", [sheet, row]))
+        self.assertIsNone(f.set_cell_value("Sheet1", "A12", "Blank row"))
+        rows = f.get_all_rows()
+        self.assertEqual(list(rows), ["Sheet1", "Sheet2", "Sheet3", "Sheet4"])
+        for sheet, sheet_rows in rows.items():
+            self.assertEqual(sheet_rows, f.get_rows(sheet))
+        self.assertEqual(rows["Sheet4"][39], ["Sheet4", "40"])
+        self.assertEqual(rows["Sheet1"][-1], ["Blank row"])
+        self.assertEqual(
+            f.get_all_rows(["Sheet3", "Sheet1"], workers=1),
+            {"Sheet3": rows["Sheet3"], "Sheet1": rows["Sheet1"]},
+        )
+        self.assertEqual(f.get_all_rows([]), {})
+        with self.assertRaises(RuntimeError) as context:
+            f.get_all_rows(["Sheet1", "SheetN", "SheetM"], workers=2)
+        self.assertEqual(
+            str(context.exception),
+            "sheet SheetN does not exist\nsheet SheetM does not exist",
+        )
+        self.assertIsNone(f.close())
+        with self.assertRaises(RuntimeError) as context:
+            f.get_all_rows()
+        self.assertEqual(str(context.exception), "can not find file pointer")
+
+    def test_string_matrix(self):
+        f = excelize.new_file()
+        rows = [["ASCII", "", "Ünicode"], ["文本", "😀"], [], ["A", "", "B"]]
+        for i, row in enumerate(rows, 1):
+            self.assertIsNone(f.set_sheet_row("Sheet1", f"A{i}", row))
+        self.assertEqual(f.get_rows("Sheet1"), [rows[0], rows[1], rows[3]])
+        self.assertEqual(
+            f.get_cols("Sheet1"),
+            [["ASCII", "文本", "", "A"], ["", "😀"], ["Ünicode", "", "", "B"]],
+        )
+        self.assertEqual(f.search_sheet("Sheet1", "文本"), ["A2"])
+        self.assertEqual(f.search_sheet("Sheet1", "None"), [])
+        self.assertEqual(list(f.rows("Sheet1")), [rows[0], rows[1], [], ["A", "", "B"]])
+        self.assertIsNone(f.close())
+
+    def test_get_dict_rows(self):
+        f = excelize.new_file()
+        status = ["Open", "Closed", "Pending"]
+        for r in range(1, 101):
+            row = [status[r % 3], "国家", r % 2]
+            self.assertIsNone(f.set_sheet_row("Sheet1", f"A{r}", row))
+        self.assertIsNone(f.set_cell_value("Sheet1", "A103", "Open"))
+        values, indexes = f.get_dict_rows("Sheet1")
+        self.assertEqual(values, ["Closed", "国家", "1", "Pending", "0", "Open"])
+        self.assertEqual(len(indexes), 101)
+        self.assertEqual(
+            [[values[i] for i in row] for row in indexes], f.get_rows("Sheet1")
+        )
+        self.assertEqual(indexes[-1], [5])
+        self.assertEqual(
+            f.get_dict_rows("Sheet1", excelize.Options()), (values, indexes)
+        )
+        self.assertEqual(f.new_sheet("Sheet2"), 1)
+        self.assertEqual(f.get_dict_rows("Sheet2"), ([], []))
+        with self.assertRaises(RuntimeError) as context:
+            f.get_dict_rows("SheetN")
+        self.assertEqual(str(context.exception), "sheet SheetN does not exist")
+        self.assertIsNone(f.close())
+        with self.assertRaises(RuntimeError) as context:
+            f.get_dict_rows("Sheet1")
+        self.assertEqual(str(context.exception), "can not find file pointer")
+
+    def test_get_cell_values(self):
+        f = excelize.new_file()
+        self.assertIsNone(
+            f.set_sheet_row("Sheet1", "A1", ["Text", 100, 1.5, True, None])
+        )
+        self.assertEqual(
+            f.get_cell_values("Sheet1", "A1:D2"),
+            [["Text", "100", "1.5", "TRUE"], ["", "", "", ""]],
+        )
+        self.assertEqual(f.get_cell_values("Sheet1", "B1"), [["100"]])
+        self.assertEqual(f.get_cell_values("Sheet1", ["D1", "A1"]), ["TRUE", "Text"])
+        self.assertEqual(
+            f.get_cell_values(
+                "Sheet1", ["A1", "B1", "C1", "D1", "E1", "F9"], typed=True
+            ),
+            ["Text", 100, 1.5, True, None, None],
+        )
+        self.assertEqual(f.get_cell_values("Sheet1", "B1:C1", typed=True), [[100, 1.5]])
+        self.assertEqual(f.get_cell_values("Sheet1", []), [])
+        with self.assertRaises(RuntimeError) as context:
+            f.get_cell_values("Sheet1", ["A1", "A"])
+        self.assertEqual(
+            str(context.exception),
+            'cannot convert cell "A" to coordinates: invalid cell name "A"',
+        )
+        with self.assertRaises(RuntimeError) as context:
+            f.get_cell_values("Sheet1", "A1:B2:C3")
+        self.assertEqual(str(context.exception), "parameter is invalid")
+        with self.assertRaises(RuntimeError) as context:
+            f.get_cell_values("SheetN", "A1:B2", typed=True)
+        self.assertEqual(str(context.exception), "sheet SheetN does not exist")
+        self.assertIsNone(f.close())
+
+    def test_typed_rows(self):
+        f = excelize.new_file()
+        self.assertIsNone(
+            f.set_sheet_row("Sheet1", "A1", ["Text", 100, 1.5, True, None, "End"])
+        )
+        self.assertIsNone(f.set_cell_value("Sheet1", "A3", 1))
+        self.assertEqual(
+            f.get_rows("Sheet1", typed=True),
+            [["Text", 100, 1.5, True, None, "End"], [1]],
+        )
+        self.assertEqual(
+            f.get_rows("Sheet1", cell_types=True),
+            [
+                [
+                    excelize.CellType.CellTypeSharedString,
+                    excelize.CellType.CellTypeNumber,
+                    excelize.CellType.CellTypeNumber,
+                    excelize.CellType.CellTypeBool,
+                    excelize.CellType.CellTypeUnset,
+                    excelize.CellType.CellTypeSharedString,
+                ],
+                [excelize.CellType.CellTypeNumber],
+            ],
+        )
+        self.assertEqual(f.new_sheet("Sheet2"), 1)
+        self.assertEqual(f.get_rows("Sheet2", typed=True), [])
+        style_id = f.new_style(excelize.Style(custom_num_fmt="yyyy/mm/dd hh:mm"))
+        self.assertIsNone(
+            f.set_sheet_row(
+                "Sheet2", "A1", [datetime.datetime(2024, 1, 2, 3, 4, 5), 45000.5]
+            )
+        )
+        self.assertIsNone(f.set_cell_style("Sheet2", "B1", "B1", style_id))
+        self.assertIsNone(f.set_cell_value("Sheet2", "C1", 42))
+        dates = [
+            datetime.datetime(2024, 1, 2, 3, 4, 5),
+            datetime.datetime(2023, 3, 15, 12),
+            42,
+        ]
+        self.assertEqual(f.get_rows("Sheet2", typed=True), [dates])
+        self.assertEqual(f.get_cell_values("Sheet2", "A1:C1", typed=True), [dates])
+        self.assertEqual(
+            f.get_cell_values("Sheet2", ["B1", "C1"], typed=True), dates[1:]
+        )
+        self.assertEqual(f.get_cell_value("Sheet1", "B1", typed=True), 100)
+        self.assertEqual(f.get_cell_value("Sheet1", "D1", typed=True), True)
+        self.assertIsNone(f.get_cell_value("Sheet1", "E1", typed=True))
+        with self.assertRaises(RuntimeError) as context:
+            f.get_rows("SheetN", typed=True)
+        self.assertEqual(str(context.exception), "sheet SheetN does not exist")
+        with self.assertRaises(RuntimeError) as context:
+            f.get_cell_value("Sheet1", "A", typed=True)
+        self.assertEqual(
+            str(context.exception),
+            'cannot convert cell "A" to coordinates: invalid cell name "A"',
+        )
+        self.assertIsNone(f.close())
+
+    @unittest.skipIf(numpy is None, "numpy is not installed")
+    def test_to_numpy(self):
+        f = excelize.new_file()
+        self.assertIsNone(f.set_sheet_row("Sheet1", "A1", ["ID", "Name", "Score"]))
+        self.assertIsNone(f.set_sheet_row("Sheet1", "A2", [1, "Alice", 90.5]))
+        self.assertIsNone(f.set_sheet_row("Sheet1", "A3", [2, None, None]))
+        self.assertIsNone(f.set_sheet_row("Sheet1", "A4", [3, "Carol", True]))
+        arrays = f.to_numpy("Sheet1", header=True)
+        self.assertEqual(list(arrays), ["ID", "Name", "Score"])
+        self.assertEqual(arrays["ID"].dtype, numpy.float64)
+        self.assertEqual(arrays["ID"].tolist(), [1, 2, 3])
+        self.assertEqual(arrays["Name"].tolist(), ["Alice", None, "Carol"])
+        self.assertEqual(arrays["Score"].tolist(), ["90.5", None, "TRUE"])
+        arrays = f.to_numpy("Sheet1", "A2:A3")
+        self.assertEqual(list(arrays), ["A"])
+        self.assertEqual(arrays["A"].tolist(), [1, 2])
+        self.assertIsNotNone(arrays["A"].base)
+        arrays = f.to_numpy("Sheet1", "C2:C3")
+        self.assertEqual(arrays["C"][0], 90.5)
+        self.assertTrue(numpy.isnan(arrays["C"][1]))
+        out = numpy.zeros(4)
+        arrays = f.to_numpy("Sheet1", header=True, out={"ID": out})
+        self.assertIs(arrays["ID"].base, out)
+        self.assertEqual(out.tolist(), [1, 2, 3, 0])
+        self.assertEqual(arrays["Name"].tolist(), ["Alice", None, "Carol"])
+        for out, err in [
+            ({"ID": numpy.zeros(2)}, "the buffer is too small for the column"),
+            (
+                {"Name": numpy.zeros(4)},
+                "the column of the buffer is not a number column",
+            ),
+            ({"ID": numpy.zeros(4, dtype=numpy.int64)}, "invalid argument data type"),
+            ({"ID": numpy.zeros(8)[::2]}, "invalid argument data type"),
+        ]:
+            with self.assertRaises(RuntimeError) as context:
+                f.to_numpy("Sheet1", header=True, out=out)
+            self.assertEqual(str(context.exception), err)
+        with self.assertRaises(RuntimeError) as context:
+            f.to_numpy("Sheet1", "A1:B2:C3")
+        self.assertEqual(str(context.exception), "parameter is invalid")
+        with self.assertRaises(RuntimeError) as context:
+            f.to_numpy("SheetN")
+        self.assertEqual(str(context.exception), "sheet SheetN does not exist")
+        self.assertIsNone(f.close())
+
+    @unittest.skipIf(pyarrow is None, "pyarrow is not installed")
+    def test_to_arrow(self):
+        f = excelize.new_file()
+        self.assertIsNone(f.set_sheet_row("Sheet1", "A1", ["ID", "Name", "Score"]))
+        self.assertIsNone(f.set_sheet_row("Sheet1", "A2", [1, "Alice", 90.5]))
+        self.assertIsNone(f.set_sheet_row("Sheet1", "A3", [2, None, None]))
+        table = f.to_arrow("Sheet1", header=True)
+        self.assertEqual(table.column_names, ["ID", "Name", "Score"])
+        self.assertEqual(
+            [field.type for field in table.schema],
+            [pyarrow.float64(), pyarrow.large_string(), pyarrow.float64()],
+        )
+        self.assertEqual(
+            table.to_pydict(),
+            {"ID": [1, 2], "Name": ["Alice", None], "Score": [90.5, None]},
+        )
+        table = f.to_arrow("Sheet1", "B1:D1")
+        self.assertEqual(table.column_names, ["B", "C", "D"])
+        self.assertEqual(
+            table.to_pydict(), {"B": ["Name"], "C": ["Score"], "D": [None]}
+        )
+        self.assertEqual(f.to_arrow("Sheet1", "A5").num_rows, 1)
+        with self.assertRaises(RuntimeError) as context:
+            f.to_arrow("SheetN")
+        self.assertEqual(str(context.exception), "sheet SheetN does not exist")
+        self.assertIsNone(f.close())
+
+    def test_large_numbers(self):
+        f = excelize.new_file()
+        self.assertIsNone(f.set_cell_value("Sheet1", "A1", 2**40))
+        self.assertIsNone(f.set_cell_value("Sheet1", "B1", -(2**63)))
+        self.assertIsNone(f.set_cell_value("Sheet1", "C1", 2**70))
+        self.assertIsNone(f.set_cell_value("Sheet1", "D1", decimal.Decimal("12.345")))
+        self.assertIsNone(f.set_cells("Sheet1", {"E1": 2**53 + 1, "F1": 2**31}))
+        self.assertEqual(f.get_cell_value("Sheet1", "A1"), "1099511627776")
+        self.assertEqual(f.get_cell_value("Sheet1", "D1"), "12.345")
+        self.assertEqual(
+            f.get_cell_values("Sheet1", "A1:F1", typed=True),
+            [[2**40, -(2**63), float(2**70), 12.345, 2**53 + 1, 2**31]],
+        )
+        self.assertEqual(f.new_sheet("Sheet2"), 1)
+        sw = f.new_stream_writer("Sheet2")
+        self.assertIsNone(
+            sw.write_columns("A1", [[2**40, None], [decimal.Decimal("0.1"), 2**64]])
+        )
+        self.assertIsNone(sw.flush())
+        self.assertEqual(
+            f.get_rows("Sheet2", typed=True), [[2**40, 0.1], [None, float(2**64)]]
+        )
+        self.assertIsNone(f.close())
+
+    def test_set_cells(self):
+        f = excelize.new_file()
+        style_id = f.new_style(excelize.Style(font=excelize.Font(bold=True)))
+        self.assertIsNone(
+            f.set_cells(
+                "Sheet1",
+                {"A1": "Hello", "B1": 100, "C1": 123.45, "D1": True, "E1": None},
+            )
+        )
+        self.assertIsNone(
+            f.set_cells("Sheet1", [("A2", "World", style_id), ("B2", 200)])
+        )
+        self.assertIsNone(f.set_cells("Sheet1", []))
+        self.assertEqual(
+            f.get_rows("Sheet1"),
+            [["Hello", "100", "123.45", "TRUE"], ["World", "200"]],
+        )
+        self.assertEqual(f.get_cell_style("Sheet1", "A2"), style_id)
+        self.assertEqual(f.get_cell_style("Sheet1", "B2"), 0)
+        with self.assertRaises(RuntimeError) as context:
+            f.set_cells("Sheet1", [("A", 1), ("A3", "Text"), ("B3", 1, 100)])
+        self.assertEqual(
+            str(context.exception),
+            'A: cannot convert cell "A" to coordinates: invalid cell name "A"\n'
+            "B3: invalid style ID 100",
+        )
+        self.assertEqual(f.get_cell_value("Sheet1", "A3"), "Text")
+        with self.assertRaises(RuntimeError) as context:
+            f.set_cells("SheetN", {"A1": 1})
+        self.assertEqual(str(context.exception), "A1: sheet SheetN does not exist")
+        self.assertIsNone(f.close())
+
     def test_set_sheet_col(self):
         f = excelize.new_file()
         self.assertIsNone(
@@ -1549,6 +2094,343 @@ class TestExcelize(unittest.TestCase):
         self.assertIsNone(f.save_as(os.path.join("test", "TestWorkbookProps.xlsx")))
         self.assertIsNone(f.close())
 
+    def test_rows(self):
+        f = excelize.new_file()
+        for r in range(1, 11):
+            cell = excelize.coordinates_to_cell_name(1, r, False)
+            self.assertIsNone(f.set_sheet_row("Sheet1", cell, [r, f"R{r}", r * 0.5]))
+        self.assertIsNone(f.set_cell_value("Sheet1", "A12", "Hello"))
+        expected = f.get_rows("Sheet1")
+        expected.insert(10, [])
+        self.assertEqual(list(f.rows("Sheet1", batch_size=3)), expected)
+        self.assertEqual(list(f.rows("Sheet1", batch_size=100)), expected)
+        self.assertEqual(
+            next(f.rows("Sheet1", excelize.Options(raw_cell_value=True))),
+            ["1", "R1", "0.5"],
+        )
+        with self.assertRaises(RuntimeError) as context:
+            list(f.rows("SheetN"))
+        self.assertEqual(str(context.exception), "sheet SheetN does not exist")
+        self.assertIsNone(f.close())
+
+    def test_cols(self):
+        f = excelize.new_file()
+        for r in range(1, 4):
+            cell = excelize.coordinates_to_cell_name(1, r, False)
+            self.assertIsNone(
+                f.set_sheet_row("Sheet1", cell, [r, None, f"C{r}", r * 2])
+            )
+        expected = [["1", "2", "3"], [], ["C1", "C2", "C3"], ["2", "4", "6"]]
+        self.assertEqual(f.get_cols("Sheet1"), expected)
+        self.assertEqual(list(f.cols("Sheet1", batch_size=1)), expected)
+        self.assertEqual(list(f.cols("Sheet1", columns="C:D")), expected[2:])
+        self.assertEqual(list(f.cols("Sheet1", columns="D:C")), expected[2:])
+        self.assertEqual(list(f.cols("Sheet1", columns="A")), expected[:1])
+        self.assertEqual(list(f.cols("Sheet1", columns="X:Z")), [])
+        with self.assertRaises(RuntimeError) as context:
+            f.get_cols("SheetN")
+        self.assertEqual(str(context.exception), "sheet SheetN does not exist")
+        with self.assertRaises(RuntimeError) as context:
+            list(f.cols("SheetN"))
+        self.assertEqual(str(context.exception), "sheet SheetN does not exist")
+        with self.assertRaises(RuntimeError) as context:
+            list(f.cols("Sheet1", columns="-"))
+        self.assertEqual(str(context.exception), 'invalid column name "-"')
+        self.assertIsNone(f.close())
+
+    def test_write_to(self):
+        f = excelize.new_file()
+        self.assertIsNone(f.set_cell_value("Sheet1", "A1", "Hello"))
+        buf = f.write_to_buffer()
+        self.assertEqual(buf[:2], b"PK")
+        f2 = excelize.open_reader(buf)
+        self.assertEqual(f2.get_cell_value("Sheet1", "A1"), "Hello")
+        self.assertIsNone(f2.close())
+
+        writer = io.BytesIO()
+        self.assertEqual(f.write_to(writer), len(writer.getvalue()))
+        f2 = excelize.open_reader(writer.getvalue())
+        self.assertEqual(f2.get_cell_value("Sheet1", "A1"), "Hello")
+        self.assertIsNone(f2.close())
+
+        buf = f.write_to_buffer(excelize.Options(password="password"))
+        f2 = excelize.open_reader(buf, excelize.Options(password="password"))
+        self.assertEqual(f2.get_cell_value("Sheet1", "A1"), "Hello")
+        self.assertIsNone(f2.close())
+
+        class _Writer:
+            def write(self, b):
+                raise OSError("disk full")
+
+        with self.assertRaises(OSError) as context:
+            f.write_to(_Writer())
+        self.assertEqual(str(context.exception), "disk full")
+        self.assertIsNone(f.close())
+
+    def test_open_stream(self):
+        f = excelize.new_file()
+        self.assertIsNone(f.set_cell_value("Sheet1", "A1", "Hello"))
+        buf = f.write_to_buffer()
+        self.assertIsNone(f.close())
+
+        for data in [bytearray(buf), memoryview(buf), memoryview(bytearray(buf))]:
+            f = excelize.open_reader(data)
+            self.assertEqual(f.get_cell_value("Sheet1", "A1"), "Hello")
+            self.assertIsNone(f.close())
+
+        path = os.path.join("test", "TestOpenStream.xlsx")
+        with open(path, "wb") as file:
+            file.write(buf)
+        with open(path, "rb") as file:
+            with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                f = excelize.open_reader(mm)
+                self.assertEqual(f.get_cell_value("Sheet1", "A1"), "Hello")
+                self.assertIsNone(f.close())
+        with open(path, "r+b") as file:
+            with mmap.mmap(file.fileno(), 0) as mm:
+                f = excelize.open_reader(mm)
+                self.assertEqual(f.get_cell_value("Sheet1", "A1"), "Hello")
+                self.assertIsNone(f.close())
+        with open(path, "rb") as file:
+            f = excelize.open_stream(file)
+            self.assertEqual(f.get_cell_value("Sheet1", "A1"), "Hello")
+            self.assertIsNone(f.close())
+
+        class _Reader:
+            def __init__(self, data):
+                self.data = data
+
+            def read(self, n):
+                chunk, self.data = self.data[:n], self.data[n:]
+                return chunk
+
+        f = excelize.open_stream(_Reader(buf))
+        self.assertEqual(f.get_cell_value("Sheet1", "A1"), "Hello")
+        self.assertIsNone(f.close())
+
+        with self.assertRaises(RuntimeError) as context:
+            excelize.open_stream(io.BytesIO(b"Hello"))
+        self.assertEqual(str(context.exception), "zip: not a valid zip file")
+
+        class _BrokenReader:
+            def read(self, n):
+                raise OSError("connection reset")
+
+        with self.assertRaises(OSError) as context:
+            excelize.open_stream(_BrokenReader())
+        self.assertEqual(str(context.exception), "connection reset")
+
+    def test_generate_workbooks(self):
+        jobs = [
+            excelize.WorkbookJob(
+                cells={"Sheet1": {"A1": f"Job {i}", "B1": i}},
+                output=os.path.join("test", f"TestGenerateWorkbooks{i}.xlsx"),
+            )
+            for i in range(5)
+        ]
+        jobs.append(excelize.WorkbookJob(cells={"Sheet1": {"A1": "Buffer"}}))
+        results = list(excelize.generate_workbooks(jobs, max_workers=2, chunk_size=2))
+        self.assertEqual([i for i, _ in results], list(range(6)))
+        for i, path in results[:5]:
+            self.assertEqual(path, jobs[i].output)
+            f = excelize.open_file(path)
+            self.assertEqual(f.get_cell_value("Sheet1", "A1"), f"Job {i}")
+            self.assertEqual(f.get_cell_value("Sheet1", "B1"), str(i))
+            self.assertIsNone(f.close())
+        f = excelize.open_reader(results[5][1])
+        self.assertEqual(f.get_cell_value("Sheet1", "A1"), "Buffer")
+        self.assertIsNone(f.close())
+
+        jobs = [
+            excelize.WorkbookJob(cells={"Sheet1": {"A1": "OK"}}),
+            excelize.WorkbookJob(cells={"SheetN": {"A1": "Fail"}}),
+            excelize.WorkbookJob(cells={"Sheet1": {"A1": "OK"}}),
+        ]
+        results = []
+        with self.assertRaises(RuntimeError) as context:
+            for result in excelize.generate_workbooks(jobs, max_workers=1):
+                results.append(result)
+        self.assertEqual([i for i, _ in results], [0, 2])
+        self.assertEqual(str(context.exception), "1: A1: sheet SheetN does not exist")
+
+    def test_async_file(self):
+        f = excelize.new_file()
+        for row in range(1, 11):
+            self.assertIsNone(f.set_sheet_row("Sheet1", f"A{row}", [row, row * 2]))
+        self.assertIsNone(f.set_cell_formula("Sheet1", "C1", "SUM(A1:A10)"))
+        self.assertIsNone(f.save_as(os.path.join("test", "TestAsyncFile.xlsx")))
+        self.assertIsNone(f.close())
+
+        async def run():
+            af = await excelize.open_file_async(
+                os.path.join("test", "TestAsyncFile.xlsx")
+            )
+            self.assertEqual(await af.calc_cell_value("Sheet1", "C1"), "55")
+            self.assertEqual(len(await af.get_rows("Sheet1")), 10)
+            # The calls on the workbook run in the order they were made
+            await asyncio.gather(
+                *(af.set_cell_value("Sheet1", "D1", i) for i in range(20))
+            )
+            self.assertEqual(await af.get_cell_value("Sheet1", "D1"), "19")
+            rows = [row async for row in af.rows("Sheet1", batch_size=3)]
+            self.assertEqual(rows[9], ["10", "20"])
+            self.assertEqual(len(rows), 10)
+            with self.assertRaises(RuntimeError) as context:
+                await af.get_rows("SheetN")
+            self.assertEqual(str(context.exception), "sheet SheetN does not exist")
+
+            # A cancelled call still runs before the workbook is closed
+            task = asyncio.ensure_future(af.set_cell_value("Sheet1", "E1", "E1"))
+            await asyncio.sleep(0)
+            task.cancel()
+            self.assertEqual(await af.get_cell_value("Sheet1", "E1"), "E1")
+            close = asyncio.ensure_future(af.close())
+            await asyncio.sleep(0)
+            close.cancel()
+            self.assertIsNone(await af.close())
+            with self.assertRaises(RuntimeError) as context:
+                await af.get_cell_value("Sheet1", "A1")
+            self.assertEqual(str(context.exception), "can not find file pointer")
+
+            with ThreadPoolExecutor(1) as executor:
+                async with excelize.AsyncFile(excelize.new_file(), executor) as af:
+                    self.assertEqual(af.executor, executor)
+                    self.assertIsNone(await af.set_cell_value("Sheet1", "A1", 1))
+                with self.assertRaises(RuntimeError) as context:
+                    await af.get_cell_value("Sheet1", "A1")
+                self.assertEqual(str(context.exception), "can not find file pointer")
+
+        asyncio.run(run())
+
+    def test_concurrent_access(self):
+        f = excelize.new_file()
+        for row in range(1, 101):
+            self.assertIsNone(
+                f.set_sheet_row("Sheet1", f"A{row}", [f"R{row}", row, row * 2])
+            )
+        self.assertIsNone(f.set_cell_formula("Sheet1", "D1", "SUM(B1:B100)"))
+        barrier = threading.Barrier(8)
+
+        def read(worker):
+            barrier.wait()
+            for i in range(50):
+                row = (worker * 50 + i) % 100 + 1
+                self.assertEqual(f.get_cell_value("Sheet1", f"A{row}"), f"R{row}")
+                self.assertEqual(f.calc_cell_value("Sheet1", "D1"), "5050")
+                if i % 10 == 0:
+                    self.assertEqual(len(f.get_rows("Sheet1")), 100)
+                    f.set_cell_value("Sheet2", f"A{worker * 5 + i // 10 + 1}", i)
+
+        self.assertEqual(f.new_sheet("Sheet2"), 1)
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(read, range(8)))
+        self.assertEqual(len(f.get_rows("Sheet2")), 40)
+
+        def close_or_read(worker):
+            barrier.wait()
+            if worker == 0:
+                return f.close()
+            try:
+                f.get_cell_value("Sheet1", "A1")
+            except RuntimeError as err:
+                self.assertEqual(str(err), "can not find file pointer")
+
+        with ThreadPoolExecutor(8) as pool:
+            list(pool.map(close_or_read, range(8)))
+        with self.assertRaises(RuntimeError) as context:
+            f.get_cell_value("Sheet1", "A1")
+        self.assertEqual(str(context.exception), "can not find file pointer")
+
+    def test_handle_counts(self):
+        counts = excelize.get_handle_counts()
+        f1, f2 = excelize.new_file(), excelize.new_file()
+        self.assertEqual(excelize.get_handle_counts().files, counts.files + 2)
+        self.assertIsNone(f1.close())
+        self.assertEqual(excelize.get_handle_counts().files, counts.files + 1)
+        # The handle of the closed workbook will never be reused
+        f3 = excelize.new_file()
+        self.assertGreater(f3.file_index, f2.file_index)
+        with self.assertRaises(RuntimeError) as context:
+            f1.get_cell_value("Sheet1", "A1")
+        self.assertEqual(str(context.exception), "can not find file pointer")
+
+        sw = f2.new_stream_writer("Sheet1")
+        self.assertEqual(
+            excelize.get_handle_counts().stream_writers, counts.stream_writers + 1
+        )
+        self.assertIsNone(sw.set_row("A1", ["Hello"]))
+        self.assertIsNone(sw.flush())
+        self.assertEqual(
+            excelize.get_handle_counts().stream_writers, counts.stream_writers
+        )
+        with self.assertRaises(RuntimeError) as context:
+            sw.flush()
+        self.assertEqual(str(context.exception), "can not find stream writer pointer")
+
+        rows = f2.rows("Sheet1")
+        self.assertEqual(next(rows), ["Hello"])
+        self.assertEqual(excelize.get_handle_counts().rows, counts.rows + 1)
+        self.assertEqual(list(rows), [])
+        self.assertEqual(excelize.get_handle_counts().rows, counts.rows)
+
+        # The iterators and the stream writers are released with the workbook
+        rows, cols = f2.rows("Sheet1"), f2.cols("Sheet1")
+        self.assertEqual(next(rows), ["Hello"])
+        self.assertEqual(next(cols), ["Hello"])
+        self.assertEqual(f2.new_sheet("Sheet2"), 1)
+        sw = f2.new_stream_writer("Sheet2")
+        self.assertIsNone(f2.close())
+        handles = excelize.get_handle_counts()
+        self.assertEqual(
+            (handles.rows, handles.cols, handles.stream_writers),
+            (counts.rows, counts.cols, counts.stream_writers),
+        )
+        with self.assertRaises(RuntimeError) as context:
+            next(rows)
+        self.assertEqual(str(context.exception), "can not find rows iterator pointer")
+        with self.assertRaises(RuntimeError) as context:
+            next(cols)
+        self.assertEqual(
+            str(context.exception), "can not find columns iterator pointer"
+        )
+        with self.assertRaises(RuntimeError) as context:
+            sw.set_row("A1", ["Hello"])
+        self.assertEqual(str(context.exception), "can not find stream writer pointer")
+        self.assertIsNone(f3.close())
+        self.assertEqual(excelize.get_handle_counts(), counts)
+
+    @unittest.skipIf(resource is None, "resource module is not available")
+    def test_memory_leak(self):
+        def max_rss():
+            # The maximum resident set size is in bytes on macOS, KiB otherwise
+            rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+            return rss if sys.platform == "darwin" else rss * 1024
+
+        def get_error():
+            with self.assertRaises(RuntimeError):
+                f.get_cell_value("SheetN", "A1")
+
+        calls = 1000000
+        f = excelize.new_file()
+        operations = [
+            lambda i: f.set_cell_value("Sheet1", "A1", i),
+            lambda i: f.get_cell_value("Sheet1", "A1"),
+            lambda i: get_error(),
+        ]
+        for operation in operations:
+            # Warm up the allocators of the library and the interpreter, then
+            # take the baseline of the memory usage
+            for i in range(calls // 10):
+                operation(i)
+            baseline = max_rss()
+            for i in range(calls):
+                operation(i)
+            # Leaking the smallest allocation of the C heap, which is at least
+            # 16 bytes, on each call would grow the memory by 16 bytes per call
+            # over the baseline
+            self.assertLess(max_rss() - baseline, calls * 8)
+        self.assertIsNone(f.close())
+
     def test_type_convert(self):
         class _T2(Structure):
             _fields_ = [
@@ -1583,3 +2465,11 @@ class TestExcelize(unittest.TestCase):
         self.assertEqual(
             excelize.c_value_to_py(excelize.py_value_to_c(t1, _T1()), T1()), t1
         )
+        # The converters are compiled once for each pair of the types
+        to_c = excelize.py_to_c_converters[(T1, _T1)]
+        to_py = excelize.c_to_py_converters[(_T1, T1)]
+        self.assertEqual(
+            excelize.c_value_to_py(excelize.py_value_to_c(t1, _T1()), T1()), t1
+        )
+        self.assertIs(excelize.py_to_c_converters[(T1, _T1)], to_c)
+        self.assertIs(excelize.c_to_py_converters[(_T1, T1)], to_py)
@@ -14,15 +14,73 @@
 #include <stdlib.h>
 #include <time.h>
 
+// Writer is the callback function for writing a chunk of the given length to
+// the Python writable object, returns the number of bytes written or -1 if an
+// error occurred.
+typedef int (*Writer)(unsigned char *p, int n);
+
+// Reader is the callback function for reading up to the given length of bytes
+// from the Python readable object into the buffer, returns the number of bytes
+// read, 0 at the end of the stream, or -1 if an error occurred.
+typedef int (*Reader)(unsigned char *p, int n);
+
 struct Interface
 {
     int Type;
-    int Integer;
+    long long Integer;
     char *String;
     double Float64;
     bool Boolean;
 };
 
+// Column directly maps the values of a column for writing data by columns, the
+// Type specifies which one of the arrays holds the values. The Null is an
+// optional mask, a non-zero element marks the cell as empty. The Validity is an
+// optional bitmap in the Arrow columnar format, a zero bit marks the cell as
+// empty. The strings are held in the String array, or in the Data by the
+// Offsets in the Arrow columnar format. The Offset is the index of the first
+// row in the arrays, and the StyleID is the optional style of the cells.
+struct Column
+{
+    int Type;
+    long long *Int64;
+    double *Float64;
+    char **String;
+    bool *Boolean;
+    unsigned char *Null;
+    unsigned char *Validity;
+    int *Offsets;
+    char *Data;
+    int Offset;
+    int StyleID;
+};
+
+// CellValue directly maps the value and the optional style of a cell for
+// setting cells in bulk, a zero StyleID keeps the style of the cell.
+struct CellValue
+{
+    char *Cell;
+    struct Interface Value;
+    int StyleID;
+};
+
+// ColumnBuffer directly maps the values of a column in the layout of the Arrow
+// columnar format. The Validity is the validity bitmap, the Float64 holds the
+// values of the float column, the 64-bit Offsets and the Data hold the values
+// of the string column.
+struct ColumnBuffer
+{
+    char *Name;
+    int Type;
+    int Length;
+    int NullCount;
+    unsigned char *Validity;
+    double *Float64;
+    long long *Offsets;
+    long long DataSize;
+    char *Data;
+};
+
 // Options define the options for opening and reading the spreadsheet.
 //
 // MaxCalcIterations specifies the maximum iterations for iterative
@@ -761,19 +819,41 @@ struct GetAppPropsResult
     char *err;
 };
 
-struct Row
+// StringMatrix directly maps a two-dimensional array of strings in a single
+// buffer. The RowLens holds the number of cells in each row, and the UTF-8
+// encoded values of all cells are stored row by row in the Data, the value of
+// the cell at index i of the flattened array is in the range from Offsets[i]
+// to Offsets[i+1] of the Data.
+struct StringMatrix
 {
-    int CellLen;
-    char **Cell;
+    int RowsLen;
+    int *RowLens;
+    int CellsLen;
+    long long *Offsets;
+    long long DataSize;
+    char *Data;
 };
 
 struct GetRowsResult
 {
-    int RowLen;
-    struct Row *Row;
+    struct StringMatrix Rows;
     char *err;
 };
 
+struct SheetRows
+{
+    char *Sheet;
+    struct StringMatrix Rows;
+    char *Err;
+};
+
+struct GetAllRowsResult
+{
+    int SheetsLen;
+    struct SheetRows *Sheets;
+    char *Err;
+};
+
 struct GetCellRichTextResult
 {
     int RunsLen;
@@ -781,6 +861,54 @@ struct GetCellRichTextResult
     char *Err;
 };
 
+struct GetCellValuesResult
+{
+    int ValuesLen;
+    struct Interface *Values;
+    int Cols;
+    char *Err;
+};
+
+struct CalcCellValuesResult
+{
+    int ValuesLen;
+    char **Values;
+    int ErrorsLen;
+    char **Errors;
+    int Cols;
+    char *Err;
+};
+
+struct GetTypedRowsResult
+{
+    int RowsLen;
+    int *RowLens;
+    int ValuesLen;
+    struct Interface *Values;
+    char *Err;
+};
+
+// GetDictRowsResult holds the dictionary encoded rows of a worksheet. The
+// distinct cell values are stored once in the single row of the Dict, and the
+// Indices holds the index of the value of each cell in the Dict row by row,
+// with the number of cells in each row in the RowLens.
+struct GetDictRowsResult
+{
+    struct StringMatrix Dict;
+    int RowsLen;
+    int *RowLens;
+    int CellsLen;
+    int *Indices;
+    char *Err;
+};
+
+struct GetColumnBuffersResult
+{
+    int ColumnsLen;
+    struct ColumnBuffer *Columns;
+    char *Err;
+};
+
 struct GetStyleResult
 {
     struct Style style;
@@ -799,3 +927,13 @@ struct GetWorkbookPropsResult
     struct WorkbookPropsOptions opts;
     char *err;
 };
+
+// HandleCounts directly maps the number of live handles of the opened
+// workbooks, stream writers, rows and columns iterators.
+struct HandleCounts
+{
+    int Files;
+    int StreamWriters;
+    int Rows;
+    int Cols;
+};
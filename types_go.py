@@ -17,23 +17,67 @@ from ctypes import (
     c_double,
     c_int,
     c_long,
+    c_longlong,
     c_ubyte,
     c_uint,
+    c_void_p,
+    CFUNCTYPE,
     Structure,
     POINTER,
 )
 
+_Writer = CFUNCTYPE(c_int, c_void_p, c_int)
+_Reader = CFUNCTYPE(c_int, c_void_p, c_int)
+
 
 class _Interface(Structure):
     _fields_ = [
         ("Type", c_int),
-        ("Integer", c_int),
+        ("Integer", c_longlong),
         ("String", c_char_p),
         ("Float64", c_double),
         ("Boolean", c_bool),
     ]
 
 
+class _Column(Structure):
+    _fields_ = [
+        ("Type", c_int),
+        ("Int64", POINTER(c_longlong)),
+        ("Float64", POINTER(c_double)),
+        ("String", POINTER(c_char_p)),
+        ("Boolean", POINTER(c_bool)),
+        ("Null", POINTER(c_ubyte)),
+        ("Validity", POINTER(c_ubyte)),
+        ("Offsets", POINTER(c_int)),
+        ("Data", POINTER(c_char)),
+        ("Offset", c_int),
+        ("StyleID", c_int),
+    ]
+
+
+class _CellValue(Structure):
+    _fields_ = [
+        ("Cell", c_char_p),
+        ("Value", _Interface),
+        ("StyleID", c_int),
+    ]
+
+
+class _ColumnBuffer(Structure):
+    _fields_ = [
+        ("Name", c_char_p),
+        ("Type", c_int),
+        ("Length", c_int),
+        ("NullCount", c_int),
+        ("Validity", c_void_p),
+        ("Float64", c_void_p),
+        ("Offsets", c_void_p),
+        ("DataSize", c_longlong),
+        ("Data", c_void_p),
+    ]
+
+
 class _Options(Structure):
     _fields_ = [
         ("MaxCalcIterations", c_uint),
@@ -741,21 +785,40 @@ class _GetCellHyperLinkResult(Structure):
     ]
 
 
-class _Row(Structure):
+class _StringMatrix(Structure):
     _fields_ = [
-        ("CellLen", c_int),
-        ("Cell", POINTER(POINTER(c_char))),
+        ("RowsLen", c_int),
+        ("RowLens", POINTER(c_int)),
+        ("CellsLen", c_int),
+        ("Offsets", c_void_p),
+        ("DataSize", c_longlong),
+        ("Data", c_void_p),
     ]
 
 
 class _GetRowsResult(Structure):
     _fields_ = [
-        ("RowLen", c_int),
-        ("Row", POINTER(_Row)),
+        ("Rows", _StringMatrix),
         ("err", c_char_p),
     ]
 
 
+class _SheetRows(Structure):
+    _fields_ = [
+        ("Sheet", c_char_p),
+        ("Rows", _StringMatrix),
+        ("Err", c_char_p),
+    ]
+
+
+class _GetAllRowsResult(Structure):
+    _fields_ = [
+        ("SheetsLen", c_int),
+        ("Sheets", POINTER(_SheetRows)),
+        ("Err", c_char_p),
+    ]
+
+
 class _GetCellRichTextResult(Structure):
     _fields_ = [
         ("RunsLen", c_int),
@@ -764,6 +827,55 @@ class _GetCellRichTextResult(Structure):
     ]
 
 
+class _GetCellValuesResult(Structure):
+    _fields_ = [
+        ("ValuesLen", c_int),
+        ("Values", POINTER(_Interface)),
+        ("Cols", c_int),
+        ("Err", c_char_p),
+    ]
+
+
+class _CalcCellValuesResult(Structure):
+    _fields_ = [
+        ("ValuesLen", c_int),
+        ("Values", POINTER(c_char_p)),
+        ("ErrorsLen", c_int),
+        ("Errors", POINTER(c_char_p)),
+        ("Cols", c_int),
+        ("Err", c_char_p),
+    ]
+
+
+class _GetTypedRowsResult(Structure):
+    _fields_ = [
+        ("RowsLen", c_int),
+        ("RowLens", POINTER(c_int)),
+        ("ValuesLen", c_int),
+        ("Values", POINTER(_Interface)),
+        ("Err", c_char_p),
+    ]
+
+
+class _GetDictRowsResult(Structure):
+    _fields_ = [
+        ("Dict", _StringMatrix),
+        ("RowsLen", c_int),
+        ("RowLens", POINTER(c_int)),
+        ("CellsLen", c_int),
+        ("Indices", c_void_p),
+        ("Err", c_char_p),
+    ]
+
+
+class _GetColumnBuffersResult(Structure):
+    _fields_ = [
+        ("ColumnsLen", c_int),
+        ("Columns", POINTER(_ColumnBuffer)),
+        ("Err", c_char_p),
+    ]
+
+
 class _GetStyleResult(Structure):
     _fields_ = [
         ("style", _Style),
@@ -784,3 +896,12 @@ class _GetWorkbookPropsResult(Structure):
         ("opts", _WorkbookPropsOptions),
         ("err", c_char_p),
     ]
+
+
+class _HandleCounts(Structure):
+    _fields_ = [
+        ("Files", c_int),
+        ("StreamWriters", c_int),
+        ("Rows", c_int),
+        ("Cols", c_int),
+    ]
@@ -12,7 +12,7 @@ amounts of data. This library needs Python version 3.9 or later.
 
 from dataclasses import dataclass
 from enum import IntEnum
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 
 class CultureName(IntEnum):
@@ -331,16 +331,6 @@ class Style:
     neg_red: bool = False
 
 
-@dataclass
-class Row:
-    cell: Optional[List[str]] = None
-
-
-@dataclass
-class GetRowsResult:
-    row: Optional[List[Row]] = None
-
-
 @dataclass
 class GraphicOptions:
     alt_text: str = ""
@@ -796,3 +786,18 @@ class WorkbookProtectionOptions:
 class StringArrayErrorResult:
     arr: Optional[List[str]] = None
     err: str = ""
+
+
+@dataclass
+class HandleCounts:
+    files: int = 0
+    stream_writers: int = 0
+    rows: int = 0
+    cols: int = 0
+
+
+@dataclass
+class WorkbookJob:
+    template: Optional[str] = None
+    cells: Optional[Dict[str, object]] = None
+    output: Optional[str] = None